@@ -0,0 +1,97 @@
+"""
+로컬 성능 측정 스크립트 모음
+
+    python -m benchmarks.<script> --help
+
+각 스크립트는 DJANGO_SETTINGS_MODULE(기본값 config.settings)의 DB 설정으로
+테스트 DB를 새로 만들어 측정한 뒤 삭제함
+"""
+import os, math, time, asyncio, contextlib
+
+from typing import Dict, List
+
+
+def setup_django() -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    
+    import django
+    django.setup()
+
+
+@contextlib.contextmanager
+def test_database():
+    from django.db         import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index   = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(samples: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    samples: 요청별 소요시간(초), elapsed: 전체 측정시간(초)
+    """
+    return {
+        'requests': len(samples),
+        'rps'     : round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        'mean_ms' : round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+        'p50_ms'  : round(percentile(samples, 50) * 1000, 3),
+        'p95_ms'  : round(percentile(samples, 95) * 1000, 3),
+        'p99_ms'  : round(percentile(samples, 99) * 1000, 3),
+        'max_ms'  : round(max(samples) * 1000, 3) if samples else 0.0,
+    }
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result  = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+class StubResponse:
+    
+    status_code = 200
+    
+    def __init__(self, token):
+        kakao_id  = int(token.rsplit('-', 1)[-1])
+        self.data = {
+            'id': kakao_id,
+            'kakao_account': {
+                'email'  : f'bench-{kakao_id}@example.com',
+                'profile': {'nickname': f'bench-{kakao_id}'},
+            },
+        }
+    
+    def json(self):
+        return self.data
+
+
+class StubKakaoClient:
+    
+    def __init__(self, latency):
+        self.latency = latency
+    
+    def get(self, path, headers=None):
+        time.sleep(self.latency)
+        return StubResponse(headers['Authorization'])
+
+
+class AsyncStubKakaoClient(StubKakaoClient):
+    
+    async def get(self, path, headers=None):
+        await asyncio.sleep(self.latency)
+        return StubResponse(headers['Authorization'])
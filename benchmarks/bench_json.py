@@ -0,0 +1,80 @@
+"""
+DRF JSON 렌더러/파서(표준 json) 대비 FastJSONRenderer/FastJSONParser(orjson) 처리 시간 비교
+    
+    python -m benchmarks.bench_json --number 20000
+
+- 로그인(토큰 발급), 토큰 갱신, 오류(한글 detail) 응답 렌더링과 로그아웃/토큰 갱신 요청 본문 파싱
+- 요청 1건당 평균 소요시간(us)과 속도 비율, 두 결과가 같은지(identical) 출력
+"""
+import io, json, timeit, argparse
+
+from benchmarks import setup_django
+
+
+def payloads():
+    from rest_framework.exceptions import ErrorDetail
+    from rest_framework_simplejwt.tokens import RefreshToken
+    
+    token = RefreshToken()
+    token['user_id'] = 1
+    return {
+        'signin' : {'refresh': str(token), 'access': str(token.access_token)},
+        'refresh': {'access': str(token.access_token)},
+        'error'  : {'detail': ErrorDetail('유효하지 않거나 만료된 토큰입니다.', code='token_not_valid'), 'code': 'token_not_valid'},
+    }
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 10 ** 6
+
+
+def compare(slow, fast, number):
+    slow_us, fast_us = bench(slow, number), bench(fast, number)
+    return {
+        'drf_us'   : round(slow_us, 2),
+        'fast_us'  : round(fast_us, 2),
+        'speedup'  : round(slow_us / fast_us, 2),
+        'identical': slow() == fast(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=20000, help='측정 1회당 반복 횟수')
+    args = parser.parse_args()
+    
+    setup_django()
+    
+    from rest_framework.parsers   import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from core.parsers             import FastJSONParser
+    from core.renderers           import FastJSONRenderer, orjson
+    
+    drf_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+    drf_parser, fast_parser     = JSONParser(), FastJSONParser()
+    
+    result = {'orjson': getattr(orjson, '__version__', None), 'render': {}, 'parse': {}}
+    
+    for name, data in payloads().items():
+        result['render'][name] = compare(
+            lambda: drf_renderer.render(data),
+            lambda: fast_renderer.render(data),
+            args.number,
+        )
+    
+    bodies = {
+        'signout': json.dumps({'refresh_token': payloads()['signin']['refresh']}).encode(),
+        'refresh': json.dumps({'refresh': payloads()['signin']['refresh']}).encode(),
+    }
+    for name, body in bodies.items():
+        result['parse'][name] = compare(
+            lambda: drf_parser.parse(io.BytesIO(body)),
+            lambda: fast_parser.parse(io.BytesIO(body)),
+            args.number,
+        )
+    
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
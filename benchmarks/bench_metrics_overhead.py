@@ -0,0 +1,72 @@
+"""
+요청당 지표 집계(core.utils.metrics) 비용 측정
+
+    python -m benchmarks.bench_metrics_overhead --iterations 200000
+
+- 미들웨어가 요청마다 호출하는 observe_request(응답시간 히스토그램 + alias별 쿼리 수)와
+  카카오 API 호출마다 호출하는 observe_kakao의 호출당 소요시간(us)을 측정
+- 단일 프로세스(메모리) 모드와 멀티 프로세스(PROMETHEUS_MULTIPROC_DIR, mmap 파일) 모드를 각각 측정
+  > 지표 저장 방식은 prometheus_client import 시점에 정해지므로 모드마다 별도 프로세스로 실행
+- DB가 필요하지 않음
+"""
+import os, sys, json, time, argparse, tempfile, subprocess
+
+
+def measure(iterations):
+    from core.utils import metrics
+
+    aliases = {'default': 4}
+    started = time.perf_counter()
+    for i in range(iterations):
+        metrics.observe_request('api/users/kakao-signin', 'GET', 200, 0.012, aliases)
+    request_us = (time.perf_counter() - started) / iterations * 1e6
+
+    started = time.perf_counter()
+    for i in range(iterations):
+        metrics.observe_kakao('sync', 0.08, False)
+    kakao_us = (time.perf_counter() - started) / iterations * 1e6
+
+    started = time.perf_counter()
+    body, _ = metrics.render()
+    render_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        'observe_request_us': round(request_us, 3),
+        'observe_kakao_us'  : round(kakao_us, 3),
+        'render_ms'         : round(render_ms, 3),
+        'render_bytes'      : len(body),
+    }
+
+
+def run_mode(mode, iterations):
+    env = dict(os.environ)
+    env.pop('PROMETHEUS_MULTIPROC_DIR', None)
+
+    with tempfile.TemporaryDirectory() as path:
+        if mode == 'multiprocess':
+            env['PROMETHEUS_MULTIPROC_DIR'] = path
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_metrics_overhead', '--iterations', str(iterations), '--child'],
+            env            = env,
+            check          = True,
+            capture_output = True,
+            text           = True,
+        ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200000)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.iterations)))
+        return
+
+    print(json.dumps({mode: run_mode(mode, args.iterations) for mode in ('single', 'multiprocess')}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
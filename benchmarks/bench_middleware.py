@@ -0,0 +1,85 @@
+"""
+/api/ 요청의 미들웨어 처리 비용 비교(RouteScopedMiddleware 적용 전/후)
+    
+    python -m benchmarks.bench_middleware --number 5000
+
+- full  : 세션/인증/메시지/clickjacking 미들웨어를 MIDDLEWARE에 직접 나열(적용 전)
+- scoped: 현재 설정(MIDDLEWARE + ROUTE_SCOPED_MIDDLEWARE, /api/는 감싼 미들웨어를 거치지 않음)
+- DB를 사용하지 않는 요청(카카오 토큰 없는 로그인, 잘못된 토큰 갱신)의 요청 1건당 평균 CPU 시간(us) 출력
+  > 두 설정을 번갈아 측정하고 최솟값 사용
+"""
+import json, time, argparse
+
+from benchmarks import setup_django
+
+
+REQUESTS = {
+    'signin_400' : lambda factory: factory.get('/api/users/kakao-signin'),
+    'refresh_401': lambda factory: factory.post('/api/users/token-refresh', {'refresh': 'invalid'}, format='json'),
+}
+
+
+def unscoped(settings):
+    """
+    ROUTE_SCOPED_MIDDLEWARE의 미들웨어를 RouteScopedMiddleware 위치에 직접 나열한 MIDDLEWARE
+    """
+    middleware = list(settings.MIDDLEWARE)
+    index      = middleware.index('core.middleware.routing.RouteScopedMiddleware')
+    middleware[index:index + 1] = settings.ROUTE_SCOPED_MIDDLEWARE['MIDDLEWARE']
+    return middleware
+
+
+def handler(middleware):
+    from django.core.handlers.base import BaseHandler
+    from django.test               import override_settings
+    
+    with override_settings(MIDDLEWARE=middleware):
+        handler = BaseHandler()
+        handler.load_middleware()
+    return handler
+
+
+def measure(handler, build, number):
+    """
+    요청 객체 생성은 제외한 요청 1건당 평균 CPU 시간(us)
+    """
+    requests = [build() for _ in range(number)]
+    started  = time.process_time()
+    for request in requests:
+        handler.get_response(request)
+    return (time.process_time() - started) / number * 10 ** 6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=5000, help='측정 1회당 반복 횟수')
+    parser.add_argument('--repeat', type=int, default=7, help='측정 횟수(full/scoped 번갈아 측정, 최솟값 사용)')
+    args = parser.parse_args()
+    
+    setup_django()
+    
+    from django.conf import settings
+    
+    from rest_framework.test import APIRequestFactory
+    
+    factory  = APIRequestFactory()
+    handlers = {'full': handler(unscoped(settings)), 'scoped': handler(settings.MIDDLEWARE)}
+    result   = {}
+    
+    for name, request in REQUESTS.items():
+        samples = {label: [] for label in handlers}
+        for _ in range(args.repeat):
+            for label, current in handlers.items():
+                samples[label].append(measure(current, lambda: request(factory), args.number))
+        
+        full, scoped = min(samples['full']), min(samples['scoped'])
+        result[name] = {
+            'full_us'  : round(full, 2),
+            'scoped_us': round(scoped, 2),
+            'saved_us' : round(full - scoped, 2),
+        }
+    
+    print(json.dumps(result, indent=2))
+
+if __name__ == '__main__':
+    main()
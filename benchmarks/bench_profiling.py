@@ -0,0 +1,57 @@
+"""
+요청 프로파일링 미들웨어(RequestProfilingMiddleware) 비용 측정
+    
+    python -m benchmarks.bench_profiling --number 200000
+
+- untriggered_us: 프로파일링을 요청하지 않은 요청 1건당 미들웨어 추가 비용(헤더/쿼리 문자열 확인)
+- profiled_ms   : 서명된 헤더로 프로파일링한 /metrics 요청 1건의 소요시간(cProfile + 파일 저장 포함)
+- DB가 필요하지 않음, 프로파일은 임시 디렉터리에 저장 후 삭제
+"""
+import json, time, argparse, tempfile
+
+from benchmarks import setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=200000, help='측정 반복 횟수')
+    parser.add_argument('--profiled', type=int, default=20, help='프로파일링 요청 횟수')
+    args = parser.parse_args()
+    
+    setup_django()
+    
+    from django.test         import override_settings
+    from rest_framework.test import APIClient, APIRequestFactory
+    
+    from core.middleware.profiling import RequestProfilingMiddleware, sign_profile_token
+    
+    with tempfile.TemporaryDirectory() as directory, \
+         override_settings(REQUEST_PROFILING={'ENABLED': True, 'DIRECTORY': directory}):
+        middleware = RequestProfilingMiddleware(lambda request: None)
+        request    = APIRequestFactory().get('/api/users/kakao-signin', HTTP_AUTHORIZATION='kakao token')
+        
+        started = time.perf_counter()
+        for _ in range(args.number):
+            middleware.get_response(request)
+        baseline = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        for _ in range(args.number):
+            middleware(request)
+        untriggered = time.perf_counter() - started
+        
+        client  = APIClient(HTTP_X_PROFILE_TOKEN=sign_profile_token('bench'))
+        samples = []
+        for _ in range(args.profiled):
+            started = time.perf_counter()
+            client.get('/metrics')
+            samples.append(time.perf_counter() - started)
+    
+    print(json.dumps({
+        'untriggered_us': round((untriggered - baseline) / args.number * 10 ** 6, 3),
+        'profiled_ms'   : round(min(samples) * 1000, 3),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+OpenAPI 스키마 요청(/swagger.json, /swagger?format=openapi) 응답시간 비교
+
+    python -m benchmarks.bench_schema --requests 200
+
+- per_request: 기존 drf_yasg 뷰(cache_timeout=0), 요청마다 모든 뷰/serializer를 분석해 스키마 생성
+- lazy       : 스키마 파일 없이 최초 요청 시 생성 후 메모리에 보관(첫 요청 포함)
+- prebuilt   : build_schema로 미리 생성한 파일 사용
+- not_modified: If-None-Match 일치(304)
+- 스키마 생성에는 DB가 필요하지 않음
+"""
+import json, time, argparse, tempfile
+
+from unittest.mock import patch
+
+from benchmarks import setup_django, summarize
+
+
+def measure(view, factory, requests, **headers):
+    samples = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        request_started = time.perf_counter()
+        response        = view(factory.get('/swagger.json', **headers), format='.json')
+        if hasattr(response, 'render'):
+            response.render()
+        assert response.status_code in (200, 304), response.status_code
+        samples.append(time.perf_counter() - request_started)
+    return summarize(samples, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+    
+    setup_django()
+    
+    from django.test       import RequestFactory
+    from core.utils.schema import schema_artifacts, schema_view
+    from core.views        import schema_spec_view
+    
+    factory = RequestFactory()
+    result  = {'per_request': measure(schema_view.without_ui(cache_timeout=0), factory, args.requests)}
+    
+    with tempfile.TemporaryDirectory() as directory:
+        with patch.dict(schema_artifacts.config, {'DIRECTORY': directory}):
+            schema_artifacts.clear()
+            result['lazy'] = measure(schema_spec_view, factory, args.requests)
+            
+            schema_artifacts.build()
+            result['prebuilt'] = measure(schema_spec_view, factory, args.requests)
+            
+            etag = schema_spec_view(factory.get('/swagger.json'), format='.json')['ETag']
+            result['not_modified'] = measure(schema_spec_view, factory, args.requests, HTTP_IF_NONE_MATCH=etag)
+    
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
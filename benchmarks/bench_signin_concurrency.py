@@ -0,0 +1,120 @@
+"""
+동기(WSGI) / 비동기(ASGI) 카카오 로그인 동시성 비교
+
+    python -m benchmarks.bench_signin_concurrency --requests 400 --workers 8 --concurrency 400 --latency 0.2
+
+- 카카오 API는 --latency 초 만큼 대기 후 응답하는 스텁으로 대체
+- WSGI 경로: --workers 개의 동기 워커(스레드)가 KakaoSignInView를 처리
+- ASGI 경로: 하나의 이벤트 루프가 최대 --concurrency 개의 요청을 config.asgi.application으로 동시에 처리
+  > 배포와 같은 경로(ASGIHandler, MIDDLEWARE 전체, URL 라우팅, kakao_signin_async_view)
+  > URL이 비동기 로그인 뷰를 사용하도록 ASYNC_SIGNIN=True로 설정(config/asgi.py와 동일)
+"""
+import os, json, time, asyncio, argparse
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock      import patch
+
+from benchmarks import setup_django, test_database, summarize, StubKakaoClient, AsyncStubKakaoClient
+
+
+def run_wsgi(args):
+    from django.test               import RequestFactory
+    from django.db                 import connection
+    from users.views.social_signin import KakaoSignInView
+    
+    view    = KakaoSignInView.as_view()
+    factory = RequestFactory()
+    
+    def call(i):
+        started  = time.perf_counter()
+        response = view(factory.get('/api/users/kakao-signin', HTTP_AUTHORIZATION=f'bench-{i % args.users}'))
+        connection.close()
+        assert response.status_code in (200, 201), response.status_code
+        return time.perf_counter() - started
+    
+    with patch('core.utils.get_obj_n_check_err.kakao_client', StubKakaoClient(args.latency)):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            samples = list(executor.map(call, range(args.requests)))
+        return summarize(samples, time.perf_counter() - started)
+
+
+async def asgi_get(application, path: str, headers: dict) -> int:
+    """
+    ASGI 서버(uvicorn 등) 대신 application을 직접 호출, 응답 상태코드 반환
+    """
+    scope = {
+        'type'        : 'http',
+        'asgi'        : {'version': '3.0'},
+        'http_version': '1.1',
+        'method'      : 'GET',
+        'scheme'      : 'http',
+        'path'        : path,
+        'raw_path'    : path.encode(),
+        'query_string': b'',
+        'headers'     : [(b'host', b'testserver')] + [(name.encode(), value.encode()) for name, value in headers.items()],
+        'client'      : ('127.0.0.1', 50000),
+        'server'      : ('testserver', 80),
+    }
+    messages = []
+    
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    await application(scope, receive, send)
+    return messages[0]['status']
+
+
+def run_asgi(args):
+    from config.asgi import application
+    
+    async def call(i, semaphore):
+        async with semaphore:
+            started = time.perf_counter()
+            status  = await asgi_get(application, '/api/users/kakao-signin', {'authorization': f'bench-{i % args.users}'})
+            assert status in (200, 201), status
+            return time.perf_counter() - started
+    
+    async def main():
+        semaphore = asyncio.Semaphore(args.concurrency)
+        started   = time.perf_counter()
+        samples   = await asyncio.gather(*(call(i, semaphore) for i in range(args.requests)))
+        return summarize(list(samples), time.perf_counter() - started)
+    
+    with patch('core.utils.get_obj_n_check_err.async_kakao_client', AsyncStubKakaoClient(args.latency)):
+        return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=8, help='WSGI 동기 워커(스레드) 수')
+    parser.add_argument('--concurrency', type=int, default=400, help='ASGI 동시 처리 요청 수')
+    parser.add_argument('--latency', type=float, default=0.2, help='카카오 API 스텁 응답 지연(초)')
+    args = parser.parse_args()
+    
+    os.environ.setdefault('ASYNC_SIGNIN', 'True')
+    setup_django()
+    
+    with test_database():
+        from users.models import User
+        
+        User.objects.bulk_create([
+            User(kakao_id=i, email=f'bench-{i}@example.com', nickname=f'bench-{i}')
+            for i in range(args.users)
+        ])
+        
+        result = {
+            'wsgi': run_wsgi(args),
+            'asgi': run_asgi(args),
+        }
+    
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+로그인 1건당 토큰 발급 비용 비교
+    
+    python -m benchmarks.bench_token_minting --number 5000
+
+- before: VersionedRefreshToken.for_user() + str(token)/str(token.access_token) + KakaoSignInSerializer 검증
+- after : token_minter.mint()
+- 발급 기록(OutstandingToken) 저장은 두 경우 모두 쓰기 대기열에 넣기만 하도록 제외(write_behind 비활성 시 커밋 후 저장)
+- 1건당 평균 소요시간(us)과 속도 비율 출력
+"""
+import json, timeit, argparse
+
+from unittest.mock import patch
+
+from benchmarks import setup_django
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 10 ** 6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=5000, help='측정 1회당 반복 횟수')
+    args = parser.parse_args()
+    
+    setup_django()
+    
+    from users.models              import User
+    from users.serializers         import KakaoSignInSerializer
+    from users.tokens              import VersionedRefreshToken
+    from users.utils.token_minting import token_minter
+    
+    user = User(id=1, kakao_id=1, email='bench@example.com', nickname='bench', token_version=1)
+    
+    def before():
+        token      = VersionedRefreshToken.for_user(user)
+        serializer = KakaoSignInSerializer(data={'refresh': str(token), 'access': str(token.access_token)})
+        serializer.is_valid()
+        return serializer.data
+    
+    def after():
+        return token_minter.mint(user)
+    
+    with patch('users.tokens.write_behind'), patch('users.utils.token_minting.write_behind'):
+        before_us, after_us = bench(before, args.number), bench(after, args.number)
+    
+    print(json.dumps({
+        'before_us': round(before_us, 2),
+        'after_us' : round(after_us, 2),
+        'speedup'  : round(before_us / after_us, 2),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+유저 수 증가에 따른 로그인 upsert(User.objects.get_or_create(kakao_id=...)) 지연시간 측정
+
+    python -m benchmarks.bench_user_lookup --sizes 10000,100000,1000000,10000000 --samples 2000
+
+- 유저 테이블을 --sizes 단계별로 채우면서 기존 유저 로그인 / 첫 로그인 upsert 지연시간을 측정
+- kakao_id 유니크 인덱스를 사용하면 유저 수와 관계없이 지연시간이 일정해야 함
+"""
+import json, random, argparse
+
+from benchmarks import setup_django, test_database, summarize, timed
+
+
+def fill_users(User, start, stop, batch_size=10000):
+    for offset in range(start, stop, batch_size):
+        User.objects.bulk_create([
+            User(kakao_id=i, email=f'bench-{i}@example.com', nickname=f'bench-{i}')
+            for i in range(offset, min(offset + batch_size, stop))
+        ])
+
+
+def measure(User, size, samples):
+    existing = []
+    for kakao_id in random.sample(range(size), min(samples, size)):
+        _, elapsed = timed(
+            User.objects.get_or_create,
+            kakao_id = kakao_id,
+            defaults = {'email': f'bench-{kakao_id}@example.com', 'nickname': 'bench'},
+        )
+        existing.append(elapsed)
+    
+    created = []
+    for kakao_id in range(-1, -samples - 1, -1):
+        _, elapsed = timed(
+            User.objects.get_or_create,
+            kakao_id = kakao_id,
+            defaults = {'email': f'first-login{kakao_id}@example.com', 'nickname': 'bench'},
+        )
+        created.append(elapsed)
+    User.objects.filter(kakao_id__lt=0).delete()
+    
+    return {
+        'existing_user': summarize(existing, sum(existing)),
+        'first_login'  : summarize(created, sum(created)),
+        'plan'         : User.objects.filter(kakao_id=size // 2).explain(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000,10000000')
+    parser.add_argument('--samples', type=int, default=2000)
+    args = parser.parse_args()
+    
+    setup_django()
+    
+    with test_database():
+        from users.models import User
+        
+        result, filled = {}, 0
+        for size in sorted(int(size) for size in args.sizes.split(',')):
+            fill_users(User, filled, size)
+            filled       = size
+            result[size] = measure(User, size, args.samples)
+            print(json.dumps({size: result[size]}), flush=True)
+    
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
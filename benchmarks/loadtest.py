@@ -0,0 +1,264 @@
+"""
+users API 부하 테스트(로그인 / 토큰 갱신 / 로그아웃)
+
+    python -m benchmarks.loadtest --requests 500 --concurrency 8 --save benchmarks/baselines/local.json
+    python -m benchmarks.loadtest --requests 500 --concurrency 8 --compare benchmarks/baselines/local.json --threshold 0.1
+
+- 요청은 URL 라우팅과 전체 미들웨어를 거쳐 처리(django.test.Client), 카카오 API는 --latency 초 지연 스텁으로 대체
+  > --fake-kakao: 스텁 대신 대체 서버(core.utils.fake_kakao)를 실행하고 실제 HTTP 클라이언트(커넥션 풀, 타임아웃, 재시도, circuit breaker)로 호출
+  > 유저정보 캐시로 반복 토큰은 카카오 API를 호출하지 않으므로, 카카오 API 영향만 보려면 KAKAO_PROFILE_CACHE_BACKEND= 로 실행
+- 시나리오별 p50/p95/p99 응답시간, 초당 요청 수(rps), 요청당 DB 쿼리 수(Server-Timing 헤더)를 측정
+  > signin : 기존 유저(--users 명) 카카오 로그인
+  > refresh: 로그인한 유저의 refresh 토큰으로 access 토큰 갱신
+  > signout: 요청마다 새로 로그인한 유저의 로그아웃(로그인은 측정에서 제외)
+- --write-behind: 쓰기 대기열(core.db.write_behind)을 켜고 측정, 끄고 측정한 결과와 비교
+  > --db-latency: 쿼리마다 지연(초)을 추가해 원격 DB의 왕복/커밋 시간을 재현(sqlite 테스트 DB는 쓰기 비용이 거의 없음)
+- --save: 결과를 JSON 기준값(baseline)으로 저장
+- --compare: 기준값 대비 --threshold 비율 이상 나빠진 지표가 있으면 목록을 출력하고 exit code 1로 종료
+  > 응답시간(p50/p95/p99), 요청당 쿼리 수는 증가, rps는 감소를 회귀로 판단
+"""
+import re, sys, json, time, argparse, threading
+
+from contextlib         import ExitStack
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib            import Path
+from unittest.mock      import patch
+
+from benchmarks import setup_django, test_database, summarize, StubKakaoClient
+
+
+SCENARIOS = ('signin', 'refresh', 'signout')
+
+"""
+지표별 회귀 방향: 1 = 값이 커지면 회귀, -1 = 값이 작아지면 회귀
+"""
+COMPARED = {
+    'p50_ms'             : 1,
+    'p95_ms'             : 1,
+    'p99_ms'             : 1,
+    'rps'                : -1,
+    'queries_per_request': 1,
+}
+
+SIGNOUT_KAKAO_ID_OFFSET = 10 ** 9
+
+
+class LoadRunner:
+    
+    def __init__(self, concurrency):
+        self.concurrency = concurrency
+        self.local       = threading.local()
+        self.connections = []
+    
+    @property
+    def client(self):
+        """
+        스레드마다 클라이언트 생성, 측정이 끝난 뒤 닫을 수 있도록 스레드의 DB 커넥션을 기록
+        """
+        from django.db   import connections
+        from django.test import Client
+        
+        if not hasattr(self.local, 'client'):
+            self.local.client = Client(raise_request_exception=False)
+            for conn in connections.all():
+                conn.inc_thread_sharing()
+                self.connections.append(conn)
+        return self.local.client
+    
+    def signin(self, kakao_id):
+        return self.client.get('/api/users/kakao-signin', HTTP_AUTHORIZATION=f'bench-{kakao_id}')
+    
+    def tokens(self, kakao_ids):
+        return [self.signin(kakao_id).json() for kakao_id in kakao_ids]
+    
+    def run(self, call, payloads):
+        samples, queries, statuses = [], [], {}
+        lock = threading.Lock()
+        
+        def timed_call(payload):
+            started  = time.perf_counter()
+            response = call(payload)
+            elapsed  = time.perf_counter() - started
+            match    = re.search(r'"(\d+) queries"', response.get('Server-Timing', ''))
+            with lock:
+                samples.append(elapsed)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if match:
+                    queries.append(int(match.group(1)))
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(timed_call, payloads))
+        
+        return {
+            **summarize(samples, time.perf_counter() - started),
+            'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+            'statuses'           : {str(code): count for code, count in sorted(statuses.items())},
+        }
+    
+    def scenario_signin(self, args):
+        return self.run(self.signin, [i % args.users for i in range(args.requests)])
+    
+    def scenario_refresh(self, args):
+        refresh = [token['refresh'] for token in self.tokens(range(args.users))]
+        
+        def call(token):
+            return self.client.post('/api/users/token-refresh', {'refresh': token}, content_type='application/json')
+        
+        return self.run(call, [refresh[i % args.users] for i in range(args.requests)])
+    
+    def scenario_signout(self, args):
+        tokens = self.tokens(range(SIGNOUT_KAKAO_ID_OFFSET, SIGNOUT_KAKAO_ID_OFFSET + args.requests))
+        
+        def call(token):
+            return self.client.post(
+                '/api/users/signout',
+                {'refresh_token': token['refresh']},
+                content_type       = 'application/json',
+                HTTP_AUTHORIZATION = f"Bearer {token['access']}",
+            )
+        
+        return self.run(call, tokens)
+    
+    def close(self):
+        for conn in self.connections:
+            conn.close()
+            conn.dec_thread_sharing()
+
+
+def kakao_client(args, stack):
+    if not args.fake_kakao:
+        return StubKakaoClient(args.latency)
+    
+    from django.conf                import settings
+    from core.utils.circuit_breaker import CircuitBreaker, kakao_breaker
+    from core.utils.fake_kakao      import FakeKakaoServer
+    from core.utils.kakao_client    import KakaoClient
+    
+    """
+    부하 테스트는 단일 프로세스이므로 공유 캐시(REDIS_URL) 없이도 circuit breaker 사용
+    """
+    breaker = CircuitBreaker({**kakao_breaker.config, 'ENABLED': True})
+    server  = stack.enter_context(FakeKakaoServer({'LATENCY': args.fake_kakao, 'ERROR_RATE': args.kakao_error_rate, 'SEED': 0}).running())
+    stack.callback(breaker.reset)
+    return KakaoClient({**settings.KAKAO_API_CLIENT, 'BASE_URL': server.url}, breaker)
+
+
+def simulate_db_latency(latency, stack):
+    """
+    이후 생성되는 모든 DB 커넥션(요청 스레드, 쓰기 대기열 스레드)의 쿼리마다 latency 초 지연
+    """
+    from django.db                  import connections
+    from django.db.backends.signals import connection_created
+    
+    def delay(execute, sql, params, many, context):
+        time.sleep(latency)
+        return execute(sql, params, many, context)
+    
+    def install(sender, connection, **kwargs):
+        """
+        요청 중(execute_wrapper 사용 중)에 연결될 수 있으므로 목록 앞에 추가(execute_wrapper는 마지막 항목을 제거)
+        """
+        if delay not in connection.execute_wrappers:
+            connection.execute_wrappers.insert(0, delay)
+    
+    for connection in connections.all():
+        install(None, connection)
+    connection_created.connect(install, weak=False)
+    stack.callback(connection_created.disconnect, install)
+
+
+def enable_write_behind(stack):
+    from core.db.write_behind import write_behind
+    
+    stack.enter_context(patch.dict(write_behind.config, {'ENABLED': True}))
+    stack.callback(write_behind.close)
+
+
+def compare(baseline, result, threshold):
+    regressions = []
+    for scenario, current in result['results'].items():
+        previous = baseline['results'].get(scenario)
+        if not previous:
+            continue
+        for metric, direction in COMPARED.items():
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if change * direction > threshold:
+                regressions.append(f'{scenario}.{metric}: {before} -> {after} ({change:+.1%})')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--requests', type=int, default=500, help='시나리오별 요청 수')
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수(스레드)')
+    parser.add_argument('--latency', type=float, default=0.05, help='카카오 API 스텁 응답 지연(초)')
+    parser.add_argument('--fake-kakao', metavar='LATENCY', help='대체 서버 응답 지연 분포(예: lognormal:0.05,0.5)')
+    parser.add_argument('--kakao-error-rate', type=float, default=0.0, help='대체 서버 오류 응답 비율')
+    parser.add_argument('--write-behind', action='store_true', help='쓰기 대기열(core.db.write_behind) 사용')
+    parser.add_argument('--db-latency', type=float, default=0.0, help='쿼리마다 추가할 지연(초)')
+    parser.add_argument('--warmup', type=int, default=20, help='측정 전 로그인 요청 수(최초 import/URL 로딩 비용 제외)')
+    parser.add_argument('--save', help='결과를 저장할 JSON 기준값 경로')
+    parser.add_argument('--compare', help='비교할 JSON 기준값 경로')
+    parser.add_argument('--threshold', type=float, default=0.1, help='회귀로 판단할 변화 비율')
+    args = parser.parse_args()
+    
+    setup_django()
+    
+    meta = {
+        key: getattr(args, key)
+        for key in ('requests', 'users', 'concurrency', 'latency', 'fake_kakao', 'kakao_error_rate', 'write_behind', 'db_latency')
+    }
+    
+    with test_database():
+        from users.models import User
+        
+        User.objects.bulk_create([
+            User(kakao_id=i, email=f'bench-{i}@example.com', nickname=f'bench-{i}')
+            for i in range(args.users)
+        ])
+        
+        runner = LoadRunner(args.concurrency)
+        with ExitStack() as stack:
+            stack.enter_context(patch('core.utils.get_obj_n_check_err.kakao_client', kakao_client(args, stack)))
+            if args.db_latency:
+                simulate_db_latency(args.db_latency, stack)
+            if args.write_behind:
+                enable_write_behind(stack)
+            try:
+                for i in range(args.warmup):
+                    runner.signin(i % args.users)
+                
+                result = {
+                    'meta'   : meta,
+                    'results': {name: getattr(runner, f'scenario_{name}')(args) for name in args.scenarios.split(',')},
+                }
+            finally:
+                runner.close()
+    
+    print(json.dumps(result, indent=2))
+    
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.save).write_text(json.dumps(result, indent=2))
+    
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get('meta') != meta:
+            print(f"warning: baseline was recorded with {baseline.get('meta')}", file=sys.stderr)
+        
+        regressions = compare(baseline, result, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,5 +12,10 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ.setdefault('ASYNC_SIGNIN', 'True')
 
 application = get_asgi_application()
+
+from core.asgi import with_lifespan  # noqa: E402 (Django 설정 로딩 이후 import)
+
+application = with_lifespan(application)
@@ -0,0 +1,92 @@
+"""
+gunicorn 설정
+
+    gunicorn -c config/gunicorn.conf.py config.wsgi:application
+
+- preload_app: 마스터 프로세스에서 Django를 한 번만 import 한 뒤 워커를 fork
+  > 워커는 마스터의 메모리 페이지를 copy-on-write로 공유
+  > gc.freeze(): fork 전에 마스터의 객체를 GC 대상에서 제외, 워커의 GC가 공유 페이지를 수정(복사)하지 않도록 함
+    * preload 완료 후(when_ready) gc.collect()로 남은 순환 참조를 정리한 뒤 freeze, 워커 fork 직전(pre_fork)에도 freeze
+  > preload 중에는 GC를 중지하지 않음(on_starting 등 서버 훅은 preload 이후에 호출되므로 GC 중지 시점으로 사용할 수 없음)
+- 워커/스레드 수: 컨테이너 CPU 제한(cgroup cpu.max, cpuset)을 반영한 CPU 수 기준
+  > workers = CPU * 2 + 1, threads = 4(카카오 API/DB 대기 시간 동안 다른 요청 처리)
+  > GUNICORN_WORKERS, GUNICORN_THREADS 환경변수로 변경
+- 워커 시작 시 DB 커넥션 풀(POOL 사용 시), 카카오 API 커넥션 풀, 블랙리스트 인덱스, 스키마를 미리 준비(core.utils.warmup)
+- 워커 종료 시 쓰기 대기열(core.db.write_behind)에 남은 쓰기를 DB에 반영
+- 워커 시작 시 메모리(rss/pss/shared/private) 로깅, 실행 중에는 python -m core.utils.memory <마스터 pid>로 확인
+"""
+import os, gc, json, math
+
+
+def available_cpus() -> int:
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as file:
+            quota, period = file.read().split()
+        if quota != 'max':
+            count = min(count, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return count
+
+
+CPUS = available_cpus()
+
+bind         = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers      = int(os.environ.get('GUNICORN_WORKERS', CPUS * 2 + 1))
+threads      = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread' if threads > 1 else 'sync'
+preload_app  = True
+keepalive    = 5
+
+
+def when_ready(server):
+    """
+    preload 완료 후, 워커 fork 전(마스터)
+    preload 중 열린 DB 커넥션(풀 포함)을 워커가 공유하지 않도록 닫음
+    """
+    from django.db import connections
+
+    from core.db.pool      import close_pools
+    from core.utils.memory import memory_usage
+
+    connections.close_all()
+    close_pools()
+    gc.collect()
+    gc.freeze()
+    server.log.info('master %s ready, %s workers x %s threads, memory %s', os.getpid(), workers, threads, json.dumps(memory_usage()))
+
+
+def pre_fork(server, worker):
+    gc.freeze()
+
+
+def post_worker_init(worker):
+    from core.utils.memory import memory_usage
+    from core.utils.warmup import warm_up
+
+    report = warm_up()
+    worker.log.info('worker %s warmed up %s, memory %s', worker.pid, json.dumps(report), json.dumps(memory_usage()))
+
+
+def worker_exit(server, worker):
+    from core.db.write_behind import write_behind
+
+    pending = write_behind.pending
+    write_behind.close()
+    if pending:
+        server.log.info('worker %s flushed %s queued writes', worker.pid, pending)
+
+
+def child_exit(server, worker):
+    """
+    멀티 프로세스 지표(PROMETHEUS_MULTIPROC_DIR)에서 종료된 워커의 gauge 파일 정리
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
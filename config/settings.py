@@ -73,16 +73,33 @@ INSTALLED_APPS = [
 
 
 MIDDLEWARE = [
+    'core.middleware.profiling.RequestProfilingMiddleware',
+    'core.middleware.instrumentation.RequestInstrumentationMiddleware',
+    'core.middleware.replica.ReadYourWritesMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.routing.RouteScopedMiddleware',
     'django.middleware.common.CommonMiddleware',
     # 'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
 ]
 
+## ROUTE SCOPED MIDDLEWARE ##
+# core.middleware.routing.RouteScopedMiddleware
+# /api/, /metrics (JWT only, stateless) skip session/auth/messages/clickjacking middleware
+# admin, swagger/redoc and other routes run MIDDLEWARE in the order listed here
+ROUTE_SCOPED_MIDDLEWARE = {
+    'BYPASS_PREFIXES': ('/api/', '/metrics'),
+    'MIDDLEWARE'     : [
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    ],
+}
+
+# admin middleware is listed in ROUTE_SCOPED_MIDDLEWARE (checked by core.checks)
+SILENCED_SYSTEM_CHECKS = ['admin.E408', 'admin.E409', 'admin.E410']
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -103,6 +120,9 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# ASGI deployments (config/asgi.py) serve the async Kakao sign-in view
+ASYNC_SIGNIN = os.environ.get('ASYNC_SIGNIN', 'False') == 'True'
+
 
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
@@ -122,18 +142,67 @@ DATABASES = {
 '''
 
 ## AWS RDS FOR LOCAL-DEV ##
+# core.db.backends.mysql: MySQL backend + CONN_HEALTH_CHECKS backport + optional connection pool
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        'ENGINE': 'core.db.backends.mysql',
         'NAME': get_env_variable('RDS_DB_NAME'),
         'USER': get_env_variable('RDS_USERNAME'),
         'PASSWORD': get_env_variable('RDS_PASSWORD'),
         'HOST': get_env_variable('RDS_HOSTNAME'),
         'PORT': get_env_variable('RDS_PORT'),
         'OPTIONS': {'init_command': "SET sql_mode='STRICT_TRANS_TABLES'"},
+        'CONN_MAX_AGE'      : int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Set DB_POOL_SIZE for ASGI deployments, where per-thread persistent connections are not reused
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 0))
+
+if DB_POOL_SIZE:
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': 0,
+        'POOL'        : {
+            'MAX_SIZE': DB_POOL_SIZE,
+            'TIMEOUT' : float(os.environ.get('DB_POOL_TIMEOUT', 5.0)),
+            'WARM_UP' : int(os.environ.get('DB_POOL_WARM_UP', 1)),
+        },
+    })
+
+## DB ROUTING ##
+# Set DB_REPLICA_HOSTS (comma separated) to send reads to read replicas
+DB_REPLICA_HOSTS = [host for host in os.environ.get('DB_REPLICA_HOSTS', '').split(',') if host]
+
+for index, host in enumerate(DB_REPLICA_HOSTS, 1):
+    DATABASES[f'replica{index}'] = {**DATABASES['default'], 'HOST': host, 'TEST': {'MIRROR': 'default'}}
+
+DATABASE_ROUTERS = ['core.db.routers.PrimaryReplicaRouter']
+
+DATABASE_ROUTING = {
+    'PRIMARY'       : 'default',
+    'REPLICAS'      : [f'replica{index}' for index in range(1, len(DB_REPLICA_HOSTS) + 1)],
+    'STICKY_SECONDS': int(os.environ.get('DB_STICKY_SECONDS', 10)),
+}
+
+## CACHE ##
+# Set REDIS_URL to share caches across gunicorn workers
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND' : 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 ## CORS ##
 CORS_ORIGIN_ALLOW_ALL  = True
 CORS_ALLOW_CREDENTIALS = True
@@ -209,7 +278,16 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.VersionedJWTAuthentication',
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
 }
 
@@ -244,7 +322,85 @@ SIMPLE_JWT = {
     'JTI_CLAIM': 'jti',
 }
 
+# Claim carrying User.token_version (users.tokens.VersionedRefreshToken)
+TOKEN_VERSION_CLAIM = 'ver'
+
+## KAKAO API CLIENT ##
+# BASE_URL: 로컬 테스트 시 대체 서버(python -m core.utils.fake_kakao) 주소로 변경
+KAKAO_API_CLIENT = {
+    'BASE_URL'       : os.environ.get('KAKAO_API_URL', 'https://kapi.kakao.com'),
+    'POOL_MAXSIZE'   : int(os.environ.get('KAKAO_POOL_MAXSIZE', 10)),
+    'CONNECT_TIMEOUT': float(os.environ.get('KAKAO_CONNECT_TIMEOUT', 1.0)),
+    'READ_TIMEOUT'   : float(os.environ.get('KAKAO_READ_TIMEOUT', 2.0)),
+    'MAX_RETRIES'    : int(os.environ.get('KAKAO_MAX_RETRIES', 2)),
+}
+
+## KAKAO CIRCUIT BREAKER ##
+# Fail fast with 503 + Retry-After while the Kakao API is failing or slow (core.utils.circuit_breaker)
+# Open/half-open state is shared by all workers through CACHES, so it needs REDIS_URL (core.checks)
+KAKAO_CIRCUIT_BREAKER = {
+    'ENABLED'          : os.environ.get('KAKAO_CIRCUIT_BREAKER_ENABLED', str(bool(REDIS_URL))) == 'True',
+    'WINDOW'           : 10,
+    'MIN_CALLS'        : 20,
+    'ERROR_RATE'       : 0.5,
+    'SLOW_CALL_SECONDS': 1.0,
+    'SLOW_RATE'        : 0.8,
+    'OPEN_SECONDS'     : int(os.environ.get('KAKAO_CIRCUIT_OPEN_SECONDS', 10)),
+}
+
+## KAKAO PROFILE CACHE ##
+# BACKEND: 'local'(per-process LRU) | 'django'(CACHES, shared by all workers) | ''(disabled)
+KAKAO_PROFILE_CACHE = {
+    'BACKEND'    : os.environ.get('KAKAO_PROFILE_CACHE_BACKEND', 'local') or None,
+    'TTL'        : 10,
+    'ERROR_TTL'  : 2,
+    'MAX_ENTRIES': 10000,
+}
+
+## AUTH USER CACHE ##
+# Per-process cache of the user fields JWT authentication needs (users.utils.user_cache)
+AUTH_USER_CACHE = {
+    'ENABLED'    : os.environ.get('AUTH_USER_CACHE_ENABLED', 'True') == 'True',
+    'TTL'        : 5,
+    'MAX_ENTRIES': 10000,
+}
+
+## TOKEN BLACKLIST INDEX ##
+# In-memory blacklist lookup for token refresh (users.utils.blacklist_index)
+# SHARED_EPOCH tells other workers to refresh through CACHES, so it needs REDIS_URL (core.checks)
+TOKEN_BLACKLIST_INDEX = {
+    'REFRESH_INTERVAL': 5,
+    'REBUILD_INTERVAL': 3600,
+    'MAX_MEMORY'      : 8 * 1024 * 1024,
+    'SHARED_EPOCH'    : bool(REDIS_URL),
+}
+
+## TOKEN PRUNING ##
+# python manage.py prune_tokens / users.utils.token_pruning.prune_expired_tokens
+TOKEN_PRUNING = {
+    'BATCH_SIZE'     : 1000,
+    'SLEEP'          : 0.1,
+    'CHECKPOINT_FILE': os.path.join(BASE_DIR, 'var', 'prune_tokens.checkpoint'),
+}
+
+## WRITE-BEHIND QUEUE ##
+# Token records (OutstandingToken) and blacklist writes are flushed in bulk by a background thread (core.db.write_behind)
+WRITE_BEHIND = {
+    'ENABLED'       : os.environ.get('WRITE_BEHIND_ENABLED', 'False') == 'True',
+    'BATCH_SIZE'    : 200,
+    'FLUSH_INTERVAL': float(os.environ.get('WRITE_BEHIND_FLUSH_INTERVAL', 0.2)),
+    'MAX_PENDING'   : 2000,
+    'MAX_RETRIES'   : 5,
+}
+
 ## SWAGGER ##
+# OPENAPI_SCHEMA DIRECTORY: python manage.py build_schema 로 미리 생성한 스키마 파일 경로
+#                           파일이 없으면 최초 요청 시 생성해 워커 메모리에 보관
+OPENAPI_SCHEMA = {
+    'DIRECTORY'    : BASE_DIR / 'var' / 'openapi',
+    'CACHE_MAX_AGE': int(os.environ.get('OPENAPI_SCHEMA_MAX_AGE', 60 * 60 * 24)),
+}
+
 SWAGGER_SETTINGS = {
    'SECURITY_DEFINITIONS': {
       'Bearer': {
@@ -255,6 +411,36 @@ SWAGGER_SETTINGS = {
    }
 }
 
+## REQUEST INSTRUMENTATION ##
+# core.middleware.instrumentation.RequestInstrumentationMiddleware
+REQUEST_INSTRUMENTATION = {
+    'SERVER_TIMING'      : True,
+    'SLOW_QUERY_MS'      : float(os.environ.get('SLOW_QUERY_MS', 100)),
+    'SQL_LOG_SAMPLE_RATE': float(os.environ.get('SQL_LOG_SAMPLE_RATE', 0)),
+    'LOG_SAMPLE_RATE'    : float(os.environ.get('REQUEST_LOG_SAMPLE_RATE', 0.01)),
+    'QUERY_BUDGET_MODE'  : os.environ.get('QUERY_BUDGET_MODE', 'warn'),
+    'METRICS'            : os.environ.get('METRICS_ENABLED', 'True') == 'True',
+}
+
+## METRICS ##
+# /metrics (core.views.metrics_view) answers only "Authorization: Bearer <METRICS_TOKEN>"
+# or clients whose REMOTE_ADDR is in METRICS_ALLOWED_IPS (comma separated IPs/CIDRs)
+METRICS = {
+    'TOKEN'      : os.environ.get('METRICS_TOKEN', ''),
+    'ALLOWED_IPS': [ip.strip() for ip in os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip.strip()],
+}
+
+## REQUEST PROFILING ##
+# core.middleware.profiling.RequestProfilingMiddleware
+# 요청별 cProfile 결과: 서명된 헤더(python manage.py profile_token) 또는 admin 유저의 ?_profile=1
+REQUEST_PROFILING = {
+    'ENABLED'    : os.environ.get('REQUEST_PROFILING_ENABLED', 'True') == 'True',
+    'SAMPLE_RATE': float(os.environ.get('REQUEST_PROFILING_SAMPLE_RATE', 1.0)),
+    'MAX_AGE'    : int(os.environ.get('REQUEST_PROFILING_TOKEN_MAX_AGE', 60 * 60)),
+    'DIRECTORY'  : Path(os.environ.get('REQUEST_PROFILING_DIR', BASE_DIR / 'var' / 'profiles')),
+    'MAX_FILES'  : int(os.environ.get('REQUEST_PROFILING_MAX_FILES', 200)),
+}
+
 ## LOGGING ##
 LOGGING = {
     'disable_existing_loggers': False,
@@ -262,13 +448,23 @@ LOGGING = {
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
-            'level': 'DEBUG',
+            'level': 'INFO',
         },
     },
     'loggers': {
-        'django.db.backends': {
+        'core.sql': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'core.requests': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'core.profiling': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': 'INFO',
             'propagate': False,
         },
     },
@@ -0,0 +1,52 @@
+"""
+운영(production) 배포용 설정
+
+    DJANGO_SETTINGS_MODULE=config.settings_production gunicorn config.wsgi:application
+
+- config.settings를 기반으로 개발용 앱/설정을 제외
+  > django_extensions 제외, DEBUG 항상 False, DRF Browsable API 렌더러 제외(JSON만 응답)
+- REDIS_URL 필수: 모든 워커가 공유하는 캐시(Redis) 사용
+- 워커 시작 시 import 비용 확인: python manage.py import_report --settings config.settings_production
+"""
+from config.settings import *
+
+
+DEBUG = False
+
+# 워커 간 공유 캐시(circuit breaker, replica 읽기 고정, 블랙리스트 인덱스 세대)
+REDIS_URL = get_env_variable('REDIS_URL')
+
+CACHES = {
+    'default': {
+        'BACKEND' : 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+}
+
+KAKAO_CIRCUIT_BREAKER = {
+    **KAKAO_CIRCUIT_BREAKER,
+    'ENABLED': os.environ.get('KAKAO_CIRCUIT_BREAKER_ENABLED', 'True') == 'True',
+}
+
+TOKEN_BLACKLIST_INDEX = {
+    **TOKEN_BLACKLIST_INDEX,
+    'SHARED_EPOCH': True,
+}
+
+THIRD_PARTY_APPS = [app for app in THIRD_PARTY_APPS if app not in ('django_extensions',)]
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+] + THIRD_PARTY_APPS + PROJECT_APPS
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+    ],
+}
@@ -1,24 +1,8 @@
 from django.contrib import admin
 from django.urls    import path, re_path, include
 
-from drf_yasg       import openapi
-from drf_yasg.views import get_schema_view
+from core.views import metrics_view, schema_spec_view, schema_ui_view
 
-from rest_framework import permissions 
-
-
-"""
-Swagger settings
-"""
-schema_view = get_schema_view(
-    openapi.Info(
-        title           = 'social-login API',
-        default_version = 'v1',
-        description     = 'social-login',
-    ),
-    public = True,
-    permission_classes = (permissions.AllowAny,),
-)
 
 """
 Django app url patterns
@@ -26,13 +10,14 @@ Django app url patterns
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/users', include('users.urls')),
+    path('metrics', metrics_view),
 ]
 
 """
 Swagger url patterns
 """
 urlpatterns += [
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$',schema_view.without_ui(cache_timeout=0),name='schema-json',),
-    re_path(r'^swagger$', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    re_path(r'^redoc$', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_spec_view, name='schema-json'),
+    re_path(r'^swagger$', schema_ui_view('swagger'), name='schema-swagger-ui'),
+    re_path(r'^redoc$', schema_ui_view('redoc'), name='schema-redoc'),
 ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+from core.utils.kakao_client import async_kakao_client
+
+
+def with_lifespan(application):
+    """
+    detail:
+      - Django ASGIHandler는 lifespan 이벤트를 처리하지 않으므로(http 이외의 scope는 ValueError) 앞단에서 처리
+      - lifespan.shutdown: 서버 이벤트 루프가 종료되기 전에 그 루프의 비동기 카카오 클라이언트를 닫음
+        > 루프가 닫힌 뒤에는 커넥션을 닫을 수 없음(AsyncKakaoClient 참고)
+      - http scope는 그대로 Django에 전달
+    """
+
+    async def lifespan(scope, receive, send):
+        if scope['type'] != 'lifespan':
+            return await application(scope, receive, send)
+
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await async_kakao_client.aclose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    return lifespan
@@ -0,0 +1,96 @@
+from django.conf        import settings
+from django.core.checks import Error, Tags, register
+
+from core.db     import routers
+from core.utils  import circuit_breaker
+from users.utils import blacklist_index
+
+
+ROUTE_SCOPED_MIDDLEWARE = 'core.middleware.routing.RouteScopedMiddleware'
+
+PER_PROCESS_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+ADMIN_MIDDLEWARE = (
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+)
+
+
+@register(Tags.admin)
+def check_route_scoped_admin_middleware(app_configs, **kwargs):
+    """
+    RouteScopedMiddleware로 감싼 미들웨어도 admin에 필요한 미들웨어로 인정
+    (admin.E408~E410은 MIDDLEWARE에 직접 나열된 경우만 확인하므로 운영 설정에서 제외)
+    """
+    if ROUTE_SCOPED_MIDDLEWARE not in settings.MIDDLEWARE:
+        return []
+    
+    available = list(settings.MIDDLEWARE) + list(getattr(settings, 'ROUTE_SCOPED_MIDDLEWARE', {}).get('MIDDLEWARE', []))
+    return [
+        Error(f"'{middleware}' must be in MIDDLEWARE or ROUTE_SCOPED_MIDDLEWARE in order to use the admin application.", id='core.E001')
+        for middleware in ADMIN_MIDDLEWARE
+        if middleware not in available
+    ]
+
+
+
+def per_process_cache(alias: str = 'default') -> bool:
+    """
+    워커(프로세스)마다 따로 저장되어 다른 워커와 공유되지 않는 캐시이면 True
+    """
+    return settings.CACHES.get(alias, {}).get('BACKEND') in PER_PROCESS_CACHES
+
+
+@register(Tags.caches)
+def check_circuit_breaker_cache(app_configs, **kwargs):
+    """
+    circuit breaker의 open/probe 상태는 모든 워커가 공유해야 하므로 워커별 캐시(LocMemCache)로는 사용할 수 없음
+    """
+    config = {**circuit_breaker.DEFAULTS, **getattr(settings, 'KAKAO_CIRCUIT_BREAKER', {})}
+    if not config['ENABLED'] or not per_process_cache(config['CACHE_ALIAS']):
+        return []
+    return [
+        Error(
+            f"KAKAO_CIRCUIT_BREAKER needs a cache shared by all workers, but CACHES['{config['CACHE_ALIAS']}'] is per-process.",
+            hint = 'Set REDIS_URL, or disable the breaker with KAKAO_CIRCUIT_BREAKER_ENABLED=False.',
+            id   = 'core.E002',
+        )
+    ]
+
+
+@register(Tags.caches, Tags.database)
+def check_read_your_writes_cache(app_configs, **kwargs):
+    """
+    replica를 사용하면 로그인/로그아웃 직후의 primary 고정 표시(read_your_writes)를 모든 워커가 공유해야 함
+    """
+    config = routers.config()
+    if not config['REPLICAS'] or not per_process_cache(config['CACHE_ALIAS']):
+        return []
+    return [
+        Error(
+            f"DATABASE_ROUTING REPLICAS needs a cache shared by all workers, but CACHES['{config['CACHE_ALIAS']}'] is per-process.",
+            hint = 'Set REDIS_URL, or remove DB_REPLICA_HOSTS.',
+            id   = 'core.E003',
+        )
+    ]
+
+
+@register(Tags.caches)
+def check_blacklist_index_cache(app_configs, **kwargs):
+    """
+    블랙리스트 인덱스의 epoch(SHARED_EPOCH)는 다른 워커에 갱신 필요를 알리는 값이므로 모든 워커가 공유해야 함
+    """
+    config = {**blacklist_index.DEFAULTS, **getattr(settings, 'TOKEN_BLACKLIST_INDEX', {})}
+    if not config['SHARED_EPOCH'] or not per_process_cache(config['CACHE_ALIAS']):
+        return []
+    return [
+        Error(
+            f"TOKEN_BLACKLIST_INDEX SHARED_EPOCH needs a cache shared by all workers, but CACHES['{config['CACHE_ALIAS']}'] is per-process.",
+            hint = 'Set REDIS_URL, or set SHARED_EPOCH to False.',
+            id   = 'core.E004',
+        )
+    ]
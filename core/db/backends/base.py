@@ -0,0 +1,39 @@
+class HealthCheckMixin:
+    """
+    detail:
+      - Django 4.1의 CONN_HEALTH_CHECKS 설정 백포트(Django 4.0에는 없음)
+        > CONN_MAX_AGE로 유지 중인 커넥션을 요청에서 처음 사용하기 전에 한 번 확인(is_usable)
+        > DB/프록시가 끊은 커넥션이면 다시 연결, 요청 중 OperationalError 방지
+      - 새로 연결한 직후나 같은 요청 안에서는 확인하지 않음
+      - Django 4.1 이상으로 업그레이드하면 이 믹스인 없이 같은 설정으로 동작
+    """
+
+    health_check_done = False
+
+    @property
+    def health_check_enabled(self) -> bool:
+        return bool(self.settings_dict.get('CONN_HEALTH_CHECKS', False))
+
+    def connect(self):
+        super().connect()
+        self.health_check_done = True
+
+    def close_if_health_check_failed(self) -> None:
+        if self.connection is None or not self.health_check_enabled or self.health_check_done:
+            return
+        if not self.is_usable():
+            self.errors_occurred = True
+            self.close()
+        self.health_check_done = True
+
+    def close_if_unusable_or_obsolete(self):
+        """
+        요청 시작/종료 시(close_old_connections) 호출, 다음 요청에서 다시 확인하도록 표시
+        """
+        if self.connection is not None:
+            self.health_check_done = False
+        super().close_if_unusable_or_obsolete()
+
+    def _cursor(self, name=None):
+        self.close_if_health_check_failed()
+        return super()._cursor(name)
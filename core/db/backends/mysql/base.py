@@ -0,0 +1,54 @@
+from typing import Optional
+
+from django.db.backends.mysql.base import DatabaseWrapper as MySQLDatabaseWrapper
+from django.utils.functional       import cached_property
+
+from core.db.backends.base import HealthCheckMixin
+from core.db.pool          import ConnectionPool, PoolTimeout, get_pool
+
+
+class DatabaseWrapper(HealthCheckMixin, MySQLDatabaseWrapper):
+    """
+    detail:
+      - ENGINE: 'core.db.backends.mysql'
+      - CONN_HEALTH_CHECKS: 유지 중인 커넥션을 요청에서 처음 사용하기 전에 ping(core.db.backends.base)
+      - POOL 설정 시 프로세스 단위 커넥션 풀(core.db.pool) 사용
+        > connect(): 풀에서 커넥션을 꺼냄, close(): 커넥션을 닫지 않고 풀에 반납
+        > 오류가 발생했거나 트랜잭션 중에 닫힌 커넥션은 반납하지 않고 종료
+        > 재사용한 커넥션은 세션 설정(SQL_AUTO_IS_NULL, 격리 수준)을 다시 실행하지 않음
+        > CONN_MAX_AGE는 0으로 사용(요청이 끝나면 반납)
+    """
+
+    pool_reused = False
+
+    @cached_property
+    def pool(self) -> Optional[ConnectionPool]:
+        config = self.settings_dict.get('POOL')
+        return get_pool(self.alias, config) if config else None
+
+    def get_new_connection(self, conn_params):
+        if self.pool is None:
+            return super().get_new_connection(conn_params)
+
+        connect = super().get_new_connection
+        try:
+            connection, self.pool_reused = self.pool.acquire(lambda: connect(conn_params), lambda conn: conn.ping(False))
+        except PoolTimeout as e:
+            raise self.Database.OperationalError(str(e)) from e
+        return connection
+
+    def init_connection_state(self):
+        if self.pool is not None and self.pool_reused:
+            return
+        super().init_connection_state()
+
+    def _close(self):
+        if self.pool is None or self.connection is None:
+            return super()._close()
+
+        discard = (
+            self.errors_occurred
+            or self.in_atomic_block
+            or self.autocommit != self.settings_dict['AUTOCOMMIT']
+        )
+        self.pool.release(self.connection, discard=discard)
@@ -0,0 +1,175 @@
+import time, threading
+
+from collections import deque
+from typing      import Callable, Dict, Optional, Tuple
+
+from core.utils import metrics
+
+
+DEFAULTS = {
+    'MAX_SIZE'    : 10,
+    'TIMEOUT'     : 5.0,
+    'MAX_LIFETIME': 60 * 30,
+    'MAX_IDLE'    : 60 * 5,
+    'PING_AFTER'  : 1.0,
+    'WARM_UP'     : 1,
+}
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    detail:
+      - DB 커넥션 풀(프로세스당 DB alias별 1개), 최대 MAX_SIZE개의 커넥션을 여러 스레드가 나눠 사용
+        > 모든 커넥션이 사용 중이면 TIMEOUT 초까지 반납을 기다리고, 초과하면 PoolTimeout
+        > 최근에 반납된 커넥션부터 재사용(LIFO), 오래 쉬는 커넥션은 MAX_IDLE 후 종료
+        > 생성 후 MAX_LIFETIME이 지난 커넥션은 재사용하지 않음(DB/프록시의 유휴 연결 종료 대비)
+        > PING_AFTER 초 이상 쉬었던 커넥션은 재사용 전에 ping, 실패하면 버리고 다음 커넥션 사용
+        > 워커 시작 시 WARM_UP개의 커넥션을 미리 생성(core.utils.warmup)
+      - ASGI(요청마다 DB 커넥션 객체가 새로 생성됨)에서도 물리 커넥션을 재사용
+      - 지표: 사용 중(active)/대기(idle) 커넥션 수, 커넥션을 얻기까지 대기 시간, 실패 수
+    """
+
+    def __init__(self, alias: str, config: Optional[dict] = None):
+        self.alias    = alias
+        self.config   = {**DEFAULTS, **(config or {})}
+        self.idle     = deque()
+        self.active   = 0
+        self.created  = {}
+        self.stats    = dict.fromkeys(('checkouts', 'connects', 'reused', 'discarded', 'timeouts'), 0)
+        self._cond    = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        return self.active + len(self.idle)
+
+    def _report(self) -> None:
+        metrics.observe_pool(self.alias, self.active, len(self.idle))
+
+    def _discard(self, connection) -> None:
+        self.created.pop(connection, None)
+        self.stats['discarded'] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _take_idle(self, now: float):
+        """
+        재사용할 수 있는 대기 커넥션 -> (커넥션, 반납 시각), 없으면 None(락 안에서 호출)
+        """
+        while self.idle:
+            connection, released = self.idle.pop()
+            if now - self.created[connection] < self.config['MAX_LIFETIME'] and now - released < self.config['MAX_IDLE']:
+                self.active += 1
+                return connection, released
+            self._discard(connection)
+        return None
+
+    def acquire(self, connect: Callable[[], object], ping: Callable[[object], None]) -> Tuple[object, bool]:
+        """
+        -> (커넥션, 재사용 여부)
+        connect: 새 커넥션 생성, ping: 커넥션 확인(실패 시 예외)
+        """
+        started  = time.monotonic()
+        deadline = started + self.config['TIMEOUT']
+
+        while True:
+            with self._cond:
+                while True:
+                    now   = time.monotonic()
+                    taken = self._take_idle(now)
+                    if taken or self.size < self.config['MAX_SIZE']:
+                        if not taken:
+                            self.active += 1
+                        break
+                    if now >= deadline:
+                        self.stats['timeouts'] += 1
+                        metrics.observe_pool_checkout(self.alias, now - started, failed=True)
+                        raise PoolTimeout(
+                            f"DB connection pool '{self.alias}' exhausted: "
+                            f"{self.config['MAX_SIZE']} connections in use for {self.config['TIMEOUT']}s"
+                        )
+                    self._cond.wait(deadline - now)
+                self._report()
+
+            if taken is None:
+                return self._connect(connect, started), False
+
+            connection, released = taken
+            if now - released >= self.config['PING_AFTER']:
+                try:
+                    ping(connection)
+                except Exception:
+                    with self._cond:
+                        self.active -= 1
+                        self._discard(connection)
+                        self._report()
+                    continue
+
+            with self._cond:
+                self.stats['checkouts'] += 1
+                self.stats['reused']    += 1
+            metrics.observe_pool_checkout(self.alias, time.monotonic() - started, failed=False)
+            return connection, True
+
+    def _connect(self, connect: Callable[[], object], started: float):
+        try:
+            connection = connect()
+        except Exception:
+            with self._cond:
+                self.active -= 1
+                self._cond.notify()
+                self._report()
+            metrics.observe_pool_checkout(self.alias, time.monotonic() - started, failed=True)
+            raise
+
+        with self._cond:
+            self.created[connection] = time.monotonic()
+            self.stats['checkouts'] += 1
+            self.stats['connects']  += 1
+        metrics.observe_pool_checkout(self.alias, time.monotonic() - started, failed=False)
+        return connection
+
+    def release(self, connection, discard: bool = False) -> None:
+        """
+        discard: 오류가 발생했거나 트랜잭션/autocommit 상태를 알 수 없는 커넥션은 풀에 돌려놓지 않고 종료
+        """
+        with self._cond:
+            self.active -= 1
+            if discard or connection not in self.created:
+                self._discard(connection)
+            else:
+                self.idle.append((connection, time.monotonic()))
+            self._cond.notify()
+            self._report()
+
+    def close(self) -> None:
+        with self._cond:
+            while self.idle:
+                self._discard(self.idle.pop()[0])
+            self._report()
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._cond:
+            return {**self.stats, 'active': self.active, 'idle': len(self.idle), 'max_size': self.config['MAX_SIZE']}
+
+
+_pools      = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias: str, config: Optional[dict] = None) -> ConnectionPool:
+    with _pools_lock:
+        if alias not in _pools:
+            _pools[alias] = ConnectionPool(alias, config)
+        return _pools[alias]
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
@@ -0,0 +1,131 @@
+import random
+
+from contextvars import ContextVar, Token
+from typing      import Optional
+
+from django.conf       import settings
+from django.core.cache import caches
+from django.db         import connections
+
+
+DEFAULTS = {
+    'PRIMARY'       : 'default',
+    'REPLICAS'      : [],
+    'STICKY_SECONDS': 10,
+    'CACHE_ALIAS'   : 'default',
+    'KEY_PREFIX'    : 'db-sticky:',
+}
+
+"""
+True이면 현재 요청(컨텍스트)의 읽기 쿼리도 primary로 보냄
+"""
+_use_primary = ContextVar('use_primary', default=False)
+
+
+def use_primary() -> Token:
+    return _use_primary.set(True)
+
+
+def start_routing() -> Token:
+    return _use_primary.set(False)
+
+
+def finish_routing(token: Token) -> None:
+    _use_primary.reset(token)
+
+
+def config() -> dict:
+    return {**DEFAULTS, **getattr(settings, 'DATABASE_ROUTING', {})}
+
+
+class ReadYourWrites:
+    """
+    detail:
+      - 로그인/로그아웃 직후 STICKY_SECONDS 동안 해당 유저의 요청은 읽기 쿼리도 primary로 보냄
+        > 새로 발급한 토큰, 변경된 토큰 세대(token_version), 블랙리스트를 복제 지연 중인 replica에서 읽지 않도록 함
+      - 유저별 표시는 캐시(CACHES)에 저장해 다른 워커의 요청에도 적용
+        > 워커 간 공유 캐시(Redis)가 필요, 워커별 캐시(LocMemCache)이면 시스템 체크 오류(core.checks)
+      - replica가 없으면 아무것도 하지 않음
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config = {**DEFAULTS, **(config or {})}
+
+    @classmethod
+    def from_settings(cls) -> 'ReadYourWrites':
+        return cls(config())
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config['REPLICAS'])
+
+    @property
+    def cache(self):
+        return caches[self.config['CACHE_ALIAS']]
+
+    def key(self, user_id) -> str:
+        return f"{self.config['KEY_PREFIX']}{user_id}"
+
+    def pin(self, user_id) -> None:
+        if self.enabled:
+            use_primary()
+            self.cache.set(self.key(user_id), 1, self.config['STICKY_SECONDS'])
+
+    def activate(self, user_id) -> bool:
+        """
+        유저가 primary에 고정되어 있으면 현재 요청의 읽기 쿼리를 primary로 보냄
+        """
+        if self.enabled and user_id is not None and self.cache.get(self.key(user_id)):
+            use_primary()
+            return True
+        return False
+
+    async def aactivate(self, user_id) -> bool:
+        """
+        비동기(ASGI) 미들웨어에서 사용, 캐시 비동기 API(aget)로 확인
+        """
+        if self.enabled and user_id is not None and await self.cache.aget(self.key(user_id)):
+            use_primary()
+            return True
+        return False
+
+
+read_your_writes = ReadYourWrites.from_settings()
+
+
+class PrimaryReplicaRouter:
+    """
+    detail:
+      - 쓰기는 PRIMARY, 읽기는 REPLICAS 중 하나(무작위)로 보냄
+        > REPLICAS가 없으면 모두 PRIMARY
+      - 다음 경우에는 읽기도 PRIMARY
+        > 현재 요청에서 쓰기를 한 이후(같은 요청 안에서 쓴 값을 다시 읽는 경우)
+        > PRIMARY 트랜잭션(atomic) 안
+        > 로그인/로그아웃 직후 유저의 요청(read_your_writes)
+      - 마이그레이션은 PRIMARY에서만 실행(replica는 DB 복제로 반영)
+    """
+
+    def __init__(self):
+        self.config   = config()
+        self.primary  = self.config['PRIMARY']
+        self.replicas = list(self.config['REPLICAS'])
+        self.aliases  = {self.primary, *self.replicas}
+
+    def db_for_read(self, model, **hints):
+        if not self.replicas or _use_primary.get() or connections[self.primary].in_atomic_block:
+            return self.primary
+        return random.choice(self.replicas)
+
+    def db_for_write(self, model, **hints):
+        use_primary()
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if obj1._state.db in self.aliases and obj2._state.db in self.aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in self.aliases:
+            return db == self.primary
+        return None
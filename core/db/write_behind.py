@@ -0,0 +1,294 @@
+import os, time, atexit, logging, threading
+
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db   import DatabaseError, IntegrityError, close_old_connections, connections, router, transaction
+
+from core.db    import routers
+from core.utils import metrics
+
+
+DEFAULTS = {
+    'ENABLED'       : False,
+    'BATCH_SIZE'    : 200,
+    'FLUSH_INTERVAL': 0.2,
+    'MAX_PENDING'   : 2000,
+    'MAX_RETRIES'   : 5,
+}
+
+logger = logging.getLogger(__name__)
+
+
+def insert_rows(objs: list) -> Dict[str, int]:
+    """
+    모델별로 묶어 bulk INSERT, 이미 같은 행(unique 컬럼)이 있으면 무시
+    """
+    models = {}
+    for obj in objs:
+        models.setdefault(type(obj), []).append(obj)
+
+    for model, rows in models.items():
+        model.objects.bulk_create(rows, ignore_conflicts=True)
+    return {model._meta.label: len(rows) for model, rows in models.items()}
+
+
+def release_connections() -> None:
+    """
+    커넥션 풀을 사용하는 경우 처리 후 백그라운드 스레드의 커넥션을 풀에 반납
+    """
+    for connection in connections.all():
+        if connection.settings_dict.get('POOL'):
+            connection.close()
+
+
+class WriteBehindQueue:
+    """
+    detail:
+      - 응답에 필요하지 않은 기록용 쓰기(OutstandingToken INSERT, 블랙리스트 처리 등)를 요청 처리 중에 실행하지 않고
+        워커(프로세스) 메모리에 모았다가 백그라운드 스레드에서 한 번에 처리
+        > save(obj)          : 모델 인스턴스 INSERT, 모델별 bulk INSERT로 처리
+        > defer(func, value) : 같은 func에 전달된 값을 모아 func(values) 한 번으로 처리
+        > ENABLED가 False이거나 close() 이후에는 호출한 스레드에서 바로 처리
+      - 처리 시점
+        > 대기 중인 쓰기가 BATCH_SIZE개가 되거나, 첫 쓰기 후 FLUSH_INTERVAL초가 지나면 처리
+        > 트랜잭션 안에서 호출하면 커밋된 이후 대기열에 추가(롤백되면 버림)
+        > 워커 종료 시(gunicorn worker_exit, atexit) 남은 쓰기를 모두 처리
+      - 대기 중인 쓰기가 MAX_PENDING개를 넘으면 호출한 스레드가 직접 대기열을 처리(back-pressure)
+      - 읽기 규칙
+        > 대기 중인 행을 읽는 코드는 읽기 전에 flush() 호출, flush()가 끝나면 그 전에 추가된 쓰기는 모두 DB에 반영됨
+        > 다른 워커의 대기열은 볼 수 없으므로, 다른 워커에서 바로 읽어야 하는 값(토큰 세대 등)은 이 대기열을 사용하지 않음
+        > 모델 INSERT를 먼저 처리한 뒤 defer()한 작업을 처리(대기 중인 행을 대상으로 하는 작업이 행을 찾을 수 있도록)
+      - 처리 실패
+        > 한 번에 처리(bulk INSERT, func(values))하다 DB 오류가 나면 하나씩 다시 처리
+          * IntegrityError(삭제된 유저의 토큰 등 다시 시도해도 실패하는 쓰기)는 로그를 남기고 버림
+        > 그 외 오류(DB 연결 등)는 남은 쓰기를 대기열 앞에 되돌려 다음 처리 때 다시 시도
+          * 연속 MAX_RETRIES번 넘게 실패하면 남은 쓰기를 로그를 남기고 버림(대기열이 계속 쌓이지 않도록)
+        > 요청 스레드에서 처리하는 경우(back-pressure, close() 이후)의 실패는 요청으로 전달하지 않음
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config = {**DEFAULTS, **(config or {})}
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    @classmethod
+    def from_settings(cls) -> 'WriteBehindQueue':
+        return cls(getattr(settings, 'WRITE_BEHIND', None))
+
+    def _reset(self) -> None:
+        """
+        fork 된 워커는 부모의 대기열(부모가 처리)과 스레드, 락을 물려받지 않음
+        """
+        self._cond       = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flushing   = None
+        self._rows       = []
+        self._deferred   = {}
+        self._pending    = 0
+        self._thread     = None
+        self._closed     = False
+        self._attempts   = 0
+        self.stats       = dict.fromkeys(('queued', 'flushes', 'written', 'failures', 'dropped', 'backpressure'), 0)
+
+    @property
+    def enabled(self) -> bool:
+        return self.config['ENABLED'] and not self._closed
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def save(self, obj) -> None:
+        if not self.enabled:
+            obj.save(force_insert=True)
+            return
+        self._on_commit(lambda: self._put(lambda: self._rows.append(obj)), type(obj))
+
+    def defer(self, func: Callable[[list], object], value, model=None) -> None:
+        """
+        func: 모은 값 목록을 한 번에 처리하는 함수, model: 트랜잭션 확인에 사용할 DB를 정하는 모델
+        """
+        if not self.enabled:
+            func([value])
+            return
+        self._on_commit(lambda: self._put(lambda: self._deferred.setdefault(func, []).append(value)), model)
+
+    def _on_commit(self, callback: Callable[[], None], model) -> None:
+        using = router.db_for_write(model) if model is not None else None
+        transaction.on_commit(callback, using=using)
+
+    def _put(self, append: Callable[[], None]) -> None:
+        if self._pending >= self.config['MAX_PENDING']:
+            self.stats['backpressure'] += 1
+            metrics.observe_write_behind_pending(self._pending, backpressure=True)
+            self._flush_quietly()
+
+        with self._cond:
+            append()
+            self._pending        += 1
+            self.stats['queued'] += 1
+            closed                = self._closed
+            if not closed:
+                self._start()
+                if self._pending == 1 or self._pending >= self.config['BATCH_SIZE']:
+                    self._cond.notify()
+
+        if closed:
+            self._flush_quietly()
+
+    def _flush_quietly(self) -> None:
+        """
+        요청 스레드(on_commit 콜백)에서 처리, 실패한 쓰기는 대기열에 남기고 예외는 요청으로 전달하지 않음
+        """
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('write-behind flush failed in request thread, %s writes pending', self._pending)
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                deadline = time.monotonic() + self.config['FLUSH_INTERVAL']
+                while not self._closed and self._pending < self.config['BATCH_SIZE'] and time.monotonic() < deadline:
+                    self._cond.wait(deadline - time.monotonic())
+                if self._closed:
+                    return
+            try:
+                close_old_connections()
+                self.flush()
+            except Exception:
+                logger.exception('write-behind flush failed, %s writes pending', self._pending)
+                time.sleep(self.config['FLUSH_INTERVAL'])
+            finally:
+                release_connections()
+
+    def flush(self) -> int:
+        """
+        호출 시점까지 대기열에 추가된 쓰기를 모두 처리, 반환값: 처리한 쓰기 개수
+        처리 중인 작업(defer 함수)이 다시 flush()를 호출하면 바로 반환
+        """
+        if self._flushing == threading.get_ident():
+            return 0
+
+        with self._flush_lock:
+            self._flushing = threading.get_ident()
+            try:
+                return self._flush()
+            finally:
+                self._flushing = None
+
+    def _flush(self) -> int:
+        with self._cond:
+            rows, deferred = self._rows, self._deferred
+            self._rows, self._deferred = [], {}
+        if not rows and not deferred:
+            return 0
+
+        """
+        (func, 남은 항목) 목록, 모델 INSERT를 먼저 처리, 처리한 항목은 목록에서 제거됨
+        """
+        tasks   = ([(insert_rows, rows)] if rows else []) + list(deferred.items())
+        total   = sum(len(items) for _, items in tasks)
+        started = time.perf_counter()
+        written = {}
+        try:
+            while tasks:
+                func, items = tasks[0]
+                kept        = self._apply(func, items)
+                for name in kept:
+                    written[name] = written.get(name, 0) + 1
+                tasks.pop(0)
+            self._attempts = 0
+        except Exception:
+            self._attempts          += 1
+            self.stats['failures']  += 1
+            metrics.observe_write_behind_flush(written, time.perf_counter() - started, failed=True)
+            if self._attempts <= self.config['MAX_RETRIES']:
+                self._restore(tasks)
+                raise
+            logger.exception(
+                'write-behind dropped %s writes after %s failed flushes',
+                sum(len(items) for _, items in tasks), self._attempts,
+            )
+            self._attempts = 0
+            tasks          = []
+        finally:
+            remaining = sum(len(items) for _, items in tasks)
+            with self._cond:
+                self._pending -= total - remaining
+                metrics.observe_write_behind_pending(self._pending)
+            self.stats['dropped'] += total - remaining - sum(written.values())
+
+        self.stats['flushes'] += 1
+        self.stats['written'] += sum(written.values())
+        metrics.observe_write_behind_flush(written, time.perf_counter() - started)
+        return sum(written.values())
+
+    def _apply(self, func: Callable[[list], object], items: list) -> List[str]:
+        """
+        items를 한 번에 처리, DB 오류가 나면 하나씩 처리하며 IntegrityError인 항목은 로그를 남기고 버림
+        처리한(버린 것 포함) 항목은 items에서 제거, 반환값: 기록된 항목별 이름(모델 라벨 또는 func 이름)
+        """
+        names = [type(item)._meta.label if func is insert_rows else func.__name__ for item in items]
+        using = routers.config()['PRIMARY']
+        try:
+            with transaction.atomic(using=using):
+                func(items[:])
+        except DatabaseError:
+            logger.warning('write-behind batch of %s %s failed, retrying one by one', len(items), names[0], exc_info=True)
+        else:
+            del items[:]
+            return names
+
+        kept = []
+        while items:
+            try:
+                with transaction.atomic(using=using):
+                    func(items[:1])
+            except IntegrityError:
+                logger.exception('write-behind dropped %s: %r', names[0], items[0])
+            else:
+                kept.append(names[0])
+            del items[0], names[0]
+        return kept
+
+    def _restore(self, tasks: list) -> None:
+        with self._cond:
+            rows     = [item for func, items in tasks if func is insert_rows for item in items]
+            deferred = {func: items for func, items in tasks if func is not insert_rows}
+            self._rows[:0] = rows
+            for func, values in self._deferred.items():
+                deferred.setdefault(func, []).extend(values)
+            self._deferred = deferred
+
+    def close(self, timeout: float = 10) -> None:
+        """
+        워커 종료 시 호출, 백그라운드 스레드를 멈추고 남은 쓰기를 호출한 스레드에서 처리
+        이후의 쓰기는 바로 처리
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            **self.stats,
+            'pending': self._pending,
+            'enabled': self.enabled,
+        }
+
+
+write_behind = WriteBehindQueue.from_settings()
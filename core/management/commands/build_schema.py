@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.utils.schema import schema_artifacts
+
+
+class Command(BaseCommand):
+    help = 'OpenAPI 스키마(swagger.json, swagger.yaml)를 미리 생성(배포 시 실행)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--directory', help='스키마 파일을 저장할 경로(기본값 OPENAPI_SCHEMA DIRECTORY)')
+    
+    def handle(self, *args, **options):
+        for filename, path in schema_artifacts.build(options['directory']).items():
+            self.stdout.write(self.style.SUCCESS(f'{filename}: {path} ({path.stat().st_size} bytes)'))
@@ -0,0 +1,105 @@
+import os, re, sys, json, time, subprocess
+
+from collections import defaultdict
+from typing      import Dict, List
+
+from django.conf                 import settings
+from django.core.management.base import BaseCommand
+
+
+"""
+워커 시작 시 실행되는 코드: django.setup() + WSGI 핸들러(미들웨어) 생성 + URLconf(모든 뷰) 로딩
+"""
+BOOT_SCRIPT = '; '.join((
+    'import django',
+    'django.setup()',
+    'from django.core.wsgi import get_wsgi_application',
+    'get_wsgi_application()',
+    'from django.urls import get_resolver',
+    'get_resolver().url_patterns',
+))
+
+IMPORT_TIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+def parse_import_times(output: str) -> List[Dict[str, object]]:
+    """
+    python -X importtime 출력 -> [{'module', 'self_us', 'cumulative_us', 'depth'}]
+    """
+    entries = []
+    for line in output.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                'module'       : module,
+                'self_us'      : int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth'        : len(indent) // 2,
+            })
+    return entries
+
+
+def summarize_import_times(entries: List[Dict[str, object]], top: int) -> Dict[str, object]:
+    packages = defaultdict(int)
+    for entry in entries:
+        packages[entry['module'].split('.')[0]] += entry['self_us']
+
+    return {
+        'modules'          : len(entries),
+        'total_ms'         : round(sum(entry['self_us'] for entry in entries) / 1000, 1),
+        'top_level'        : sorted(
+            (entry for entry in entries if entry['depth'] == 0),
+            key=lambda entry: entry['cumulative_us'], reverse=True,
+        )[:top],
+        'packages'         : [
+            {'package': package, 'self_us': self_us}
+            for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = '워커 시작(django.setup, 미들웨어, URLconf 로딩) 시 모듈별 import 비용 측정(python -X importtime)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help='출력할 항목 수')
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+
+    def handle(self, *args, **options):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE}
+
+        started = time.perf_counter()
+        result  = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT],
+            cwd            = settings.BASE_DIR,
+            env            = env,
+            capture_output = True,
+            text           = True,
+        )
+        elapsed = time.perf_counter() - started
+
+        if result.returncode:
+            self.stderr.write(result.stderr[-2000:])
+            raise SystemExit(result.returncode)
+
+        report = {
+            'settings': settings.SETTINGS_MODULE,
+            'boot_ms' : round(elapsed * 1000, 1),
+            **summarize_import_times(parse_import_times(result.stderr), options['top']),
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"{report['settings']}: boot {report['boot_ms']}ms, "
+            f"{report['modules']} modules, import {report['total_ms']}ms"
+        )
+        self.stdout.write('\ntop-level imports (cumulative ms)')
+        for entry in report['top_level']:
+            self.stdout.write(f"  {entry['cumulative_us'] / 1000:8.1f}  {entry['module']}")
+        self.stdout.write('\npackages (self ms)')
+        for entry in report['packages']:
+            self.stdout.write(f"  {entry['self_us'] / 1000:8.1f}  {entry['package']}")
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from core.middleware.profiling import sign_profile_token
+
+
+class Command(BaseCommand):
+    help = '요청 프로파일링(RequestProfilingMiddleware) 헤더 값 생성(REQUEST_PROFILING MAX_AGE 동안 유효)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--label', default='', help='프로파일 기록(.json)의 trigger에 남길 이름')
+
+    def handle(self, *args, **options):
+        self.stdout.write(sign_profile_token(options['label']))
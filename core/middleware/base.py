@@ -0,0 +1,22 @@
+import asyncio
+
+
+class AsyncCapableMiddleware:
+    """
+    detail:
+      - 동기(WSGI)/비동기(ASGI) 미들웨어 체인 모두에서 사용하는 미들웨어
+        > Django가 다음 handler(get_response)를 같은 방식으로 넘겨줌(load_middleware), 코루틴 함수이면 비동기로 동작
+        > 동기 전용 미들웨어가 체인에 있으면 ASGI에서 요청마다 스레드를 점유(async_to_sync로 뷰 실행)
+          * 비동기 뷰가 카카오 API를 기다리는 동안에도 스레드를 사용하게 되므로 비동기 뷰의 동시성 이점이 사라짐
+      - self.is_async이면 하위 클래스의 __call__은 코루틴을 반환해야 함(보통 __acall__(request))
+    """
+
+    sync_capable  = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async     = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            # django.utils.deprecation.MiddlewareMixin과 같은 방식으로 인스턴스를 코루틴 함수로 표시
+            self._is_coroutine = asyncio.coroutines._is_coroutine
@@ -0,0 +1,172 @@
+import json, time, random, logging
+
+from django.conf                import settings
+from django.core.signals        import request_started
+from django.db                  import connections
+from django.db.backends.signals import connection_created
+
+from core.middleware.base     import AsyncCapableMiddleware
+from core.utils               import metrics
+from core.utils.request_stats import current_stats, start_stats, finish_stats
+
+
+sql_logger     = logging.getLogger('core.sql')
+request_logger = logging.getLogger('core.requests')
+
+DEFAULTS = {
+    'SERVER_TIMING'      : True,
+    'SLOW_QUERY_MS'      : 100,
+    'SQL_LOG_SAMPLE_RATE': 0.0,
+    'LOG_SAMPLE_RATE'    : 0.01,
+    'QUERY_BUDGET_MODE'  : 'warn',
+    'METRICS'            : True,
+}
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class QueryTimer:
+    """
+    detail:
+      - 커넥션마다 한 번 connection.execute_wrappers에 등록(install_query_timer)되어 쿼리마다 소요시간을 기록
+        > 요청 처리 중(current_stats())인 쿼리만 기록, 요청 밖의 쿼리(쓰기 대기열, 관리 명령 등)는 그대로 실행
+        > 요청 통계는 contextvar이므로 비동기 체인에서 sync_to_async 스레드로 실행되는 쿼리도 해당 요청에 기록됨
+      - 느린 쿼리(SLOW_QUERY_MS 이상) 또는 샘플링된 쿼리만 SQL 원문을 로깅
+      - config는 RequestInstrumentationMiddleware 생성 시 설정
+    """
+    
+    config = DEFAULTS
+    
+    def __init__(self, alias):
+        self.alias = alias
+    
+    def __call__(self, execute, sql, params, many, context):
+        stats = current_stats()
+        if stats is None:
+            return execute(sql, params, many, context)
+        
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.record_query(self.alias, sql, elapsed)
+            
+            if elapsed * 1000 >= self.config['SLOW_QUERY_MS']:
+                sql_logger.warning('slow query (%.1fms) on %s: %s', elapsed * 1000, self.alias, sql)
+            elif self.config['SQL_LOG_SAMPLE_RATE'] and random.random() < self.config['SQL_LOG_SAMPLE_RATE']:
+                sql_logger.info('sampled query (%.1fms) on %s: %s', elapsed * 1000, self.alias, sql)
+
+
+def install_query_timer(sender=None, connection=None, **kwargs) -> None:
+    """
+    connection_created 시그널 수신(커넥션은 스레드마다 생성됨)
+    요청 중(execute_wrapper 사용 중)에 연결될 수 있으므로 목록 앞에 추가(execute_wrapper는 마지막 항목을 제거)
+    """
+    if not any(isinstance(wrapper, QueryTimer) for wrapper in connection.execute_wrappers):
+        connection.execute_wrappers.insert(0, QueryTimer(connection.alias))
+
+
+def install_query_timers(sender=None, **kwargs) -> None:
+    """
+    request_started 시그널 수신, 요청을 처리할 스레드의 이미 연결된 커넥션에도 등록
+    (WSGI는 요청 스레드, ASGI는 요청의 thread-sensitive 스레드에서 호출됨)
+    """
+    for connection in connections.all():
+        install_query_timer(connection=connection)
+
+
+class RequestInstrumentationMiddleware(AsyncCapableMiddleware):
+    """
+    detail:
+      - 요청마다 DB 쿼리 수/시간, 가장 느린 쿼리, 카카오 API 호출 시간을 기록
+        > Server-Timing 헤더로 응답에 포함
+        > LOG_SAMPLE_RATE 비율로 구조화(JSON) 로그 기록
+        > METRICS: route별 응답시간/쿼리 수를 Prometheus 지표(core.utils.metrics)로 집계
+      - 뷰의 query_budget 속성(요청당 허용 쿼리 수)을 넘으면
+        > QUERY_BUDGET_MODE = 'warn': 경고 로그
+        > QUERY_BUDGET_MODE = 'raise': QueryBudgetExceeded 발생(테스트에서 사용)
+      - 쿼리 시간은 커넥션에 등록된 QueryTimer가 기록
+        > 새 커넥션은 connection_created, 이미 연결된 커넥션은 request_started 시그널로 등록
+    """
+    
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.config       = {**DEFAULTS, **getattr(settings, 'REQUEST_INSTRUMENTATION', {})}
+        QueryTimer.config = self.config
+        connection_created.connect(install_query_timer, dispatch_uid='core.middleware.instrumentation')
+        request_started.connect(install_query_timers, dispatch_uid='core.middleware.instrumentation')
+    
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        
+        stats, token = start_stats()
+        request.request_stats = stats
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            finish_stats(token)
+        return self.finish(request, response, stats, started)
+    
+    async def __acall__(self, request):
+        stats, token = start_stats()
+        request.request_stats = stats
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            finish_stats(token)
+        return self.finish(request, response, stats, started)
+    
+    def finish(self, request, response, stats, started):
+        elapsed = time.perf_counter() - started
+        
+        if self.config['SERVER_TIMING']:
+            response['Server-Timing'] = self.server_timing(stats, elapsed)
+        
+        if self.config['METRICS']:
+            metrics.observe_request(metrics.route_of(request), request.method, response.status_code, elapsed, stats.aliases)
+        
+        budget   = getattr(request, 'query_budget', None)
+        exceeded = budget is not None and stats.queries > budget
+        
+        if exceeded or random.random() < self.config['LOG_SAMPLE_RATE']:
+            request_logger.info(json.dumps({
+                'method'      : request.method,
+                'path'        : request.path,
+                'status'      : response.status_code,
+                'duration_ms' : round(elapsed * 1000, 3),
+                'query_budget': budget,
+                'slowest_sql' : stats.slowest_sql,
+                **stats.as_dict(),
+            }, ensure_ascii=False))
+        
+        if exceeded:
+            message = f'{request.method} {request.path} ran {stats.queries} queries (budget {budget})'
+            if self.config['QUERY_BUDGET_MODE'] == 'raise':
+                raise QueryBudgetExceeded(message)
+            if self.config['QUERY_BUDGET_MODE'] == 'warn':
+                request_logger.warning('query budget exceeded: %s', message)
+        
+        return response
+    
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, 'view_class', view_func)
+        request.query_budget = getattr(view, 'query_budget', None)
+    
+    def server_timing(self, stats, elapsed) -> str:
+        """
+        DB를 여러 개(primary/replica) 사용한 요청은 DB별 쿼리 수도 포함
+        """
+        entries = [
+            f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"',
+            f'kakao;dur={stats.upstream_seconds * 1000:.1f}',
+            f'total;dur={elapsed * 1000:.1f}',
+        ]
+        if len(stats.aliases) > 1:
+            entries.extend(f'db-{alias};desc="{queries} queries"' for alias, queries in stats.aliases.items())
+        return ', '.join(entries)
@@ -0,0 +1,191 @@
+import os, json, time, random, cProfile, logging
+
+from pathlib import Path
+
+from asgiref.sync              import sync_to_async
+from django.conf               import settings
+from django.core               import signing
+from django.core.exceptions    import MiddlewareNotUsed
+from rest_framework.exceptions import APIException
+from rest_framework.settings   import api_settings
+
+from core.middleware.base import AsyncCapableMiddleware
+from core.utils           import metrics
+
+
+logger = logging.getLogger('core.profiling')
+
+DEFAULTS = {
+    'ENABLED'    : False,
+    'HEADER'     : 'X-Profile-Token',
+    'QUERY_FLAG' : '_profile',
+    'SALT'       : 'core.middleware.profiling',
+    'MAX_AGE'    : 3600,
+    'SAMPLE_RATE': 1.0,
+    'DIRECTORY'  : 'var/profiles',
+    'MAX_FILES'  : 200,
+}
+
+
+def sign_profile_token(label: str = '') -> str:
+    """
+    프로파일링 요청 헤더(HEADER) 값, label은 프로파일 기록(.json)에 포함됨
+    """
+    config = {**DEFAULTS, **getattr(settings, 'REQUEST_PROFILING', {})}
+    return signing.dumps({'label': label}, salt=config['SALT'], compress=True)
+
+
+class RequestProfilingMiddleware(AsyncCapableMiddleware):
+    """
+    detail:
+      - 요청된 경우에만 요청 하나를 cProfile로 프로파일링해 DIRECTORY에 저장
+        > 서명된 헤더(HEADER, sign_profile_token / manage.py profile_token으로 생성, MAX_AGE초 동안 유효)
+        > 또는 admin 유저(JWT 인증)의 쿼리 플래그(?_profile=1)
+        > 요청된 요청 중 SAMPLE_RATE 비율만 프로파일링(부하 테스트 등에서 모든 요청에 헤더를 붙이는 경우)
+      - 프로파일마다 두 파일을 저장, 최근 MAX_FILES개만 유지
+        > <id>.prof: cProfile 결과(python -m pstats <id>.prof, snakeviz 등으로 확인)
+        > <id>.json: route, 상태코드, 전체/CPU 시간, DB/카카오 API 시간(RequestInstrumentationMiddleware)
+        > 응답 헤더 X-Profile-Id로 <id> 전달
+        > <id> = <저장 시각(ns, 20자리 0 채움)>-<pid>, 자릿수가 고정되어 이름 순서 = 생성 순서(워커 간에도 동일)
+      - 요청되지 않은 요청은 헤더/쿼리 문자열 확인만 하고 그대로 처리
+        > ENABLED = False이면 미들웨어 체인에서 제외(MiddlewareNotUsed)
+      - 미들웨어 전체를 포함하도록 MIDDLEWARE의 처음에 위치
+      - cProfile은 프로파일링을 시작한 스레드만 기록
+        > 비동기 체인(ASGI)에서는 이벤트 루프 스레드를 기록(같은 시간에 처리된 다른 요청도 포함, sync_to_async로 실행된 부분은 빠짐)
+        > admin 확인(DB 조회)과 파일 저장은 sync_to_async로 실행
+    """
+
+    def __init__(self, get_response):
+        config = {**DEFAULTS, **getattr(settings, 'REQUEST_PROFILING', {})}
+        if not config['ENABLED']:
+            raise MiddlewareNotUsed()
+
+        super().__init__(get_response)
+        self.config       = config
+        self.header       = 'HTTP_' + config['HEADER'].upper().replace('-', '_')
+        self.flag         = config['QUERY_FLAG'] + '='
+        self.directory    = Path(config['DIRECTORY'])
+
+    def requested(self, request) -> bool:
+        return self.header in request.META or self.flag in request.META.get('QUERY_STRING', '')
+
+    def sampled(self, trigger) -> bool:
+        return trigger is not None and random.random() < self.config['SAMPLE_RATE']
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        if not self.requested(request):
+            return self.get_response(request)
+
+        trigger = self.trigger(request, request.META.get(self.header))
+        if not self.sampled(trigger):
+            return self.get_response(request)
+        return self.profile(request, trigger)
+
+    async def __acall__(self, request):
+        if not self.requested(request):
+            return await self.get_response(request)
+
+        trigger = await sync_to_async(self.trigger)(request, request.META.get(self.header))
+        if not self.sampled(trigger):
+            return await self.get_response(request)
+
+        profiler, started, cpu = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            elapsed, cpu = self.stop(profiler, started, cpu)
+        return await sync_to_async(self.save)(request, response, trigger, profiler, elapsed, cpu)
+
+    def trigger(self, request, token):
+        """
+        프로파일링을 요청한 주체(label), 서명이 잘못되었거나 만료된 헤더, admin이 아닌 유저의 플래그는 None
+        """
+        if token is not None:
+            try:
+                return signing.loads(token, salt=self.config['SALT'], max_age=self.config['MAX_AGE'])['label'] or 'header'
+            except (signing.BadSignature, KeyError, TypeError):
+                logger.warning('invalid profile token for %s %s', request.method, request.path)
+                return None
+
+        if request.GET.get(self.config['QUERY_FLAG']) not in ('1', 'true'):
+            return None
+        user = self.authenticate(request)
+        return f'admin:{user.pk}' if user is not None and user.is_staff else None
+
+    def authenticate(self, request):
+        """
+        DRF 인증 클래스(DEFAULT_AUTHENTICATION_CLASSES)로 유저 확인, 쿼리 플래그가 있는 요청에서만 호출
+        """
+        for authentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+            try:
+                result = authentication().authenticate(request)
+            except APIException:
+                return None
+            if result is not None:
+                return result[0]
+        return None
+
+    def start(self):
+        profiler = cProfile.Profile()
+        started  = time.perf_counter()
+        cpu      = time.thread_time()
+        profiler.enable()
+        return profiler, started, cpu
+
+    def stop(self, profiler, started, cpu):
+        """
+        (전체 시간, CPU 시간), 프로파일링을 시작한 스레드에서 호출
+        """
+        profiler.disable()
+        return time.perf_counter() - started, time.thread_time() - cpu
+
+    def profile(self, request, trigger):
+        profiler, started, cpu = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            elapsed, cpu = self.stop(profiler, started, cpu)
+        return self.save(request, response, trigger, profiler, elapsed, cpu)
+
+    def save(self, request, response, trigger, profiler, elapsed, cpu):
+        """
+        <id>.prof, <id>.json 저장 후 응답 헤더에 X-Profile-Id 추가
+        """
+        name  = f'{time.time_ns():020d}-{os.getpid()}'
+        stats = getattr(request, 'request_stats', None)
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.directory / f'{name}.prof')
+            (self.directory / f'{name}.json').write_text(json.dumps({
+                'trigger'    : trigger,
+                'method'     : request.method,
+                'path'       : request.path,
+                'route'      : metrics.route_of(request),
+                'status'     : response.status_code,
+                'duration_ms': round(elapsed * 1000, 3),
+                'cpu_ms'     : round(cpu * 1000, 3),
+                **(stats.as_dict() if stats is not None else {}),
+            }, ensure_ascii=False))
+            self.rotate()
+        except OSError:
+            logger.exception('failed to write profile %s', name)
+            return response
+
+        response['X-Profile-Id'] = name
+        return response
+
+    def rotate(self) -> None:
+        """
+        최근 MAX_FILES개의 프로파일만 유지(이름이 고정 길이 시각으로 시작하므로 이름 순서 = 생성 순서)
+        """
+        profiles = sorted(self.directory.glob('*.prof'))
+        for path in profiles[:-self.config['MAX_FILES'] or None]:
+            for stale in (path, path.with_suffix('.json')):
+                try:
+                    stale.unlink()
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,52 @@
+import jwt
+
+from rest_framework_simplejwt.settings import api_settings
+
+from core.db.routers      import read_your_writes, start_routing, finish_routing
+from core.middleware.base import AsyncCapableMiddleware
+
+
+class ReadYourWritesMiddleware(AsyncCapableMiddleware):
+    """
+    detail:
+      - 요청마다 DB 라우팅 상태(core.db.routers)를 초기화
+      - Authorization 헤더의 access 토큰으로 유저를 확인해 로그인/로그아웃 직후이면 primary에서 읽음
+        > 라우팅 결정에만 사용하므로 서명은 확인하지 않음(인증은 JWTAuthentication에서 처리)
+      - replica가 설정되지 않은 경우 토큰을 읽지 않음
+      - 라우팅 상태는 contextvar이므로 비동기 체인에서 sync_to_async로 실행되는 쿼리에도 적용됨
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.prefixes     = tuple(f'{header_type} ' for header_type in api_settings.AUTH_HEADER_TYPES)
+
+    def user_id_of(self, request):
+        header = request.META.get(api_settings.AUTH_HEADER_NAME, '')
+        if not header.startswith(self.prefixes):
+            return None
+        try:
+            payload = jwt.decode(header.split(' ', 1)[1], options={'verify_signature': False})
+        except jwt.InvalidTokenError:
+            return None
+        return payload.get(api_settings.USER_ID_CLAIM)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        token = start_routing()
+        try:
+            if read_your_writes.enabled:
+                read_your_writes.activate(self.user_id_of(request))
+            return self.get_response(request)
+        finally:
+            finish_routing(token)
+
+    async def __acall__(self, request):
+        token = start_routing()
+        try:
+            if read_your_writes.enabled:
+                await read_your_writes.aactivate(self.user_id_of(request))
+            return await self.get_response(request)
+        finally:
+            finish_routing(token)
@@ -0,0 +1,87 @@
+from django.conf                    import settings
+from django.core.exceptions         import MiddlewareNotUsed
+from django.core.handlers.base      import BaseHandler
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading    import import_string
+
+from core.middleware.base import AsyncCapableMiddleware
+
+
+DEFAULTS = {
+    'BYPASS_PREFIXES': ('/api/', '/metrics'),
+    'MIDDLEWARE'     : [],
+}
+
+
+class RouteScopedMiddleware(AsyncCapableMiddleware):
+    """
+    detail:
+      - ROUTE_SCOPED_MIDDLEWARE MIDDLEWARE(세션, 메시지 등)를 이 위치에 감싸서 실행
+        > 요청 경로가 BYPASS_PREFIXES로 시작하면(JWT 인증만 사용하는 API 등) 감싼 미들웨어를 거치지 않음
+        > 그 외 경로(admin 등)는 MIDDLEWARE 설정에 직접 나열한 것과 같은 순서로 실행
+      - 감싼 미들웨어의 process_view / process_exception / process_template_response도 같은 조건으로 호출
+      - 감싼 체인은 BaseHandler.load_middleware와 같은 방식으로 동기/비동기를 맞춤
+        > 비동기 체인에서 동기 전용 미들웨어만 sync_to_async로 감쌈(세션, 메시지 등 Django 미들웨어는 모두 비동기 지원)
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        config          = {**DEFAULTS, **getattr(settings, 'ROUTE_SCOPED_MIDDLEWARE', {})}
+        self.prefixes   = tuple(config['BYPASS_PREFIXES'])
+        self.middleware = []
+
+        adapt                     = BaseHandler().adapt_method_mode
+        handler, handler_is_async = get_response, self.is_async
+        for path in reversed(config['MIDDLEWARE']):
+            factory = import_string(path)
+            if handler_is_async or not getattr(factory, 'sync_capable', True):
+                is_async = getattr(factory, 'async_capable', False)
+            else:
+                is_async = False
+            adapted = adapt(is_async, handler, handler_is_async)
+            try:
+                middleware = factory(adapted)
+            except MiddlewareNotUsed:
+                continue
+            self.middleware.insert(0, middleware)
+            handler, handler_is_async = convert_exception_to_response(middleware), is_async
+        self.scoped = adapt(self.is_async, handler, handler_is_async)
+
+        self.view_hooks      = [m.process_view for m in self.middleware if hasattr(m, 'process_view')]
+        self.template_hooks  = [m.process_template_response for m in reversed(self.middleware) if hasattr(m, 'process_template_response')]
+        self.exception_hooks = [m.process_exception for m in reversed(self.middleware) if hasattr(m, 'process_exception')]
+
+    def bypassed(self, request) -> bool:
+        return request.path_info.startswith(self.prefixes)
+
+    def __call__(self, request):
+        """
+        비동기 체인에서는 get_response, scoped 모두 코루틴 함수이므로 반환한 코루틴을 그대로 전달
+        """
+        if self.bypassed(request):
+            return self.get_response(request)
+        return self.scoped(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.bypassed(request):
+            return None
+        for hook in self.view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if not self.bypassed(request):
+            for hook in self.template_hooks:
+                response = hook(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        if self.bypassed(request):
+            return None
+        for hook in self.exception_hooks:
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
@@ -0,0 +1,41 @@
+import io, re, codecs
+
+from django.conf import settings
+
+from rest_framework.parsers import JSONParser
+
+from core.renderers import FastJSONRenderer, orjson
+
+
+"""
+orjson은 64비트를 넘는 정수를 float으로 읽으므로(표준 json은 int) 긴 숫자가 있으면 표준 json으로 파싱
+"""
+LONG_NUMBER = re.compile(rb'\d{19}')
+
+
+class FastJSONParser(JSONParser):
+    """
+    detail:
+      - DRF JSONParser와 같은 결과를 orjson으로 파싱
+      - 다음 경우에는 DRF JSONParser(표준 json)로 파싱
+        > orjson이 설치되지 않은 경우, 요청 인코딩이 UTF-8이 아닌 경우
+        > 19자리 이상의 숫자가 포함된 경우
+        > orjson이 파싱할 수 없는 경우(잘못된 JSON, NaN 등), 오류 메시지도 JSONParser와 같음
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding       = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if orjson is None or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if not LONG_NUMBER.search(body):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+        return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,54 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def is_plain(data) -> bool:
+    """
+    문자열, 정수, None과 이들로 이루어진 dict(문자열 키)/list/tuple이면 True
+    이 값들은 orjson과 표준 json의 출력이 같음(float 표기, NaN 처리, datetime 등의 변환은 서로 다름)
+    """
+    if isinstance(data, dict):
+        return all(isinstance(key, str) and is_plain(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return all(is_plain(item) for item in data)
+    return data is None or isinstance(data, (str, int))
+
+
+LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    detail:
+      - DRF JSONRenderer와 바이트 단위로 같은 응답을 orjson으로 렌더링
+        > 한글 등은 이스케이프하지 않음(UNICODE_JSON), 공백 없는 구분자(COMPACT_JSON), \\u2028/\\u2029 이스케이프
+      - 다음 경우에는 DRF JSONRenderer(표준 json)로 렌더링
+        > orjson이 설치되지 않은 경우
+        > indent 요청(Accept: application/json; indent=4, Browsable API), UNICODE_JSON/COMPACT_JSON 설정 변경
+        > 문자열, 정수, None 이외의 값(float, datetime, Decimal 등)이 포함된 응답(is_plain)
+        > orjson으로 렌더링할 수 없는 값(64비트 초과 정수)
+    """
+
+    def __init__(self):
+        self.fast = orjson is not None and not self.ensure_ascii and self.compact
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            not self.fast or data is None or not is_plain(data)
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for separator, escaped in LINE_SEPARATORS:
+            if separator in ret:
+                ret = ret.replace(separator, escaped)
+        return ret
@@ -0,0 +1,198 @@
+import math, time, threading
+
+from typing import Callable, Dict, Optional
+
+from asgiref.sync      import sync_to_async
+from django.conf       import settings
+from django.core.cache import caches
+
+from rest_framework.exceptions import APIException
+
+from core.utils import metrics
+
+
+DEFAULTS = {
+    'ENABLED'          : True,
+    'NAME'             : 'kakao',
+    'WINDOW'           : 10,
+    'MIN_CALLS'        : 20,
+    'ERROR_RATE'       : 0.5,
+    'SLOW_CALL_SECONDS': 1.0,
+    'SLOW_RATE'        : 0.8,
+    'OPEN_SECONDS'     : 10,
+    'PROBE_TIMEOUT'    : 5,
+    'CACHE_ALIAS'      : 'default',
+}
+
+CLOSED, HALF_OPEN, OPEN = 'closed', 'half_open', 'open'
+
+
+class CircuitOpen(APIException):
+    """
+    DRF 예외 처리에서 503 + Retry-After(wait) 헤더로 응답
+    """
+    status_code    = 503
+    default_detail = '카카오 로그인이 일시적으로 원활하지 않습니다. 잠시 후 다시 시도해 주세요.'
+    default_code   = 'upstream_unavailable'
+
+    def __init__(self, wait: float):
+        super().__init__()
+        self.wait = max(1, math.ceil(wait))
+
+
+class CircuitBreaker:
+    """
+    detail:
+      - 카카오 API 장애/지연 시 타임아웃까지 기다리지 않고 즉시 실패(CircuitOpen)하도록 차단
+      - closed   : 정상 호출, 최근 WINDOW 초 동안 호출이 MIN_CALLS 이상이고
+                   실패 비율 >= ERROR_RATE 또는 느린 호출(SLOW_CALL_SECONDS 이상) 비율 >= SLOW_RATE 이면 open
+      - open     : OPEN_SECONDS 동안 호출하지 않고 CircuitOpen
+      - half_open: open 이후 확인 요청(probe) 하나만 호출, 성공하면 closed, 실패하면 다시 open
+      - open/half_open 상태와 probe 잠금은 캐시(CACHES)에 저장해 모든 워커가 공유
+        > 실패 비율은 워커별로 집계(호출마다 캐시에 쓰지 않음), 한 워커가 open 하면 모든 워커에 적용
+        > 워커 간 공유 캐시(Redis)가 필요, 워커별 캐시(LocMemCache)이면 시스템 체크 오류(core.checks)
+      - 비동기 경로(AsyncKakaoClient)는 abefore_call/arecord 사용, 캐시 호출이 이벤트 루프를 막지 않음
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config  = {**DEFAULTS, **(config or {})}
+        self.name    = self.config['NAME']
+        self._lock   = threading.Lock()
+        self._window = {}
+
+    @classmethod
+    def from_settings(cls) -> 'CircuitBreaker':
+        return cls(getattr(settings, 'KAKAO_CIRCUIT_BREAKER', None))
+
+    @property
+    def enabled(self) -> bool:
+        return self.config['ENABLED']
+
+    @property
+    def cache(self):
+        return caches[self.config['CACHE_ALIAS']]
+
+    @property
+    def open_key(self) -> str:
+        return f'circuit:{self.name}:open-until'
+
+    @property
+    def probe_key(self) -> str:
+        return f'circuit:{self.name}:probe'
+
+    def state(self) -> str:
+        open_until = self.cache.get(self.open_key)
+        if open_until is None:
+            return CLOSED
+        return OPEN if time.time() < open_until else HALF_OPEN
+
+    def before_call(self) -> bool:
+        """
+        호출 전 확인, open이면 CircuitOpen
+        반환값: half_open 상태의 확인 요청(probe)인지 여부
+        """
+        if not self.enabled or not self._admit(self.cache.get(self.open_key)):
+            return False
+        return self._probe(self.cache.add(self.probe_key, 1, self.config['PROBE_TIMEOUT']))
+
+    async def abefore_call(self) -> bool:
+        """
+        before_call의 비동기 버전(캐시 비동기 API 사용)
+        """
+        if not self.enabled or not self._admit(await self.cache.aget(self.open_key)):
+            return False
+        return self._probe(await self.cache.aadd(self.probe_key, 1, self.config['PROBE_TIMEOUT']))
+
+    def _admit(self, open_until: Optional[float]) -> bool:
+        """
+        closed이면 False, open이면 CircuitOpen, half_open이면 True(probe 잠금 필요)
+        """
+        if open_until is None:
+            metrics.observe_circuit(self.name, CLOSED)
+            return False
+
+        now = time.time()
+        if now < open_until:
+            metrics.observe_circuit(self.name, OPEN, rejected=True)
+            raise CircuitOpen(open_until - now)
+        return True
+
+    def _probe(self, acquired: bool) -> bool:
+        if acquired:
+            metrics.observe_circuit(self.name, HALF_OPEN)
+            return True
+
+        metrics.observe_circuit(self.name, HALF_OPEN, rejected=True)
+        raise CircuitOpen(1)
+
+    def record(self, elapsed: float, failed: bool, probe: bool = False) -> None:
+        transition = self._transition(elapsed, failed, probe)
+        if transition is not None:
+            transition()
+
+    async def arecord(self, elapsed: float, failed: bool, probe: bool = False) -> None:
+        """
+        record의 비동기 버전, 상태 전환(trip/close)이 필요한 경우에만 스레드에서 캐시에 씀
+        """
+        transition = self._transition(elapsed, failed, probe)
+        if transition is not None:
+            await sync_to_async(transition)()
+
+    def _transition(self, elapsed: float, failed: bool, probe: bool) -> Optional[Callable[[], None]]:
+        """
+        호출 결과를 집계하고 필요한 상태 전환(trip/close)을 반환, 캐시는 사용하지 않음
+        """
+        if not self.enabled:
+            return None
+
+        slow = elapsed >= self.config['SLOW_CALL_SECONDS']
+        if probe:
+            return self.trip if failed or slow else self.close
+
+        now    = int(time.monotonic())
+        oldest = now - self.config['WINDOW']
+        with self._lock:
+            bucket     = self._window.setdefault(now, [0, 0, 0])
+            bucket[0] += 1
+            bucket[1] += int(failed)
+            bucket[2] += int(slow)
+
+            for second in [second for second in self._window if second <= oldest]:
+                del self._window[second]
+
+            calls, failures, slows = (sum(column) for column in zip(*self._window.values()))
+
+        if not (failed or slow) or calls < self.config['MIN_CALLS']:
+            return None
+        if failures / calls >= self.config['ERROR_RATE'] or slows / calls >= self.config['SLOW_RATE']:
+            return self.trip
+        return None
+
+    def trip(self) -> None:
+        """
+        open 상태로 전환, 오래 사용되지 않은 open 상태는 캐시 만료로 closed
+        """
+        self.cache.set(self.open_key, time.time() + self.config['OPEN_SECONDS'], self.config['OPEN_SECONDS'] * 6)
+        self.cache.delete(self.probe_key)
+        with self._lock:
+            self._window = {}
+        metrics.observe_circuit(self.name, OPEN, transition=True)
+
+    def close(self) -> None:
+        self.cache.delete_many([self.open_key, self.probe_key])
+        with self._lock:
+            self._window = {}
+        metrics.observe_circuit(self.name, CLOSED, transition=True)
+
+    def reset(self) -> None:
+        self.cache.delete_many([self.open_key, self.probe_key])
+        with self._lock:
+            self._window = {}
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            totals = [sum(column) for column in zip(*self._window.values())] or [0, 0, 0]
+        return {'state': self.state(), 'calls': totals[0], 'failures': totals[1], 'slow_calls': totals[2]}
+
+
+kakao_breaker = CircuitBreaker.from_settings()
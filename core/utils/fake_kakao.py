@@ -0,0 +1,272 @@
+"""
+로컬 테스트/부하 테스트용 카카오 유저정보 API(/v2/user/me) 대체 서버
+
+    python -m core.utils.fake_kakao --port 8081 --latency lognormal:0.08,0.5 --error-rate 0.01
+    KAKAO_API_URL=http://127.0.0.1:8081 python manage.py runserver
+
+- asyncio 기반 HTTP/1.1 서버(keep-alive 지원), 추가 의존성 없음
+- Bearer 토큰으로 유저정보를 결정적으로 생성
+  > 토큰이 숫자로 끝나면(예: bench-42) 해당 숫자를 카카오 id로 사용, 아니면 토큰 해시로 생성
+- 장애 주입(비율은 SEED로 재현 가능)
+  > LATENCY       : 응답 지연 분포(fixed:s, uniform:a,b, normal:mean,stddev, lognormal:median,sigma, exponential:mean)
+  > ERROR_RATE    : ERROR_STATUS(기본 503) 응답
+  > UNAUTHORIZED_RATE: code -401 응답(만료/잘못된 토큰)
+  > SLOW_RATE     : 응답 본문을 SLOW_CHUNK 바이트씩 SLOW_CHUNK_DELAY 초 간격으로 전송(slow-loris)
+  > RESET_RATE    : 응답 없이 커넥션 리셋(RST)
+- 토큰 접두어로 요청별 장애를 지정할 수 있음(테스트용): fault-401-, fault-error-, fault-slow-, fault-reset-
+"""
+import re, json, math, random, socket, struct, asyncio, hashlib, argparse, threading
+
+from contextlib import contextmanager
+from typing     import Dict, Optional, Tuple
+
+
+DEFAULTS = {
+    'LATENCY'          : 'fixed:0',
+    'ERROR_RATE'       : 0.0,
+    'ERROR_STATUS'     : 503,
+    'UNAUTHORIZED_RATE': 0.0,
+    'SLOW_RATE'        : 0.0,
+    'SLOW_CHUNK'       : 16,
+    'SLOW_CHUNK_DELAY' : 0.5,
+    'RESET_RATE'       : 0.0,
+    'SEED'             : None,
+}
+
+PATH = '/v2/user/me'
+
+REASONS = {200: 'OK', 401: 'Unauthorized', 404: 'Not Found', 500: 'Internal Server Error', 502: 'Bad Gateway', 503: 'Service Unavailable', 504: 'Gateway Timeout'}
+
+FAULT_PREFIXES = {
+    'fault-401-'  : 'unauthorized',
+    'fault-error-': 'error',
+    'fault-slow-' : 'slow',
+    'fault-reset-': 'reset',
+}
+
+
+def parse_latency(spec: str):
+    """
+    'lognormal:0.08,0.5' -> (rng -> 지연시간(초)) 함수
+    """
+    name, _, params = spec.partition(':')
+    args = [float(value) for value in params.split(',') if value]
+
+    distributions = {
+        'fixed'      : lambda rng: args[0],
+        'uniform'    : lambda rng: rng.uniform(args[0], args[1]),
+        'normal'     : lambda rng: rng.gauss(args[0], args[1]),
+        'lognormal'  : lambda rng: rng.lognormvariate(math.log(args[0]), args[1]),
+        'exponential': lambda rng: rng.expovariate(1 / args[0]),
+    }
+    if name not in distributions:
+        raise ValueError(f'unknown latency distribution: {spec}')
+    sample = distributions[name]
+    return lambda rng: max(0.0, sample(rng))
+
+
+def kakao_id_of(token: str) -> int:
+    match = re.search(r'(\d+)$', token)
+    if match:
+        return int(match.group(1))
+    return int.from_bytes(hashlib.sha256(token.encode()).digest()[:5], 'big')
+
+
+def profile_of(token: str) -> Dict[str, object]:
+    kakao_id = kakao_id_of(token)
+    return {
+        'id'          : kakao_id,
+        'connected_at': '2022-01-01T00:00:00Z',
+        'properties'  : {'nickname': f'user-{kakao_id}'},
+        'kakao_account': {
+            'profile_nickname_needs_agreement': False,
+            'profile'                         : {'nickname': f'user-{kakao_id}'},
+            'has_email'                       : True,
+            'email_needs_agreement'           : False,
+            'is_email_valid'                  : True,
+            'is_email_verified'               : True,
+            'email'                           : f'user-{kakao_id}@example.com',
+        },
+    }
+
+
+class FakeKakaoServer:
+    """
+    detail:
+      - start()/close()로 현재 이벤트 루프에서 실행, running()으로 별도 스레드에서 실행(동기 테스트/벤치마크)
+      - stats: 결과(ok, unauthorized, error, slow, reset, not_found)별 요청 수
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config   = {**DEFAULTS, **(config or {})}
+        self.latency  = parse_latency(self.config['LATENCY'])
+        self.rng      = random.Random(self.config['SEED'])
+        self.stats    = dict.fromkeys(('ok', 'unauthorized', 'error', 'slow', 'reset', 'not_found'), 0)
+        self.server   = None
+        self.url      = None
+        self.handlers = {}
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> 'FakeKakaoServer':
+        self.server = await asyncio.start_server(self.handle, host, port)
+        host, port  = self.server.sockets[0].getsockname()[:2]
+        self.url    = f'http://{host}:{port}'
+        return self
+
+    async def close(self) -> None:
+        """
+        클라이언트가 유지 중인 keep-alive 커넥션도 함께 종료
+        """
+        self.server.close()
+        for writer in self.handlers:
+            writer.close()
+        await asyncio.gather(*self.handlers.values(), return_exceptions=True)
+        await self.server.wait_closed()
+
+    def choose_fault(self, token: str) -> Optional[str]:
+        for prefix, fault in FAULT_PREFIXES.items():
+            if token.startswith(prefix):
+                return fault
+
+        roll = self.rng.random()
+        for fault, rate in (
+            ('reset', self.config['RESET_RATE']),
+            ('error', self.config['ERROR_RATE']),
+            ('unauthorized', self.config['UNAUTHORIZED_RATE']),
+            ('slow', self.config['SLOW_RATE']),
+        ):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    async def read_request(self, reader) -> Tuple[str, Dict[str, str]]:
+        head  = await reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        method, path, _ = lines[0].split(' ', 2)
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+        if int(headers.get('content-length') or 0):
+            await reader.readexactly(int(headers['content-length']))
+        return path.split('?', 1)[0], headers
+
+    def respond(self, path: str, headers: Dict[str, str]) -> Tuple[str, int, dict]:
+        if path != PATH:
+            return 'not_found', 404, {'msg': 'not found', 'code': -404}
+
+        token = headers.get('authorization', '').partition(' ')[2]
+        fault = self.choose_fault(token) if token else 'unauthorized'
+
+        if fault == 'unauthorized':
+            return fault, 401, {'msg': 'this access token does not exist', 'code': -401}
+        if fault == 'error':
+            return fault, self.config['ERROR_STATUS'], {'msg': 'service unavailable', 'code': -9798}
+        return fault or 'ok', 200, profile_of(token)
+
+    async def handle(self, reader, writer) -> None:
+        self.handlers[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    path, headers = await self.read_request(reader)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+                    return
+
+                await asyncio.sleep(self.latency(self.rng))
+                outcome, status, payload = self.respond(path, headers)
+                self.stats[outcome] += 1
+
+                if outcome == 'reset':
+                    sock = writer.get_extra_info('socket')
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                    writer.transport.abort()
+                    return
+
+                body       = json.dumps(payload).encode()
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write((
+                    f'HTTP/1.1 {status} {REASONS.get(status, "")}\r\n'
+                    f'Content-Type: application/json;charset=UTF-8\r\n'
+                    f'Content-Length: {len(body)}\r\n'
+                    f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+                ).encode())
+
+                if outcome == 'slow':
+                    for offset in range(0, len(body), self.config['SLOW_CHUNK']):
+                        writer.write(body[offset:offset + self.config['SLOW_CHUNK']])
+                        await writer.drain()
+                        await asyncio.sleep(self.config['SLOW_CHUNK_DELAY'])
+                else:
+                    writer.write(body)
+                    await writer.drain()
+
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            self.handlers.pop(writer, None)
+            if not writer.is_closing():
+                writer.close()
+
+    @contextmanager
+    def running(self, host: str = '127.0.0.1', port: int = 0):
+        """
+        별도 스레드의 이벤트 루프에서 서버를 실행
+
+            with FakeKakaoServer({'LATENCY': 'fixed:0.05'}).running() as server:
+                KakaoClient({'BASE_URL': server.url}).get('/v2/user/me', headers=...)
+        """
+        loop   = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.start(host, port), loop).result()
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--latency', default=DEFAULTS['LATENCY'])
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=DEFAULTS['ERROR_STATUS'])
+    parser.add_argument('--unauthorized-rate', type=float, default=0.0)
+    parser.add_argument('--slow-rate', type=float, default=0.0)
+    parser.add_argument('--slow-chunk-delay', type=float, default=DEFAULTS['SLOW_CHUNK_DELAY'])
+    parser.add_argument('--reset-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    server = FakeKakaoServer({
+        'LATENCY'          : args.latency,
+        'ERROR_RATE'       : args.error_rate,
+        'ERROR_STATUS'     : args.error_status,
+        'UNAUTHORIZED_RATE': args.unauthorized_rate,
+        'SLOW_RATE'        : args.slow_rate,
+        'SLOW_CHUNK_DELAY' : args.slow_chunk_delay,
+        'RESET_RATE'       : args.reset_rate,
+        'SEED'             : args.seed,
+    })
+
+    async def serve():
+        await server.start(args.host, args.port)
+        print(f'fake kakao API listening on {server.url}{PATH}', flush=True)
+        await server.server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,28 +1,89 @@
-import requests
-
 from typing import Tuple, Any
 
-from core.utils.api_config import URL, VERSION, DATA, TARGET
+from core.utils.api_config      import VERSION, DATA, TARGET
+from core.utils.circuit_breaker import CircuitOpen
+from core.utils.kakao_client    import kakao_client, async_kakao_client
+from core.utils.kakao_cache     import profile_cache, hash_token, MISSING
+from core.utils.singleflight    import AsyncSingleFlight
+
+
+"""
+비동기 로그인: 같은 카카오 액세스 토큰의 동시 조회는 카카오 API를 한 번만 호출
+(동기 로그인은 users.utils.kakao_signin.token_flight에서 로그인 전체를 공유)
+"""
+async_flight = AsyncSingleFlight()
 
 
 class GetKakaoAccount:
     
+    path = '/{}/{}/{}'.format(
+        VERSION,
+        DATA,
+        TARGET
+    )
+    
     def get_kakao_user_account_n_check_err(token: object) -> Tuple[Any, str]:
+        cached = profile_cache.get(token)
+        if cached is not MISSING:
+            return cached
+        
         headers = {
             'Authorization': f'Bearer {token}'
         }
-        url = URL + '/{}/{}/{}'.format(
-            VERSION,
-            DATA,
-            TARGET
-        )
         try:
-            res  = requests.get(url, headers=headers, timeout=3)
+            res  = kakao_client.get(GetKakaoAccount.path, headers=headers)
             data = res.json() 
+        except CircuitOpen:
+            raise
         except:
             return None, '카카오 계정의 유저정보 요청시간이 초과되었습니다.'
-            
-        if data.get('code') == -401:
-            return None, '카카오 계정의 유저정보를 가져올 수 없습니다.'
         
-        return data, None
\ No newline at end of file
+        return GetKakaoAccount.check_err(token, data, res.status_code)
+    
+    async def aget_kakao_user_account_n_check_err(token: object) -> Tuple[Any, str]:
+        """
+        비동기 로그인(kakao_signin_async_view)에서 사용
+        """
+        cached = await profile_cache.aget(token)
+        if cached is not MISSING:
+            return cached
+        
+        result, _ = await async_flight.do(hash_token(token), lambda: GetKakaoAccount.afetch(token))
+        return result
+    
+    async def afetch(token: object) -> Tuple[Any, str]:
+        headers = {
+            'Authorization': f'Bearer {token}'
+        }
+        try:
+            res  = await async_kakao_client.get(GetKakaoAccount.path, headers=headers)
+            data = res.json()
+        except CircuitOpen:
+            raise
+        except:
+            return None, '카카오 계정의 유저정보 요청시간이 초과되었습니다.'
+        
+        result, cacheable = GetKakaoAccount.classify(data, res.status_code)
+        if cacheable:
+            await profile_cache.aset(token, result)
+        return result
+    
+    def check_err(token: object, data: dict, status: int) -> Tuple[Any, str]:
+        result, cacheable = GetKakaoAccount.classify(data, status)
+        if cacheable:
+            profile_cache.set(token, result)
+        return result
+    
+    def classify(data: dict, status: int) -> Tuple[Tuple[Any, str], bool]:
+        """
+        detail:
+          - 카카오 API 응답 -> (조회결과, 캐싱 여부)
+          - 캐싱: 정상 조회결과(HTTP 200, id 포함), 실패 결과(code == -401, 만료/잘못된 토큰)
+          - 그 외 오류(5xx 재시도 후에도 실패한 응답의 code -1/-7/-9798 등)는 일시적일 수 있으므로 캐싱하지 않음
+        """
+        if status == 200 and 'id' in data:
+            return (data, None), True
+        elif data.get('code') == -401:
+            return (None, '카카오 계정의 유저정보를 가져올 수 없습니다.'), True
+        else:
+            return (None, '카카오 계정의 유저정보를 가져올 수 없습니다.'), False
\ No newline at end of file
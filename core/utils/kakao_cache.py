@@ -0,0 +1,209 @@
+import time, hashlib, threading
+
+from collections import OrderedDict
+from typing      import Any, Dict, Optional, Tuple
+
+from django.conf       import settings
+from django.core.cache import caches
+
+
+DEFAULTS = {
+    'BACKEND'    : 'local',
+    'TTL'        : 10,
+    'ERROR_TTL'  : 2,
+    'MAX_ENTRIES': 10000,
+    'CACHE_ALIAS': 'default',
+    'KEY_PREFIX' : 'kakao-profile',
+}
+
+MISSING = object()
+
+
+def hash_token(token: object) -> str:
+    """
+    카카오 액세스 토큰 원문은 캐시 키로 사용하지 않음
+    """
+    return hashlib.sha256(str(token).encode()).hexdigest()
+
+
+class CacheStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits      = 0
+            self.misses    = 0
+            self.evictions = 0
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits'     : self.hits,
+                'misses'   : self.misses,
+                'evictions': self.evictions,
+            }
+
+
+class LocalProfileCache:
+    """
+    detail:
+      - 프로세스(워커) 내부 TTL/LRU 캐시
+      - MAX_ENTRIES를 넘으면 가장 오래 사용되지 않은 항목부터 제거(eviction)
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.stats  = CacheStats()
+        self._data  = OrderedDict()
+        self._lock  = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.stats.incr('misses')
+                return MISSING
+            self._data.move_to_end(key)
+        self.stats.incr('hits')
+        return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.config['MAX_ENTRIES']:
+                self._data.popitem(last=False)
+                self.stats.incr('evictions')
+
+    async def aget(self, key: str) -> Any:
+        """
+        메모리 조회이므로 이벤트 루프에서 바로 실행(락은 짧게만 점유)
+        """
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: float) -> None:
+        self.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DjangoProfileCache:
+    """
+    detail:
+      - Django 캐시(CACHES)를 사용하는 캐시, 모든 gunicorn 워커가 공유
+        > 워커 간 공유를 위해서는 redis 등 공유 캐시 백엔드를 CACHES에 설정해야 함
+      - 항목 제거(eviction)는 캐시 서버가 처리하므로 hit/miss만 집계
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.stats  = CacheStats()
+
+    @property
+    def cache(self):
+        return caches[self.config['CACHE_ALIAS']]
+
+    def make_key(self, key: str) -> str:
+        return f"{self.config['KEY_PREFIX']}:{key}"
+
+    def get(self, key: str) -> Any:
+        value = self.cache.get(self.make_key(key), MISSING)
+        self.stats.incr('misses' if value is MISSING else 'hits')
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.cache.set(self.make_key(key), value, ttl)
+
+    async def aget(self, key: str) -> Any:
+        value = await self.cache.aget(self.make_key(key), MISSING)
+        self.stats.incr('misses' if value is MISSING else 'hits')
+        return value
+
+    async def aset(self, key: str, value: Any, ttl: float) -> None:
+        await self.cache.aset(self.make_key(key), value, ttl)
+
+    def clear(self) -> None:
+        """
+        공유 캐시 전체를 비우지 않도록 통계만 초기화(항목은 TTL로 만료)
+        """
+        self.stats.reset()
+
+
+class KakaoProfileCache:
+    """
+    detail:
+      - 카카오 액세스 토큰(해시) -> 유저정보 조회결과 캐시
+      - 정상 조회결과는 TTL, 실패 결과(code == -401)는 ERROR_TTL 동안 캐싱
+        > 타임아웃 등 일시적 오류는 캐싱하지 않음
+      - 비동기 로그인에서는 aget/aset 사용(Django 캐시 백엔드 조회가 이벤트 루프를 막지 않도록)
+    """
+
+    BACKENDS = {
+        'local' : LocalProfileCache,
+        'django': DjangoProfileCache,
+    }
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config  = {**DEFAULTS, **(config or {})}
+        backend      = self.config['BACKEND']
+        self.backend = self.BACKENDS[backend](self.config) if backend else None
+
+    @classmethod
+    def from_settings(cls) -> 'KakaoProfileCache':
+        return cls(getattr(settings, 'KAKAO_PROFILE_CACHE', None))
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, token: object) -> Any:
+        if not self.enabled:
+            return MISSING
+        return self.backend.get(hash_token(token))
+
+    def set(self, token: object, result: Tuple[Any, str]) -> None:
+        if not self.enabled:
+            return
+        ttl = self.config['ERROR_TTL'] if result[1] else self.config['TTL']
+        self.backend.set(hash_token(token), result, ttl)
+
+    async def aget(self, token: object) -> Any:
+        if not self.enabled:
+            return MISSING
+        return await self.backend.aget(hash_token(token))
+
+    async def aset(self, token: object, result: Tuple[Any, str]) -> None:
+        if not self.enabled:
+            return
+        ttl = self.config['ERROR_TTL'] if result[1] else self.config['TTL']
+        await self.backend.aset(hash_token(token), result, ttl)
+
+    def clear(self) -> None:
+        if self.enabled:
+            self.backend.clear()
+            self.backend.stats.reset()
+
+    def snapshot(self) -> Dict[str, int]:
+        return self.backend.stats.snapshot() if self.enabled else {}
+
+
+profile_cache = KakaoProfileCache.from_settings()
@@ -0,0 +1,252 @@
+import os, time, asyncio, weakref, threading, requests
+
+from typing import Dict, Optional
+
+from django.conf import settings
+
+from requests.adapters import HTTPAdapter
+from urllib3.util      import Retry
+
+from core.utils                 import metrics
+from core.utils.api_config      import URL
+from core.utils.circuit_breaker import CircuitBreaker, kakao_breaker
+from core.utils.request_stats   import record_upstream
+
+
+DEFAULTS = {
+    'BASE_URL'        : URL,
+    'POOL_CONNECTIONS': 1,
+    'POOL_MAXSIZE'    : 10,
+    'POOL_BLOCK'      : False,
+    'CONNECT_TIMEOUT' : 1.0,
+    'READ_TIMEOUT'    : 2.0,
+    'MAX_RETRIES'     : 2,
+    'BACKOFF_FACTOR'  : 0.05,
+}
+
+
+class KakaoClientStats:
+    """
+    detail:
+      - 카카오 API 호출별 소요시간 통계
+      - 워커(프로세스) 단위로 누적되며 snapshot()으로 조회
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls         = 0
+            self.errors        = 0
+            self.total_seconds = 0.0
+            self.max_seconds   = 0.0
+            self.last_seconds  = 0.0
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        with self._lock:
+            self.calls         += 1
+            self.errors        += int(failed)
+            self.total_seconds += elapsed
+            self.last_seconds   = elapsed
+            if elapsed > self.max_seconds:
+                self.max_seconds = elapsed
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'calls'   : self.calls,
+                'errors'  : self.errors,
+                'total_ms': self.total_seconds * 1000,
+                'avg_ms'  : self.total_seconds * 1000 / self.calls if self.calls else 0.0,
+                'max_ms'  : self.max_seconds * 1000,
+                'last_ms' : self.last_seconds * 1000,
+            }
+
+
+class KakaoClient:
+    """
+    detail:
+      - 카카오 API 호출은 모두 이 클라이언트를 거쳐야 함
+      - keep-alive 커넥션 풀을 프로세스(워커)마다 하나씩 유지
+        > fork 이후 부모 프로세스의 소켓을 공유하지 않도록 pid가 바뀌면 세션을 새로 생성
+      - connect/read 타임아웃 분리, 멱등 요청(GET)에 한해 제한된 횟수만큼 재시도
+      - breaker(core.utils.circuit_breaker)가 open 상태이면 호출하지 않고 CircuitOpen
+    """
+
+    METRICS_LABEL = 'sync'
+
+    def __init__(self, config: Optional[dict] = None, breaker: Optional[CircuitBreaker] = None):
+        self.config   = {**DEFAULTS, **(config or {})}
+        self.breaker  = breaker
+        self.stats    = KakaoClientStats()
+        self._session = None
+        self._pid     = None
+        self._lock    = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> 'KakaoClient':
+        return cls(getattr(settings, 'KAKAO_API_CLIENT', None), kakao_breaker)
+
+    @property
+    def base_url(self) -> str:
+        return self.config['BASE_URL'].rstrip('/')
+
+    @property
+    def timeout(self):
+        return (self.config['CONNECT_TIMEOUT'], self.config['READ_TIMEOUT'])
+
+    def _build_session(self) -> requests.Session:
+        """
+        read 타임아웃은 이미 read 예산을 모두 소진한 경우이므로 재시도하지 않음
+        """
+        retries = Retry(
+            total            = self.config['MAX_RETRIES'],
+            connect          = self.config['MAX_RETRIES'],
+            read             = 0,
+            status           = self.config['MAX_RETRIES'],
+            backoff_factor   = self.config['BACKOFF_FACTOR'],
+            status_forcelist = (502, 503, 504),
+            allowed_methods  = frozenset({'GET'}),
+            raise_on_status  = False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections = self.config['POOL_CONNECTIONS'],
+            pool_maxsize     = self.config['POOL_MAXSIZE'],
+            pool_block       = self.config['POOL_BLOCK'],
+            max_retries      = retries,
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    self._session = self._build_session()
+                    self._pid     = pid
+        return self._session
+
+    def get(self, path: str, headers: Optional[dict] = None) -> requests.Response:
+        probe   = self.breaker.before_call() if self.breaker else False
+        started = time.perf_counter()
+        failed  = True
+        try:
+            res    = self.session.get(self.base_url + path, headers=headers, timeout=self.timeout)
+            failed = res.status_code >= 500
+            return res
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats.record(elapsed, failed)
+            record_upstream(elapsed)
+            metrics.observe_kakao(self.METRICS_LABEL, elapsed, failed)
+            if self.breaker:
+                self.breaker.record(elapsed, failed, probe)
+
+    def warm_up(self) -> None:
+        """
+        워커 시작 시 호출, 첫 로그인 요청 전에 keep-alive 커넥션(TCP/TLS 핸드셰이크)을 미리 생성
+        """
+        self.session.head(self.base_url, timeout=self.timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._pid     = None
+
+
+class AsyncKakaoClient(KakaoClient):
+    """
+    detail:
+      - ASGI(비동기) 로그인 경로에서 사용하는 카카오 API 클라이언트
+      - 설정값(풀 크기, 타임아웃, 재시도 횟수)과 통계는 동기 클라이언트와 동일하게 사용
+      - httpx.AsyncClient는 이벤트 루프에 묶이므로 루프마다 하나씩 유지(WeakKeyDictionary)
+        > 여러 스레드의 루프가 동시에 사용해도 서로의 클라이언트를 교체하거나 닫지 않음
+        > fork 이후(pid 변경)에는 부모의 클라이언트를 닫지 않고 버림(부모와 소켓을 공유하므로)
+      - 루프 종료 전에 그 루프에서 aclose() 호출(ASGI lifespan shutdown, core.asgi)
+        > 루프가 닫힌 뒤에는 커넥션이 닫힌 루프에 묶여 있어 aclose()를 실행할 수 없음
+        > aclose() 없이 닫힌 루프의 클라이언트는 새 클라이언트를 만들 때 목록에서 제거
+      - httpx는 import 비용이 크므로 WSGI 워커에서는 import 하지 않도록 최초 사용 시 import
+    """
+
+    METRICS_LABEL  = 'async'
+    RETRY_STATUSES = (502, 503, 504)
+
+    def __init__(self, config: Optional[dict] = None, breaker: Optional[CircuitBreaker] = None):
+        super().__init__(config, breaker)
+        self._sessions = weakref.WeakKeyDictionary()
+
+    def _build_session(self) -> 'httpx.AsyncClient':
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections           = self.config['POOL_MAXSIZE'],
+            max_keepalive_connections = self.config['POOL_MAXSIZE'],
+        )
+        timeout = httpx.Timeout(
+            self.config['READ_TIMEOUT'],
+            connect = self.config['CONNECT_TIMEOUT'],
+        )
+        transport = httpx.AsyncHTTPTransport(limits=limits, retries=self.config['MAX_RETRIES'])
+        return httpx.AsyncClient(base_url=self.base_url, timeout=timeout, transport=transport)
+
+    @property
+    def session(self) -> 'httpx.AsyncClient':
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._pid != os.getpid():
+                self._sessions = weakref.WeakKeyDictionary()
+                self._pid      = os.getpid()
+
+            session = self._sessions.get(loop)
+            if session is None:
+                for stale in [other for other in self._sessions if other.is_closed()]:
+                    del self._sessions[stale]
+                session = self._sessions[loop] = self._build_session()
+        return session
+
+    async def get(self, path: str, headers: Optional[dict] = None) -> 'httpx.Response':
+        """
+        httpx 트랜스포트는 connect 오류만 재시도하므로 502/503/504 응답은 직접 재시도
+        """
+        probe   = await self.breaker.abefore_call() if self.breaker else False
+        started = time.perf_counter()
+        failed  = True
+        try:
+            for attempt in range(self.config['MAX_RETRIES'] + 1):
+                res = await self.session.get(path, headers=headers)
+                if res.status_code not in self.RETRY_STATUSES or attempt == self.config['MAX_RETRIES']:
+                    break
+                await asyncio.sleep(self.config['BACKOFF_FACTOR'] * (2 ** attempt))
+            failed = res.status_code >= 500
+            return res
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats.record(elapsed, failed)
+            record_upstream(elapsed)
+            metrics.observe_kakao(self.METRICS_LABEL, elapsed, failed)
+            if self.breaker:
+                await self.breaker.arecord(elapsed, failed, probe)
+
+    async def warm_up(self) -> None:
+        await self.session.head('/')
+
+    async def aclose(self) -> None:
+        """
+        현재 루프의 클라이언트를 닫음, 루프를 종료하기 전에 그 루프에서 호출
+        """
+        with self._lock:
+            session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.aclose()
+
+
+kakao_client       = KakaoClient.from_settings()
+async_kakao_client = AsyncKakaoClient.from_settings()
@@ -0,0 +1,75 @@
+"""
+프로세스(gunicorn 마스터/워커) 메모리 사용량 확인
+
+    python -m core.utils.memory <gunicorn master pid>
+
+- /proc/<pid>/smaps_rollup(리눅스 4.14+, 없으면 /proc/<pid>/smaps 합산)을 읽어 kB 단위로 집계
+  > rss    : 프로세스가 사용 중인 물리 메모리(공유 페이지 포함)
+  > pss    : 공유 페이지를 공유한 프로세스 수로 나눈 값, 워커 pss 합계가 실제 사용량
+  > shared : 다른 프로세스(마스터/다른 워커)와 공유 중인 페이지(preload + copy-on-write)
+  > private: 이 프로세스만 사용하는 페이지
+"""
+import os, sys, json
+
+from typing import Dict, List
+
+
+FIELDS = {
+    'Rss'          : 'rss',
+    'Pss'          : 'pss',
+    'Shared_Clean' : 'shared',
+    'Shared_Dirty' : 'shared',
+    'Private_Clean': 'private',
+    'Private_Dirty': 'private',
+}
+
+
+def parse_smaps(text: str) -> Dict[str, int]:
+    usage = dict.fromkeys(FIELDS.values(), 0)
+    for line in text.splitlines():
+        name, _, value = line.partition(':')
+        if name in FIELDS:
+            usage[FIELDS[name]] += int(value.split()[0])
+    return usage
+
+
+def memory_usage(pid='self') -> Dict[str, int]:
+    """
+    /proc를 읽을 수 없는 환경(리눅스 이외)에서는 빈 dict 반환
+    """
+    for filename in ('smaps_rollup', 'smaps'):
+        try:
+            with open(f'/proc/{pid}/{filename}') as file:
+                return parse_smaps(file.read())
+        except OSError:
+            continue
+    return {}
+
+
+def child_pids(pid) -> List[int]:
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as file:
+            return [int(child) for child in file.read().split()]
+    except OSError:
+        return []
+
+
+def report(master_pid) -> Dict[str, object]:
+    workers = {child: memory_usage(child) for child in child_pids(master_pid)}
+    return {
+        'master' : {master_pid: memory_usage(master_pid)},
+        'workers': workers,
+        'total'  : {
+            field: sum(usage.get(field, 0) for usage in workers.values())
+            for field in ('rss', 'pss', 'shared', 'private')
+        },
+    }
+
+
+def main():
+    master_pid = int(sys.argv[1]) if len(sys.argv) > 1 else os.getpid()
+    print(json.dumps(report(master_pid), indent=2))
+
+
+if __name__ == '__main__':
+    main()
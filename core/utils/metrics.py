@@ -0,0 +1,203 @@
+import os
+
+from typing import Optional, Tuple
+
+from prometheus_client import (
+    REGISTRY, CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+
+"""
+detail:
+  - Prometheus 지표 정의, /metrics(core.views.metrics_view)로 노출
+  - gunicorn 등 여러 워커(프로세스)로 실행하는 경우 PROMETHEUS_MULTIPROC_DIR 환경변수 설정 필요
+    > 워커마다 지표값을 해당 디렉터리의 mmap 파일에 기록하고, 수집 시 모든 파일을 합산
+    > prometheus_client import 전에 설정되어 있어야 하며, 서버 시작 전에 디렉터리를 비워야 함
+  - 라벨 값은 URL 경로가 아닌 route(URL 패턴)를 사용해 라벨 조합 수를 제한
+"""
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+METHODS = frozenset(('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'))
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request latency by URL route',
+    ('route', 'method', 'status'),
+    buckets = LATENCY_BUCKETS,
+)
+DB_QUERIES = Counter(
+    'db_queries_total',
+    'DB queries executed while handling requests',
+    ('route', 'alias'),
+)
+KAKAO_LATENCY = Histogram(
+    'kakao_request_duration_seconds',
+    'Kakao API call latency including retries',
+    ('client',),
+    buckets = LATENCY_BUCKETS,
+)
+KAKAO_ERRORS = Counter(
+    'kakao_request_errors_total',
+    'Kakao API calls that failed (timeout, connection error or 5xx)',
+    ('client',),
+)
+TOKENS = Counter(
+    'auth_tokens_total',
+    'Refresh tokens minted, blacklisted and pruned',
+    ('event',),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections',
+    'Pooled DB connections by state (active, idle)',
+    ('alias', 'state'),
+    multiprocess_mode = 'livesum',
+)
+DB_POOL_WAIT = Histogram(
+    'db_pool_checkout_seconds',
+    'Time to check out a pooled DB connection, including connecting',
+    ('alias',),
+    buckets = POOL_WAIT_BUCKETS,
+)
+DB_POOL_FAILURES = Counter(
+    'db_pool_checkout_failures_total',
+    'Pooled DB connection checkouts that timed out or failed to connect',
+    ('alias',),
+)
+
+CIRCUIT_STATE = Gauge(
+    'circuit_breaker_state',
+    'Circuit breaker state last seen by each worker (0 closed, 1 half-open, 2 open)',
+    ('breaker',),
+    multiprocess_mode = 'liveall',
+)
+CIRCUIT_REJECTED = Counter(
+    'circuit_breaker_rejected_total',
+    'Calls rejected without reaching the upstream because the circuit was open',
+    ('breaker',),
+)
+CIRCUIT_TRANSITIONS = Counter(
+    'circuit_breaker_transitions_total',
+    'Circuit breaker state changes',
+    ('breaker', 'state'),
+)
+
+WRITE_BEHIND_PENDING = Gauge(
+    'write_behind_pending',
+    'Writes queued in memory and not yet flushed to the DB',
+    multiprocess_mode = 'livesum',
+)
+WRITE_BEHIND_WRITES = Counter(
+    'write_behind_writes_total',
+    'Queued writes flushed to the DB by model or deferred operation',
+    ('kind',),
+)
+WRITE_BEHIND_FLUSH = Histogram(
+    'write_behind_flush_duration_seconds',
+    'Time to flush the write-behind queue',
+    buckets = LATENCY_BUCKETS,
+)
+WRITE_BEHIND_FAILURES = Counter(
+    'write_behind_flush_failures_total',
+    'Write-behind flushes that failed and were requeued',
+)
+WRITE_BEHIND_BACKPRESSURE = Counter(
+    'write_behind_backpressure_total',
+    'Writes that flushed the queue inline because it was full',
+)
+
+CIRCUIT_STATES = {'closed': 0, 'half_open': 1, 'open': 2}
+
+
+_children = {}
+
+
+def child(metric, *labels):
+    """
+    labels() 호출(라벨 검증, 락)을 피하기 위해 라벨 조합별 자식 지표를 캐싱
+    """
+    key = (metric, labels)
+    try:
+        return _children[key]
+    except KeyError:
+        return _children.setdefault(key, metric.labels(*labels))
+
+
+def route_of(request) -> str:
+    match = getattr(request, 'resolver_match', None)
+    return (match.route or match.view_name) if match else UNMATCHED_ROUTE
+
+
+def observe_request(route: str, method: str, status: int, elapsed: float, aliases: Optional[dict] = None) -> None:
+    method = method if method in METHODS else 'OTHER'
+    child(REQUEST_LATENCY, route, method, status).observe(elapsed)
+    for alias, queries in (aliases or {}).items():
+        child(DB_QUERIES, route, alias).inc(queries)
+
+
+def observe_kakao(client: str, elapsed: float, failed: bool) -> None:
+    child(KAKAO_LATENCY, client).observe(elapsed)
+    if failed:
+        child(KAKAO_ERRORS, client).inc()
+
+
+def observe_pool(alias: str, active: int, idle: int) -> None:
+    child(DB_POOL_CONNECTIONS, alias, 'active').set(active)
+    child(DB_POOL_CONNECTIONS, alias, 'idle').set(idle)
+
+
+def observe_pool_checkout(alias: str, waited: float, failed: bool) -> None:
+    child(DB_POOL_WAIT, alias).observe(waited)
+    if failed:
+        child(DB_POOL_FAILURES, alias).inc()
+
+
+def observe_circuit(breaker: str, state: str, rejected: bool = False, transition: bool = False) -> None:
+    child(CIRCUIT_STATE, breaker).set(CIRCUIT_STATES[state])
+    if rejected:
+        child(CIRCUIT_REJECTED, breaker).inc()
+    if transition:
+        child(CIRCUIT_TRANSITIONS, breaker, state).inc()
+
+
+def observe_write_behind_pending(pending: int, backpressure: bool = False) -> None:
+    WRITE_BEHIND_PENDING.set(pending)
+    if backpressure:
+        WRITE_BEHIND_BACKPRESSURE.inc()
+
+
+def observe_write_behind_flush(written: dict, elapsed: float, failed: bool = False) -> None:
+    WRITE_BEHIND_FLUSH.observe(elapsed)
+    for kind, count in written.items():
+        child(WRITE_BEHIND_WRITES, kind).inc(count)
+    if failed:
+        WRITE_BEHIND_FAILURES.inc()
+
+
+def count_tokens(event: str, amount: int = 1) -> None:
+    if amount:
+        child(TOKENS, event).inc(amount)
+
+
+def multiprocess_dir() -> Optional[str]:
+    return os.environ.get('PROMETHEUS_MULTIPROC_DIR') or os.environ.get('prometheus_multiproc_dir')
+
+
+def build_registry(path: Optional[str] = None) -> CollectorRegistry:
+    """
+    멀티 프로세스 모드에서는 수집할 때마다 모든 워커의 파일을 합산하는 레지스트리를 새로 생성
+    """
+    path = path or multiprocess_dir()
+    if not path:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return registry
+
+
+def render(path: Optional[str] = None) -> Tuple[bytes, str]:
+    return generate_latest(build_registry(path)), CONTENT_TYPE_LATEST
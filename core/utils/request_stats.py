@@ -0,0 +1,68 @@
+from contextvars import ContextVar, Token
+from typing      import Dict, Optional, Tuple
+
+
+class RequestStats:
+    """
+    detail:
+      - 요청 하나의 DB 쿼리 수/시간, 가장 느린 쿼리, 카카오 API 호출 시간
+      - RequestInstrumentationMiddleware가 요청마다 생성하며, 요청 처리 중에는 current_stats()로 조회
+    """
+    
+    __slots__ = ('queries', 'db_seconds', 'slowest_sql', 'slowest_seconds', 'aliases', 'upstream_calls', 'upstream_seconds')
+    
+    def __init__(self):
+        self.queries          = 0
+        self.db_seconds       = 0.0
+        self.slowest_sql      = None
+        self.slowest_seconds  = 0.0
+        self.aliases          = {}
+        self.upstream_calls   = 0
+        self.upstream_seconds = 0.0
+    
+    def record_query(self, alias: str, sql: str, elapsed: float) -> None:
+        self.queries         += 1
+        self.db_seconds      += elapsed
+        self.aliases[alias]   = self.aliases.get(alias, 0) + 1
+        if elapsed >= self.slowest_seconds:
+            self.slowest_sql     = sql
+            self.slowest_seconds = elapsed
+    
+    def record_upstream(self, elapsed: float) -> None:
+        self.upstream_calls   += 1
+        self.upstream_seconds += elapsed
+    
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            'queries'    : self.queries,
+            'db_ms'      : round(self.db_seconds * 1000, 3),
+            'slowest_ms' : round(self.slowest_seconds * 1000, 3),
+            'aliases'    : self.aliases,
+            'kakao_calls': self.upstream_calls,
+            'kakao_ms'   : round(self.upstream_seconds * 1000, 3),
+        }
+
+
+_current_stats = ContextVar('request_stats', default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current_stats.get()
+
+
+def start_stats() -> Tuple[RequestStats, Token]:
+    stats = RequestStats()
+    return stats, _current_stats.set(stats)
+
+
+def finish_stats(token: Token) -> None:
+    _current_stats.reset(token)
+
+
+def record_upstream(elapsed: float) -> None:
+    """
+    카카오 API 클라이언트에서 호출, 요청 처리 중이 아니면 무시
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record_upstream(elapsed)
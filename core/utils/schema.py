@@ -0,0 +1,132 @@
+import os, hashlib, tempfile, threading
+
+from pathlib import Path
+from typing  import Dict, NamedTuple, Optional
+
+from django.conf import settings
+
+from drf_yasg              import openapi
+from drf_yasg.app_settings import swagger_settings
+from drf_yasg.renderers    import OpenAPIRenderer, SwaggerJSONRenderer, SwaggerYAMLRenderer
+from drf_yasg.views        import get_schema_view
+
+from rest_framework import permissions
+
+
+DEFAULTS = {
+    'DIRECTORY'    : None,
+    'CACHE_MAX_AGE': 60 * 60 * 24,
+}
+
+"""
+Swagger settings
+"""
+SCHEMA_INFO = openapi.Info(
+    title           = 'social-login API',
+    default_version = 'v1',
+    description     = 'social-login',
+)
+
+schema_view = get_schema_view(
+    SCHEMA_INFO,
+    public = True,
+    permission_classes = (permissions.AllowAny,),
+)
+
+"""
+format(URL의 .json/.yaml 또는 ?format=openapi) -> (renderer, 파일명)
+"""
+FORMATS = {
+    '.json'  : (SwaggerJSONRenderer, 'swagger.json'),
+    '.yaml'  : (SwaggerYAMLRenderer, 'swagger.yaml'),
+    'openapi': (OpenAPIRenderer, 'swagger.json'),
+}
+
+
+class SchemaArtifact(NamedTuple):
+    body  : bytes
+    etag  : str
+    source: str
+
+
+class SchemaArtifacts:
+    """
+    detail:
+      - OpenAPI 스키마(JSON/YAML)를 요청마다 생성하지 않고 파일 또는 프로세스 메모리에서 제공
+        > 배포 시 build_schema 명령으로 DIRECTORY에 미리 생성한 파일을 사용
+        > 파일이 없으면 최초 요청 시 한 번 생성해 프로세스(워커) 메모리에 보관
+      - 요청과 무관하게 같은 스키마를 생성(host/scheme 미포함, 문서 페이지와 같은 host 사용)
+      - ETag는 스키마 내용의 해시
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config     = {**DEFAULTS, **(config or {})}
+        self._artifacts = {}
+        self._lock      = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> 'SchemaArtifacts':
+        return cls(getattr(settings, 'OPENAPI_SCHEMA', None))
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return Path(self.config['DIRECTORY']) if self.config['DIRECTORY'] else None
+
+    def generate(self) -> openapi.Swagger:
+        generator = swagger_settings.DEFAULT_GENERATOR_CLASS(SCHEMA_INFO, url='')
+        return generator.get_schema(request=None, public=True)
+
+    def render(self, schema: openapi.Swagger) -> Dict[str, bytes]:
+        return {
+            filename: renderer().render(schema)
+            for renderer, filename in FORMATS.values()
+        }
+
+    def build(self, directory: Optional[str] = None) -> Dict[str, Path]:
+        """
+        스키마를 생성해 파일로 저장(다른 프로세스가 쓰는 중인 파일을 읽지 않도록 임시 파일 생성 후 교체)
+        """
+        directory = Path(directory) if directory else self.directory
+        directory.mkdir(parents=True, exist_ok=True)
+
+        paths = {}
+        for filename, body in self.render(self.generate()).items():
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=f'.{filename}.')
+            with os.fdopen(fd, 'wb') as file:
+                file.write(body)
+            os.replace(tmp, directory / filename)
+            paths[filename] = directory / filename
+        self.clear()
+        return paths
+
+    def load(self, filename: str) -> Optional[bytes]:
+        path = self.directory / filename if self.directory else None
+        if path and path.exists():
+            return path.read_bytes()
+        return None
+
+    def get(self, format: str) -> SchemaArtifact:
+        filename = FORMATS[format][1]
+        artifact = self._artifacts.get(filename)
+        if artifact is not None:
+            return artifact
+
+        with self._lock:
+            if filename not in self._artifacts:
+                body = self.load(filename)
+                if body is not None:
+                    self._artifacts[filename] = self.artifact(body, 'file')
+                else:
+                    for name, rendered in self.render(self.generate()).items():
+                        self._artifacts.setdefault(name, self.artifact(rendered, 'generated'))
+            return self._artifacts[filename]
+
+    def artifact(self, body: bytes, source: str) -> SchemaArtifact:
+        return SchemaArtifact(body, hashlib.sha256(body).hexdigest()[:32], source)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._artifacts = {}
+
+
+schema_artifacts = SchemaArtifacts.from_settings()
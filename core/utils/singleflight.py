@@ -0,0 +1,93 @@
+import asyncio, threading
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result = None
+        self.error  = None
+
+
+class SingleFlight:
+    """
+    detail:
+      - 같은 key로 동시에 들어온 호출은 먼저 들어온 호출(leader)만 func를 실행하고, 나머지는 결과를 기다려 공유
+        > 예외도 공유(모든 호출에서 같은 예외 발생)
+        > 실행이 끝나면 key를 제거, 이후 호출은 다시 실행(결과를 캐싱하지 않음)
+      - 워커(프로세스) 내부 스레드 간에만 동작
+      - 반환값: (결과, 다른 호출의 결과를 공유했는지 여부)
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock  = threading.Lock()
+        self.stats  = {'calls': 0, 'shared': 0}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        with self._lock:
+            self.stats['calls'] += 1
+            call   = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.stats['shared'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, 'in_flight': len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight의 asyncio 버전(같은 이벤트 루프의 코루틴 간에 동작)
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self.stats  = {'calls': 0, 'shared': 0}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        self.stats['calls'] += 1
+        future = self._calls.get(key)
+        if future is not None:
+            self.stats['shared'] += 1
+            return await asyncio.shield(future), True
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._calls[key]
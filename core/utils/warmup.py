@@ -0,0 +1,68 @@
+import time
+
+from typing import Callable, Dict
+
+
+def timed_step(func: Callable[[], object]) -> Dict[str, object]:
+    """
+    워밍업 실패(DB/카카오 API 일시 장애 등)로 워커가 종료되지 않도록 예외는 결과에만 기록
+    """
+    started = time.perf_counter()
+    try:
+        func()
+        error = None
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    return {'ms': round((time.perf_counter() - started) * 1000, 1), 'error': error}
+
+
+def open_db_connections() -> None:
+    """
+    detail:
+      - 커넥션 풀(POOL)을 사용하는 DB만 WARM_UP개의 커넥션을 미리 만들어 풀에 반납(요청 처리 스레드가 재사용)
+      - 풀을 사용하지 않으면 아무것도 하지 않음
+        > Django 커넥션은 스레드별이므로 워밍업 스레드에서 연결해도 요청 처리 스레드(gthread)는 새로 연결함
+    """
+    from django.db    import connections
+    from core.db.pool import DEFAULTS
+
+    for alias in connections:
+        config = connections.settings[alias].get('POOL')
+        if not config:
+            continue
+
+        config = {**DEFAULTS, **config}
+        opened = [connections.create_connection(alias) for _ in range(min(config['WARM_UP'], config['MAX_SIZE']))]
+        try:
+            for connection in opened:
+                connection.ensure_connection()
+        finally:
+            for connection in opened:
+                connection.close()
+
+
+def load_schema() -> None:
+    from core.utils.schema import schema_artifacts
+
+    for format in ('.json', '.yaml'):
+        schema_artifacts.get(format)
+
+
+def warm_up() -> Dict[str, Dict[str, object]]:
+    """
+    detail:
+      - 워커 fork 직후(gunicorn post_worker_init) 호출해 첫 사용자 요청이 부담하던 비용을 미리 처리
+        > DB 커넥션 풀 채우기(커넥션 풀 사용 시)
+        > 카카오 API 커넥션 풀(TCP/TLS 핸드셰이크)
+        > 블랙리스트 조회 인덱스, OpenAPI 스키마 로딩
+      - 반환값: 단계별 소요시간(ms)과 오류
+    """
+    from core.utils.kakao_client     import kakao_client
+    from users.utils.blacklist_index import blacklist_index
+
+    return {
+        'db'             : timed_step(open_db_connections),
+        'kakao'          : timed_step(kakao_client.warm_up),
+        'blacklist_index': timed_step(blacklist_index.prime),
+        'schema'         : timed_step(load_schema),
+    }
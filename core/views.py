@@ -1,3 +1,82 @@
-from django.shortcuts import render
+import hmac, ipaddress
 
-# Create your views here.
+from django.conf                  import settings
+from django.http                  import HttpResponse, HttpResponseForbidden
+from django.utils.cache           import patch_cache_control
+from django.views.decorators.http import condition, require_GET, require_safe
+
+from core.utils        import metrics
+from core.utils.schema import FORMATS, schema_artifacts, schema_view
+
+
+METRICS_DEFAULTS = {
+    'TOKEN'      : '',
+    'ALLOWED_IPS': ('127.0.0.1', '::1'),
+}
+
+
+def metrics_allowed(request) -> bool:
+    """
+    detail:
+      - Authorization: Bearer <TOKEN>(TOKEN이 설정된 경우) 또는 ALLOWED_IPS(IP/CIDR)에 포함된 클라이언트만 허용
+      - 클라이언트 IP는 REMOTE_ADDR(X-Forwarded-For는 클라이언트가 바꿀 수 있으므로 사용하지 않음)
+        > nginx를 거친 요청은 nginx의 IP이므로 ALLOWED_IPS에 nginx/도커 네트워크를 넣으면 공개 포트에서도 허용됨
+    """
+    config = {**METRICS_DEFAULTS, **getattr(settings, 'METRICS', {})}
+
+    if config['TOKEN']:
+        scheme, _, credentials = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+        if scheme.lower() == 'bearer' and hmac.compare_digest(credentials.encode(), config['TOKEN'].encode()):
+            return True
+
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(network, strict=False) for network in config['ALLOWED_IPS'])
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Prometheus 수집(scrape) 엔드포인트, 멀티 프로세스 모드에서는 모든 워커의 지표를 합산해 응답
+    허용되지 않은 클라이언트(metrics_allowed)는 403
+    """
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+
+    body, content_type = metrics.render()
+    return HttpResponse(body, content_type=content_type)
+
+
+def schema_etag(request, format='.json'):
+    return schema_artifacts.get(format).etag
+
+
+@require_safe
+@condition(etag_func=schema_etag)
+def schema_spec_view(request, format='.json'):
+    """
+    미리 생성된(또는 최초 요청 시 생성해 메모리에 보관한) OpenAPI 스키마를 ETag와 함께 응답
+    If-None-Match가 일치하면 304 응답
+    """
+    artifact = schema_artifacts.get(format)
+    renderer = FORMATS[format][0]
+    response = HttpResponse(artifact.body, content_type=f'{renderer.media_type}; charset={renderer.charset}')
+    patch_cache_control(response, public=True, max_age=schema_artifacts.config['CACHE_MAX_AGE'])
+    return response
+
+
+def schema_ui_view(renderer):
+    """
+    문서 페이지(swagger, redoc)는 drf_yasg UI 뷰로 응답
+    페이지가 스키마를 요청할 때(?format=openapi)는 schema_spec_view로 응답
+    """
+    ui_view = schema_view.with_ui(renderer, cache_timeout=0)
+    
+    def view(request, *args, **kwargs):
+        format = request.GET.get('format')
+        if format in FORMATS:
+            return schema_spec_view(request, format=format)
+        return ui_view(request, *args, **kwargs)
+    return view
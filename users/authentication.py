@@ -0,0 +1,34 @@
+from django.conf              import settings
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions     import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings       import api_settings
+
+from users.utils.user_cache import user_cache
+
+
+class VersionedJWTAuthentication(JWTAuthentication):
+    """
+    detail:
+      - access 토큰의 토큰 세대 클레임이 유저의 현재 토큰 세대(User.token_version)와 다르면 인증 거부
+      - request.user는 User 모델 대신 인증에 필요한 필드만 담은 AuthUser(users.utils.user_cache)
+        > 워커별 TTL 캐시에서 조회, 캐시에 없으면 필요한 컬럼만 조회(쿼리 1회)
+    """
+    
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+        
+        token_version = validated_token.get(settings.TOKEN_VERSION_CLAIM, 0)
+        user          = user_cache.get(user_id, min_version=token_version)
+        
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        if token_version != user.token_version:
+            raise InvalidToken()
+        return user
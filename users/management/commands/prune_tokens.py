@@ -0,0 +1,32 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from users.utils.token_pruning import TokenPruner
+
+
+class Command(BaseCommand):
+    help = '만료된 OutstandingToken/BlacklistedToken을 pk 순서대로 나누어 삭제'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='배치당 삭제할 OutstandingToken 개수')
+        parser.add_argument('--sleep', type=float, help='배치 사이 대기시간(초)')
+        parser.add_argument('--checkpoint-file', help='중단 시 이어서 진행하기 위한 checkpoint 파일 경로')
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상 개수만 집계')
+    
+    def handle(self, *args, **options):
+        pruner = TokenPruner.from_settings(**options)
+        
+        def progress(report):
+            if options['verbosity'] > 1:
+                self.stdout.write(json.dumps(report))
+        
+        report = pruner.run(progress=progress)
+        
+        self.stdout.write(self.style.SUCCESS(
+            '{action} {outstanding} outstanding / {blacklisted} blacklisted tokens '
+            'in {batches} batches, {seconds}s ({rows_per_second} rows/s)'.format(
+                action = 'Would remove' if report['dry_run'] else 'Removed',
+                **report
+            )
+        ))
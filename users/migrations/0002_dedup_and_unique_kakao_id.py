@@ -0,0 +1,94 @@
+import logging
+
+from django.db import migrations, models
+
+
+logger = logging.getLogger(__name__)
+
+"""
+병합할 유저를 참조하는 관계(app_label, model, field), 남길 유저로 옮김
+  - token_blacklist.OutstandingToken.user: 발급된 refresh 토큰 기록(블랙리스트 포함)
+  - admin.LogEntry.user                  : 어드민 변경 이력
+"""
+REPOINTED_RELATIONS = (
+    ('token_blacklist', 'OutstandingToken', 'user'),
+    ('admin',           'LogEntry',         'user'),
+)
+
+
+def merge_duplicate_kakao_users(apps, schema_editor):
+    """
+    detail:
+      - 유니크 인덱스 추가 전 kakao_id가 중복된 유저를 병합
+      - kakao_id별로 가장 먼저 생성된(id가 가장 작은) 유저를 남기고
+        나머지 유저를 참조하는 행(REPOINTED_RELATIONS)을 남길 유저로 옮긴 뒤 삭제
+        > 그 외의 관계가 유저를 참조하면 삭제 시 함께 삭제(CASCADE)되지 않도록 마이그레이션을 중단
+      - 병합 내역은 경고 로그로 기록(중복이 없으면 출력 없음)
+    """
+    User     = apps.get_model('users', 'User')
+    db_alias = schema_editor.connection.alias
+    
+    duplicates = list(
+        User.objects\
+            .using(db_alias)\
+            .values('kakao_id')\
+            .annotate(count=models.Count('id'))\
+            .filter(count__gt=1)\
+            .values_list('kakao_id', flat=True)
+    )
+    if not duplicates:
+        return
+    
+    relations = [
+        (apps.get_model(app_label, model_name), field_name)
+        for app_label, model_name, field_name in REPOINTED_RELATIONS
+    ]
+    unhandled = {
+        f'{relation.related_model._meta.label}.{relation.field.name}'
+        for relation in User._meta.related_objects
+    } - {f'{model._meta.label}.{field_name}' for model, field_name in relations}
+    if unhandled:
+        raise RuntimeError(f'relations to users.User are not re-pointed when merging duplicates: {sorted(unhandled)}')
+    
+    for kakao_id in duplicates:
+        ids = list(
+            User.objects\
+                .using(db_alias)\
+                .filter(kakao_id=kakao_id)\
+                .order_by('id')\
+                .values_list('id', flat=True)
+        )
+        survivor, merged = ids[0], ids[1:]
+        
+        for model, field_name in relations:
+            model.objects\
+                 .using(db_alias)\
+                 .filter(**{f'{field_name}_id__in': merged})\
+                 .update(**{f'{field_name}_id': survivor})
+        User.objects\
+            .using(db_alias)\
+            .filter(id__in=merged)\
+            .delete()
+        
+        logger.warning(
+            'merged duplicate kakao_id=%s: kept user %s, removed users %s, re-pointed %s',
+            kakao_id, survivor, merged, ', '.join(f'{model._meta.label}.{field_name}' for model, field_name in relations),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+        ('admin', '0003_logentry_add_action_flag_choices'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_kakao_users, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='user',
+            name='kakao_id',
+            field=models.BigIntegerField(unique=True),
+        ),
+    ]
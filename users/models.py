@@ -55,14 +55,18 @@ class User(AbstractBaseUser, TimeStampModel):
         > 참고내용:
           * is_active가 False일 경우 계정이 비활성화 됨
           * is_admin은 is_staff에서 활용 됨
+      - token_version: 토큰 세대(generation)
+        > 발급되는 토큰에 클레임으로 포함되며, 값이 다른(이전 세대) 토큰은 인증/갱신이 거부 됨
+        > 값을 1 올리면 유저의 모든 세션이 로그아웃 됨
     """
     
-    email     = models.EmailField(unique=True)
-    nickname  = models.CharField(max_length=50)
-    password  = models.CharField(max_length=255, null=True, blank=True)
-    kakao_id  = models.BigIntegerField()
-    is_admin  = models.BooleanField(default=False)
-    is_active = models.BooleanField(default=True)
+    email         = models.EmailField(unique=True)
+    nickname      = models.CharField(max_length=50)
+    password      = models.CharField(max_length=255, null=True, blank=True)
+    kakao_id      = models.BigIntegerField(unique=True)
+    is_admin      = models.BooleanField(default=False)
+    is_active     = models.BooleanField(default=True)
+    token_version = models.PositiveIntegerField(default=0)
     
     """
     커스텀 유저모델을 사용할 경우 필요함
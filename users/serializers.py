@@ -1,6 +1,16 @@
-from rest_framework import serializers
+from rest_framework                      import serializers
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+
+from users.tokens import VersionedRefreshToken
 
 
 class KakaoSignInSerializer(serializers.Serializer):
-    refresh = serializers.CharField(max_length=255)
-    access  = serializers.CharField(max_length=255)
\ No newline at end of file
+    """
+    로그인 응답 형식(API 문서용), 응답은 token_minter가 만든 토큰 쌍을 그대로 사용
+    """
+    refresh = serializers.CharField(read_only=True)
+    access  = serializers.CharField(read_only=True)
+
+
+class UserTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = VersionedRefreshToken
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch          import receiver
+
+from users.models           import User
+from users.utils.user_cache import user_cache
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    유저 변경(is_active, token_version 등)/삭제 시 인증 유저 캐시 무효화
+    """
+    user_cache.invalidate(instance.pk)
@@ -0,0 +1,135 @@
+import time, datetime, threading
+
+from unittest.mock import patch
+
+from django.test  import TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework_simplejwt.tokens import OutstandingToken, BlacklistedToken
+
+from users.models                 import User
+from users.utils.blacklist_index  import BlacklistIndex
+from users.utils.token_revocation import revoke_user_tokens
+
+
+class BlacklistIndexTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects\
+                       .create(
+                           email    = 'user@example.com',
+                           nickname = 'user',
+                           kakao_id = 12345678910
+                       )
+    
+    def create_token(self, jti, blacklisted=False, expired=False):
+        now   = timezone.now()
+        token = OutstandingToken.objects\
+                                .create(
+                                    user       = self.user,
+                                    jti        = jti,
+                                    token      = f'token-{jti}',
+                                    created_at = now,
+                                    expires_at = now + datetime.timedelta(days=-1 if expired else 7),
+                                )
+        if blacklisted:
+            BlacklistedToken.objects.create(token=token)
+        return token
+    
+    def test_success_lookup_answers_from_memory_after_load(self):
+        self.create_token('blacklisted', blacklisted=True)
+        self.create_token('active')
+        index = BlacklistIndex({'SHARED_EPOCH': False, 'REFRESH_INTERVAL': 60})
+        
+        with self.assertNumQueries(1):
+            self.assertTrue(index.is_blacklisted('blacklisted'))
+            self.assertFalse(index.is_blacklisted('active'))
+            self.assertFalse(index.is_blacklisted('unknown'))
+            
+        self.assertEqual(index.snapshot()['negatives'], 2)
+        self.assertEqual(index.snapshot()['db_checks'], 0)
+        
+    def test_success_expired_tokens_are_not_loaded(self):
+        self.create_token('expired', blacklisted=True, expired=True)
+        index = BlacklistIndex({'SHARED_EPOCH': False})
+        
+        self.assertFalse(index.is_blacklisted('expired'))
+        self.assertEqual(index.snapshot()['entries'], 0)
+        
+    def test_success_refresh_reads_only_rows_after_high_water_mark(self):
+        self.create_token('first', blacklisted=True)
+        index = BlacklistIndex({'SHARED_EPOCH': False, 'REFRESH_INTERVAL': 60, 'OVERLAP': 0})
+        index.is_blacklisted('first')
+        
+        self.create_token('second')
+        revoke_user_tokens(self.user.id)
+        index.mark_stale()
+        
+        with self.assertNumQueries(1):
+            self.assertTrue(index.is_blacklisted('second'))
+            
+        self.assertEqual(index.snapshot()['entries'], 2)
+        self.assertEqual(index.snapshot()['refreshes'], 1)
+        
+    def test_success_shared_epoch_marks_other_indexes_stale(self):
+        index = BlacklistIndex({'REFRESH_INTERVAL': 60})
+        other = BlacklistIndex({'REFRESH_INTERVAL': 60})
+        index.is_blacklisted('token')
+        other.is_blacklisted('token')
+        
+        self.create_token('token')
+        revoke_user_tokens(self.user.id)
+        index.mark_stale()
+        
+        self.assertTrue(other.is_blacklisted('token'))
+        
+    def test_success_bloom_filter_is_used_above_memory_ceiling(self):
+        for i in range(50):
+            self.create_token(f'blacklisted-{i}', blacklisted=True)
+        self.create_token('active')
+        index = BlacklistIndex({'SHARED_EPOCH': False, 'REFRESH_INTERVAL': 60, 'MAX_MEMORY': 1024})
+        
+        self.assertTrue(index.is_blacklisted('blacklisted-0'))
+        self.assertEqual(index.snapshot()['mode'], 'bloom')
+        self.assertEqual(index.snapshot()['db_checks'], 1)
+        
+        for i in range(1000):
+            self.assertFalse(index.is_blacklisted(f'unknown-{i}'))
+        self.assertLess(index.snapshot()['false_positives'], 100)
+    
+    def test_success_concurrent_lookups_rebuild_once(self):
+        index   = BlacklistIndex({'SHARED_EPOCH': False, 'REFRESH_INTERVAL': 60})
+        barrier = threading.Barrier(4)
+        
+        def rows(after):
+            time.sleep(0.05)
+            return iter([])
+        
+        def lookup():
+            barrier.wait()
+            index.is_blacklisted('token')
+        
+        with patch.object(index, '_rows', side_effect=rows) as mocked_rows:
+            threads = [threading.Thread(target=lookup) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(mocked_rows.call_count, 1)
+        self.assertEqual(index.snapshot()['rebuilds'], 1)
+        self.assertEqual(index.snapshot()['lookups'], 4)
+    
+    def test_check_shared_epoch_requires_shared_cache(self):
+        from core.checks import check_blacklist_index_cache
+        
+        locmem = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        redis  = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:6379/0'}}
+        
+        with override_settings(CACHES=locmem, TOKEN_BLACKLIST_INDEX={'SHARED_EPOCH': True}):
+            self.assertEqual([error.id for error in check_blacklist_index_cache(None)], ['core.E004'])
+        with override_settings(CACHES=locmem, TOKEN_BLACKLIST_INDEX={'SHARED_EPOCH': False}):
+            self.assertEqual(check_blacklist_index_cache(None), [])
+        with override_settings(CACHES=redis, TOKEN_BLACKLIST_INDEX={'SHARED_EPOCH': True}):
+            self.assertEqual(check_blacklist_index_cache(None), [])
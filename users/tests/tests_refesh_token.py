@@ -8,6 +8,9 @@ from unittest      import mock
 
 from users.models  import User
 
+from core.utils.kakao_cache      import profile_cache
+from users.utils.blacklist_index import blacklist_index
+
 
 class UserRefreshTokenTest(APITestCase):
     
@@ -21,10 +24,16 @@ class UserRefreshTokenTest(APITestCase):
             kakao_id = 12345678910
         )
     
-    @patch('core.utils.get_obj_n_check_err.requests')    
-    def test_success_user_refresh_token(self, mocked_requests):
+    def setUp(self):
+        profile_cache.clear()
+        blacklist_index.reset()
+    
+    @patch('core.utils.get_obj_n_check_err.kakao_client')    
+    def test_success_user_refresh_token(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 12345678910,
@@ -36,7 +45,7 @@ class UserRefreshTokenTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -110,10 +119,12 @@ class UserRefreshTokenTest(APITestCase):
             }
         )
     
-    @patch('core.utils.get_obj_n_check_err.requests')        
-    def test_fail_user_refresh_token_due_to_token_type_mismatch(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')        
+    def test_fail_user_refresh_token_due_to_token_type_mismatch(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 12345678910,
@@ -125,7 +136,7 @@ class UserRefreshTokenTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -147,4 +158,45 @@ class UserRefreshTokenTest(APITestCase):
                 'detail': '잘못된 토큰 타입',
                 'code'  : 'token_not_valid'
             }
-        )
\ No newline at end of file
+        )
+    
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_refresh_token_due_to_blacklisted_refresh_token(self, mocked_client):
+        
+        class MockedResponse:
+            status_code = 200
+            
+            def json(self):
+                return {
+                    'id': 12345678910,
+                    'kakao_account': {
+                        'email'  : 'user@example.com',
+                        'profile': {
+                            'nickname': 'user'
+                        }
+                    }
+                }
+                
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
+        
+        headers  = {'HTTP_Authorization': 'kakao token'}
+        response = self.client\
+                       .get('/api/users/kakao-signin', **headers, content_type='application/json')
+                       
+        data = {
+            'refresh': response.json()['refresh']
+        }
+        
+        response = self.client\
+                       .post('/api/users/token-refresh', data=json.dumps(data), content_type='application/json')
+        
+        self.assertEqual(response.status_code, 200)
+        
+        self.client\
+            .get('/api/users/kakao-signin', **headers, content_type='application/json')
+        
+        response = self.client\
+                       .post('/api/users/token-refresh', data=json.dumps(data), content_type='application/json')
+                       
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'token_not_valid')
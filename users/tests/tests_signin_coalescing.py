@@ -0,0 +1,122 @@
+import time, threading
+
+from django.db   import connections
+from django.test import Client
+
+from rest_framework.test             import APITransactionTestCase
+from rest_framework_simplejwt.tokens import OutstandingToken
+
+from unittest.mock import patch
+from unittest      import mock
+
+from users.models                 import User
+from users.utils.kakao_signin     import token_flight, account_flight, upsert_user, mint_session
+from users.utils.token_minting    import token_minter
+
+from core.utils.kakao_cache import profile_cache
+
+
+class SlowKakaoResponse:
+    status_code = 200
+    
+    def json(self):
+        time.sleep(0.2)
+        return {
+            'id': 12345678910,
+            'kakao_account': {
+                'email'  : 'user@example.com',
+                'profile': {
+                    'nickname': 'user'
+                }
+            }
+        }
+
+
+@patch('core.utils.get_obj_n_check_err.kakao_client')
+class CoalescedSignInTest(APITransactionTestCase):
+    
+    requests = 8
+    
+    def setUp(self):
+        profile_cache.clear()
+    
+    def signin_in_parallel(self, token=lambda index: 'kakao token'):
+        barrier   = threading.Barrier(self.requests)
+        responses = [None] * self.requests
+        
+        def signin(index):
+            try:
+                barrier.wait()
+                responses[index] = Client().get('/api/users/kakao-signin', HTTP_Authorization=token(index))
+            finally:
+                connections.close_all()
+        
+        # sqlite(메모리 DB)는 동시 쓰기를 허용하지 않으므로 토큰 발급을 직렬화(MySQL에서는 유저 행 잠금으로 직렬화됨)
+        lock = threading.RLock()
+        
+        def serialized(func):
+            def wrapper(user):
+                with lock:
+                    return func(user)
+            return wrapper
+        
+        threads = [threading.Thread(target=signin, args=(index,)) for index in range(self.requests)]
+        with patch('users.utils.kakao_signin.mint_session', serialized(mint_session)),\
+             patch.object(token_minter, 'mint', serialized(token_minter.mint)):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return responses
+    
+    def test_success_parallel_signins_share_one_upstream_call(self, mocked_client):
+        mocked_client.get = mock.MagicMock(return_value = SlowKakaoResponse())
+        shared = token_flight.snapshot()['shared']
+        
+        responses = self.signin_in_parallel()
+        
+        self.assertEqual(mocked_client.get.call_count, 1)
+        self.assertEqual(token_flight.snapshot()['shared'] - shared, self.requests - 1)
+        self.assertEqual({response.status_code for response in responses}, {201})
+        self.assertEqual(len({response.json()['refresh'] for response in responses}), self.requests)
+        self.assertEqual(User.objects.count(), 1)
+        self.assertEqual(OutstandingToken.objects.count(), self.requests)
+    
+    def test_success_parallel_signins_of_one_account_get_their_own_tokens(self, mocked_client):
+        mocked_client.get = mock.MagicMock(return_value = SlowKakaoResponse())
+        User.objects.create(kakao_id=12345678910, email='user@example.com', nickname='user')
+        shared = account_flight.snapshot()['shared']
+        
+        def slow_upsert(*args):
+            time.sleep(0.2)
+            return upsert_user(*args)
+        
+        with patch('users.utils.kakao_signin.upsert_user', slow_upsert):
+            responses = self.signin_in_parallel(token=lambda index: f'kakao token {index}')
+        
+        self.assertEqual(mocked_client.get.call_count, self.requests)
+        self.assertEqual(account_flight.snapshot()['shared'] - shared, self.requests - 1)
+        self.assertEqual({response.status_code for response in responses}, {200})
+        self.assertEqual(len({response.json()['refresh'] for response in responses}), self.requests)
+        self.assertEqual(len({response.json()['access'] for response in responses}), self.requests)
+        self.assertEqual(len(set(OutstandingToken.objects.values_list('jti', flat=True))), self.requests)
+    
+    def test_success_parallel_signins_share_upstream_error(self, mocked_client):
+        mocked_client.get = mock.MagicMock(side_effect = lambda *args, **kwargs: time.sleep(0.2) or 1 / 0)
+        
+        responses = self.signin_in_parallel()
+        
+        self.assertEqual(mocked_client.get.call_count, 1)
+        self.assertEqual({response.status_code for response in responses}, {401})
+        self.assertFalse(User.objects.exists())
+    
+    def test_success_sequential_signins_are_not_coalesced(self, mocked_client):
+        mocked_client.get = mock.MagicMock(return_value = SlowKakaoResponse())
+        
+        first  = self.client.get('/api/users/kakao-signin', HTTP_Authorization='kakao token')
+        profile_cache.clear()
+        second = self.client.get('/api/users/kakao-signin', HTTP_Authorization='kakao token')
+        
+        self.assertEqual((first.status_code, second.status_code), (201, 200))
+        self.assertEqual(mocked_client.get.call_count, 2)
+        self.assertEqual(account_flight.snapshot()['in_flight'], 0)
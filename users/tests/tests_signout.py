@@ -8,6 +8,8 @@ from unittest      import mock
 
 from users.models  import User
 
+from core.utils.kakao_cache import profile_cache
+
 
 class UserSignOutTest(APITestCase):
     
@@ -32,10 +34,15 @@ class UserSignOutTest(APITestCase):
         cls.f_client = APIClient()
         cls.f_client.force_authenticate(user=cls.f_user)        
             
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_success_user_signout(self, mocked_requests):
+    def setUp(self):
+        profile_cache.clear()
+    
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_success_user_signout(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 12345678910,
@@ -47,7 +54,7 @@ class UserSignOutTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -72,10 +79,12 @@ class UserSignOutTest(APITestCase):
         self.assertEqual(response.status_code, 204)
         self.assertEqual(refresh.id, blacklist_token.token_id)
         
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_fail_user_signout_due_to_unauthorized_user(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_signout_due_to_unauthorized_user(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 12345678910,
@@ -87,7 +96,7 @@ class UserSignOutTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -144,10 +153,12 @@ class UserSignOutTest(APITestCase):
             }
         )
         
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_fail_user_signout_due_to_token_type_mismatch(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_signout_due_to_token_type_mismatch(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 12345678910,
@@ -159,7 +170,7 @@ class UserSignOutTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -182,10 +193,12 @@ class UserSignOutTest(APITestCase):
             }
         )
         
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_fail_user_signout_due_to_not_own_refresh_token(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_signout_due_to_not_own_refresh_token(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 123456789,
@@ -197,7 +210,7 @@ class UserSignOutTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
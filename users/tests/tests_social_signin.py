@@ -1,3 +1,6 @@
+from django.db                       import IntegrityError
+from django.db.models.query          import QuerySet
+
 from rest_framework.test             import APITestCase
 from rest_framework_simplejwt.tokens import OutstandingToken
 
@@ -6,6 +9,8 @@ from unittest      import mock
 
 from users.models  import User
 
+from core.utils.kakao_cache import profile_cache
+
 
 class KakaoSignInTest(APITestCase):
     
@@ -20,10 +25,15 @@ class KakaoSignInTest(APITestCase):
                 kakao_id = 123456789
             )
     
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_success_user_kakao_signin_first_case(self, mocked_requests):
+    def setUp(self):
+        profile_cache.clear()
+    
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_success_user_kakao_signin_first_case(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 12345678910,
@@ -35,7 +45,7 @@ class KakaoSignInTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -53,10 +63,12 @@ class KakaoSignInTest(APITestCase):
         self.assertIn('refresh', response.json())
         self.assertIn('access', response.json())
     
-    @patch('core.utils.get_obj_n_check_err.requests')    
-    def test_success_user_kakao_signin_second_case(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')    
+    def test_success_user_kakao_signin_second_case(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 123456789,
@@ -68,7 +80,7 @@ class KakaoSignInTest(APITestCase):
                     }
                 }
         
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -86,10 +98,12 @@ class KakaoSignInTest(APITestCase):
         self.assertIn('refresh', response.json())
         self.assertIn('access', response.json())
     
-    @patch('core.utils.get_obj_n_check_err.requests')      
-    def test_fail_user_kakao_signin_due_to_invalid_kakao_token(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')      
+    def test_fail_user_kakao_signin_due_to_invalid_kakao_token(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 123456789,
@@ -101,7 +115,7 @@ class KakaoSignInTest(APITestCase):
                     }
                 }
         
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': None}
         response = self.client\
@@ -115,16 +129,18 @@ class KakaoSignInTest(APITestCase):
             }
         )
     
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_fail_user_kakao_signin_due_to_no_kakao_user_data(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_kakao_signin_due_to_no_kakao_user_data(self, mocked_client):
         
         class MockedResponse:
+            status_code = 401
+            
             def json(self):
                 return {
                     'code': -401
                 }
         
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -138,10 +154,12 @@ class KakaoSignInTest(APITestCase):
             }
         )
     
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_fail_user_kakao_signin_due_to_not_existed_kakao_id(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_kakao_signin_due_to_not_existed_kakao_id(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'kakao_account': {
@@ -152,7 +170,7 @@ class KakaoSignInTest(APITestCase):
                     }
                 }
         
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -166,10 +184,12 @@ class KakaoSignInTest(APITestCase):
             }
         )
     
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_fail_user_kakao_signin_due_to_not_existed_email(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_kakao_signin_due_to_not_existed_email(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 123456789,
@@ -180,7 +200,7 @@ class KakaoSignInTest(APITestCase):
                     }
                 }
         
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -194,10 +214,12 @@ class KakaoSignInTest(APITestCase):
             }
         )
     
-    @patch('core.utils.get_obj_n_check_err.requests')
-    def test_fail_user_kakao_signin_due_to_not_existed_nickname(self, mocked_requests):
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_fail_user_kakao_signin_due_to_not_existed_nickname(self, mocked_client):
         
         class MockedResponse:
+            status_code = 200
+            
             def json(self):
                 return {
                     'id': 123456789,
@@ -207,7 +229,7 @@ class KakaoSignInTest(APITestCase):
                     }
                 }
                 
-        mocked_requests.get = mock.MagicMock(return_value = MockedResponse())
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
         
         headers  = {'HTTP_Authorization': 'kakao token'}
         response = self.client\
@@ -219,4 +241,119 @@ class KakaoSignInTest(APITestCase):
             {
                 'detail': '카카오 계정의 유저정보를 가져올 수 없습니다.'
             }
-        )    
\ No newline at end of file
+        )
+    
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_success_user_kakao_signin_retry_uses_cached_kakao_user_data(self, mocked_client):
+        
+        class MockedResponse:
+            status_code = 200
+            
+            def json(self):
+                return {
+                    'id': 123456789,
+                    'kakao_account': {
+                        'email'  : 'test@example.com',
+                        'profile': {
+                            'nickname': 'test'
+                        }
+                    }
+                }
+        
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
+        
+        headers = {'HTTP_Authorization': 'kakao token'}
+        for _ in range(3):
+            response = self.client\
+                           .get('/api/users/kakao-signin', **headers, content_type='application/json')
+            self.assertEqual(response.status_code, 200)
+        
+        self.assertEqual(mocked_client.get.call_count, 1)
+        self.assertEqual(profile_cache.snapshot()['hits'], 2)
+    
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_success_user_kakao_signin_concurrent_first_login(self, mocked_client):
+        
+        class MockedResponse:
+            status_code = 200
+            
+            def json(self):
+                return {
+                    'id': 12345678910,
+                    'kakao_account': {
+                        'email'  : 'user@example.com',
+                        'profile': {
+                            'nickname': 'user'
+                        }
+                    }
+                }
+        
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
+        
+        """
+        조회 직후 다른 요청이 같은 카카오 계정으로 먼저 가입한 경우
+        """
+        queryset_get = QuerySet.get
+        
+        def racing_get(queryset, *args, **kwargs):
+            if not User.objects.filter(kakao_id=12345678910).exists():
+                User.objects.create(email='user@example.com', nickname='user', kakao_id=12345678910)
+                raise User.DoesNotExist
+            return queryset_get(queryset, *args, **kwargs)
+        
+        headers = {'HTTP_Authorization': 'kakao token'}
+        with patch.object(QuerySet, 'get', racing_get):
+            response = self.client\
+                           .get('/api/users/kakao-signin', **headers, content_type='application/json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(User.objects.filter(kakao_id=12345678910).count(), 1)
+    
+    @patch('core.utils.get_obj_n_check_err.kakao_client')
+    def test_success_user_kakao_signin_after_transient_kakao_error(self, mocked_client):
+        
+        class MockedErrorResponse:
+            status_code = 503
+            
+            def json(self):
+                return {
+                    'code': -9798,
+                    'msg' : 'service check'
+                }
+        
+        class MockedResponse:
+            status_code = 200
+            
+            def json(self):
+                return {
+                    'id': 123456789,
+                    'kakao_account': {
+                        'email'  : 'test@example.com',
+                        'profile': {
+                            'nickname': 'test'
+                        }
+                    }
+                }
+        
+        mocked_client.get = mock.MagicMock(side_effect = [MockedErrorResponse(), MockedResponse()])
+        
+        headers  = {'HTTP_Authorization': 'kakao token'}
+        response = self.client\
+                       .get('/api/users/kakao-signin', **headers, content_type='application/json')
+        
+        self.assertEqual(response.status_code, 401)
+        
+        response = self.client\
+                       .get('/api/users/kakao-signin', **headers, content_type='application/json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mocked_client.get.call_count, 2)
+    
+    def test_fail_create_user_with_duplicated_kakao_id(self):
+        with self.assertRaises(IntegrityError):
+            User.objects\
+                .create(
+                    email    = 'other@example.com',
+                    nickname = 'other',
+                    kakao_id = 123456789
+                )
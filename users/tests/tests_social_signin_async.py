@@ -0,0 +1,162 @@
+import json
+
+from django.test import TestCase, AsyncRequestFactory
+
+from asgiref.sync import sync_to_async
+
+from rest_framework_simplejwt.tokens import OutstandingToken
+
+from unittest.mock import patch
+from unittest      import mock
+
+from users.models                    import User
+from core.utils.circuit_breaker      import CircuitOpen
+from core.utils.kakao_cache          import profile_cache
+from users.views.social_signin_async import kakao_signin_async_view
+
+
+class MockedResponse:
+    
+    def __init__(self, data, status_code=200):
+        self.data        = data
+        self.status_code = status_code
+        
+    def json(self):
+        return self.data
+
+
+class KakaoSignInAsyncTest(TestCase):
+    
+    maxDiff = None
+    
+    @classmethod
+    def setUpTestData(cls):
+        User.objects\
+            .create(
+                email    = 'test@example.com',
+                nickname = 'test',
+                kakao_id = 123456789
+            )
+    
+    def setUp(self):
+        profile_cache.clear()
+        self.factory = AsyncRequestFactory()
+    
+    @sync_to_async
+    def get_refresh_token(self, email):
+        return OutstandingToken.objects\
+                               .get(user__email=email)\
+                               .token
+    
+    @patch('core.utils.get_obj_n_check_err.async_kakao_client')
+    async def test_success_user_kakao_signin_async_first_case(self, mocked_client):
+        mocked_client.get = mock.AsyncMock(return_value = MockedResponse({
+            'id': 12345678910,
+            'kakao_account': {
+                'email'  : 'user@example.com',
+                'profile': {
+                    'nickname': 'user'
+                }
+            }
+        }))
+        
+        request  = self.factory.get('/api/users/kakao-signin', authorization='kakao token')
+        response = await kakao_signin_async_view(request)
+        
+        token = await self.get_refresh_token('user@example.com')
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(json.loads(response.content)['refresh'], token)
+        self.assertIn('access', json.loads(response.content))
+    
+    @patch('core.utils.get_obj_n_check_err.async_kakao_client')
+    async def test_success_user_kakao_signin_async_second_case(self, mocked_client):
+        mocked_client.get = mock.AsyncMock(return_value = MockedResponse({
+            'id': 123456789,
+            'kakao_account': {
+                'email'  : 'test@example.com',
+                'profile': {
+                    'nickname': 'test'
+                }
+            }
+        }))
+        
+        request  = self.factory.get('/api/users/kakao-signin', authorization='kakao token')
+        response = await kakao_signin_async_view(request)
+        
+        token = await self.get_refresh_token('test@example.com')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['refresh'], token)
+        self.assertIn('access', json.loads(response.content))
+    
+    async def test_fail_user_kakao_signin_async_due_to_invalid_kakao_token(self):
+        request  = self.factory.get('/api/users/kakao-signin')
+        response = await kakao_signin_async_view(request)
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.content,
+            self.client.get('/api/users/kakao-signin').content
+        )
+    
+    @patch('core.utils.get_obj_n_check_err.async_kakao_client')
+    async def test_fail_user_kakao_signin_async_due_to_no_kakao_user_data(self, mocked_client):
+        mocked_client.get = mock.AsyncMock(return_value = MockedResponse({'code': -401}, 401))
+        
+        request  = self.factory.get('/api/users/kakao-signin', authorization='kakao token')
+        response = await kakao_signin_async_view(request)
+        
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                'detail': '카카오 계정의 유저정보를 가져올 수 없습니다.'
+            }
+        )
+    
+    @patch('core.utils.get_obj_n_check_err.async_kakao_client')
+    async def test_fail_user_kakao_signin_async_due_to_timeout(self, mocked_client):
+        mocked_client.get = mock.AsyncMock(side_effect=TimeoutError)
+        
+        request  = self.factory.get('/api/users/kakao-signin', authorization='kakao token')
+        response = await kakao_signin_async_view(request)
+        
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                'detail': '카카오 계정의 유저정보 요청시간이 초과되었습니다.'
+            }
+        )
+    
+    @patch('core.utils.get_obj_n_check_err.async_kakao_client')
+    async def test_fail_user_kakao_signin_async_due_to_open_circuit(self, mocked_client):
+        mocked_client.get = mock.AsyncMock(side_effect=CircuitOpen(2.5))
+        
+        request  = self.factory.get('/api/users/kakao-signin', authorization='kakao token')
+        response = await kakao_signin_async_view(request)
+        
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '3')
+        self.assertEqual(json.loads(response.content), {'detail': CircuitOpen.default_detail})
+    
+    @patch('core.utils.get_obj_n_check_err.async_kakao_client')
+    async def test_success_user_kakao_signin_async_uses_async_profile_cache(self, mocked_client):
+        mocked_client.get = mock.AsyncMock(return_value = MockedResponse({
+            'id': 123456789,
+            'kakao_account': {
+                'email'  : 'test@example.com',
+                'profile': {
+                    'nickname': 'test'
+                }
+            }
+        }))
+        
+        with patch.object(profile_cache, 'get', side_effect=AssertionError('sync get')),\
+             patch.object(profile_cache, 'set', side_effect=AssertionError('sync set')):
+            first  = await kakao_signin_async_view(self.factory.get('/api/users/kakao-signin', authorization='kakao token'))
+            second = await kakao_signin_async_view(self.factory.get('/api/users/kakao-signin', authorization='kakao token'))
+        
+        self.assertEqual((first.status_code, second.status_code), (200, 200))
+        self.assertEqual(mocked_client.get.call_count, 1)
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+from django.conf import settings
+
+from rest_framework.test               import APITestCase
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.state    import token_backend
+from rest_framework_simplejwt.tokens   import AccessToken, OutstandingToken
+
+from users.models               import User
+from users.tokens               import VersionedRefreshToken
+from users.utils.token_minting  import TokenPairMinter, token_minter
+
+
+class TokenPairMinterTest(APITestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects\
+                       .create(
+                           email         = 'user@example.com',
+                           nickname      = 'user',
+                           kakao_id      = 12345678910,
+                           token_version = 3
+                       )
+    
+    def test_encode_matches_token_backend(self):
+        payload = {'token_type': 'access', 'exp': 1700000000, 'iat': 1699990000, 'jti': 'a' * 32, 'user_id': 1, 'nickname': '유저'}
+        
+        self.assertEqual(token_minter.encode(payload), token_backend.encode(payload))
+    
+    def test_encode_matches_token_backend_with_audience_and_issuer(self):
+        backend = TokenBackend(token_backend.algorithm, token_backend.signing_key, audience='app', issuer='api')
+        payload = {'token_type': 'access', 'exp': 1700000000, 'jti': 'a' * 32, 'user_id': 1}
+        
+        self.assertEqual(TokenPairMinter(backend).encode(payload), backend.encode(payload))
+    
+    def test_claims_match_for_user(self):
+        now             = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        refresh, access = token_minter.claims(self.user, now)
+        
+        token = VersionedRefreshToken.for_user(self.user)
+        token.current_time = now
+        token.set_iat(at_time=now)
+        token.set_exp(from_time=now)
+        
+        for payload, expected in ((refresh, token.payload), (access, token.access_token.payload)):
+            self.assertEqual(list(payload), list(expected))
+            self.assertEqual(
+                {claim: value for claim, value in payload.items() if claim != 'jti'},
+                {claim: value for claim, value in expected.items() if claim != 'jti'},
+            )
+        self.assertNotEqual(refresh['jti'], access['jti'])
+    
+    def test_minted_tokens_are_valid(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tokens = token_minter.mint(self.user)
+        
+        refresh = VersionedRefreshToken(tokens['refresh'])
+        access  = AccessToken(tokens['access'])
+        
+        self.assertEqual(refresh['user_id'], self.user.id)
+        self.assertEqual(access['user_id'], self.user.id)
+        self.assertEqual(access[settings.TOKEN_VERSION_CLAIM], 3)
+        self.assertEqual(refresh['iat'], access['iat'])
+    
+    def test_refresh_token_is_recorded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tokens = token_minter.mint(self.user)
+        
+        record = OutstandingToken.objects.get(token=tokens['refresh'])
+        
+        self.assertEqual(record.user, self.user)
+        self.assertEqual(record.jti, VersionedRefreshToken(tokens['refresh'])['jti'])
@@ -0,0 +1,99 @@
+import json, datetime, tempfile
+
+from io      import StringIO
+from pathlib import Path
+
+from django.core.cache      import cache
+from django.core.management import call_command
+from django.test            import TestCase
+from django.utils           import timezone
+
+from rest_framework_simplejwt.tokens import OutstandingToken, BlacklistedToken
+
+from users.models              import User
+from users.utils.token_pruning import TokenPruner, prune_expired_tokens
+
+
+class TokenPruningTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects\
+                   .create(
+                       email    = 'user@example.com',
+                       nickname = 'user',
+                       kakao_id = 12345678910
+                   )
+        
+        now = timezone.now()
+        for i in range(10):
+            token = OutstandingToken.objects\
+                                    .create(
+                                        user       = user,
+                                        jti        = f'jti-{i}',
+                                        token      = f'token-{i}',
+                                        created_at = now,
+                                        expires_at = now + datetime.timedelta(days=-1 if i % 2 else 1),
+                                    )
+            if i < 4:
+                BlacklistedToken.objects.create(token=token)
+    
+    def setUp(self):
+        self.checkpoint_file = Path(tempfile.mkdtemp()) / 'checkpoint'
+    
+    def test_success_prune_removes_only_expired_tokens_in_batches(self):
+        report = TokenPruner(batch_size=2, sleep=0, checkpoint_file=self.checkpoint_file).run()
+        
+        self.assertEqual(report['batches'], 3)
+        self.assertEqual(report['outstanding'], 5)
+        self.assertEqual(report['blacklisted'], 2)
+        self.assertEqual(OutstandingToken.objects.filter(expires_at__lte=timezone.now()).count(), 0)
+        self.assertEqual(OutstandingToken.objects.count(), 5)
+        self.assertEqual(BlacklistedToken.objects.count(), 2)
+        self.assertFalse(self.checkpoint_file.exists())
+    
+    def test_success_prune_dry_run_removes_nothing(self):
+        report = TokenPruner(batch_size=2, sleep=0, dry_run=True).run()
+        
+        self.assertEqual(report['outstanding'], 5)
+        self.assertEqual(report['blacklisted'], 2)
+        self.assertEqual(OutstandingToken.objects.count(), 10)
+        self.assertEqual(BlacklistedToken.objects.count(), 4)
+    
+    def test_success_prune_resumes_from_checkpoint(self):
+        pruner = TokenPruner(batch_size=2, sleep=0, checkpoint_file=self.checkpoint_file)
+        
+        def interrupt(report):
+            raise KeyboardInterrupt
+        
+        with self.assertRaises(KeyboardInterrupt):
+            pruner.run(progress=interrupt)
+        
+        first_batch = OutstandingToken.objects.filter(jti__in=['jti-1', 'jti-3'])
+        
+        self.assertFalse(first_batch.exists())
+        self.assertEqual(
+            json.loads(self.checkpoint_file.read_text())['last_pk'],
+            OutstandingToken.objects.filter(jti='jti-4').values_list('pk', flat=True).get() - 1
+        )
+        
+        report = pruner.run()
+        
+        self.assertEqual(report['outstanding'], 3)
+        self.assertFalse(self.checkpoint_file.exists())
+    
+    def test_success_prune_tokens_command(self):
+        out = StringIO()
+        call_command('prune_tokens', batch_size=3, sleep=0, checkpoint_file=str(self.checkpoint_file), stdout=out)
+        
+        self.assertIn('Removed 5 outstanding / 2 blacklisted tokens in 2 batches', out.getvalue())
+        self.assertIn('rows/s', out.getvalue())
+    
+    def test_fail_prune_expired_tokens_while_already_running(self):
+        cache.add('token-pruning:lock', 1)
+        try:
+            self.assertIsNone(prune_expired_tokens(sleep=0))
+        finally:
+            cache.delete('token-pruning:lock')
+        
+        self.assertEqual(prune_expired_tokens(sleep=0, checkpoint_file=str(self.checkpoint_file))['outstanding'], 5)
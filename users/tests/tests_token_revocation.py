@@ -0,0 +1,100 @@
+import datetime
+
+from django.test  import TestCase
+from django.utils import timezone
+
+from rest_framework_simplejwt.tokens import OutstandingToken, BlacklistedToken
+
+from users.models                 import User
+from users.utils.token_revocation import revoke_user_tokens
+
+
+class RevokeUserTokensTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.f_user = User.objects\
+                         .create(
+                             email    = 'user@example.com',
+                             nickname = 'user',
+                             kakao_id = 12345678910
+                         )
+                         
+        cls.s_user = User.objects\
+                         .create(
+                             email    = 'test@example.com',
+                             nickname = 'test',
+                             kakao_id = 123456789
+                         )
+    
+    def create_tokens(self, user, count, expired=False):
+        now        = timezone.now()
+        expires_at = now - datetime.timedelta(days=1) if expired else now + datetime.timedelta(days=7)
+        prefix     = f'{user.id}-{"expired" if expired else "active"}-{OutstandingToken.objects.count()}'
+        
+        return OutstandingToken.objects\
+                               .bulk_create([
+                                   OutstandingToken(
+                                       user       = user,
+                                       jti        = f'{prefix}-{i}',
+                                       token      = f'token-{prefix}-{i}',
+                                       created_at = now,
+                                       expires_at = expires_at,
+                                   )
+                                   for i in range(count)
+                               ])
+    
+    def test_success_revoke_user_tokens_with_single_token(self):
+        self.create_tokens(self.f_user, 1)
+        
+        with self.assertNumQueries(1):
+            revoked = revoke_user_tokens(self.f_user.id)
+            
+        self.assertEqual(revoked, 1)
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+        
+    def test_success_revoke_user_tokens_with_many_tokens(self):
+        self.create_tokens(self.f_user, 10000)
+        
+        with self.assertNumQueries(1):
+            revoked = revoke_user_tokens(self.f_user.id)
+            
+        self.assertEqual(revoked, 10000)
+        self.assertEqual(BlacklistedToken.objects.count(), 10000)
+        
+    def test_success_revoke_user_tokens_skips_expired_tokens(self):
+        self.create_tokens(self.f_user, 2)
+        self.create_tokens(self.f_user, 3, expired=True)
+        
+        revoked = revoke_user_tokens(self.f_user.id)
+        
+        self.assertEqual(revoked, 2)
+        self.assertFalse(
+            BlacklistedToken.objects\
+                            .filter(token__expires_at__lte=timezone.now())\
+                            .exists()
+        )
+        
+    def test_success_revoke_user_tokens_skips_blacklisted_tokens(self):
+        tokens = self.create_tokens(self.f_user, 3)
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=tokens[0].jti))
+        
+        with self.assertNumQueries(1):
+            revoked = revoke_user_tokens(self.f_user.id)
+            
+        self.assertEqual(revoked, 2)
+        self.assertEqual(BlacklistedToken.objects.count(), 3)
+        self.assertEqual(revoke_user_tokens(self.f_user.id), 0)
+        
+    def test_success_revoke_user_tokens_only_own_tokens(self):
+        self.create_tokens(self.f_user, 2)
+        self.create_tokens(self.s_user, 2)
+        
+        revoked = revoke_user_tokens(self.f_user.id)
+        
+        self.assertEqual(revoked, 2)
+        self.assertFalse(
+            BlacklistedToken.objects\
+                            .filter(token__user=self.s_user)\
+                            .exists()
+        )
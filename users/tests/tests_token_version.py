@@ -0,0 +1,114 @@
+import json
+
+from django.conf import settings
+
+from rest_framework.test             import APITestCase
+from rest_framework_simplejwt.tokens import BlacklistedToken, AccessToken
+
+from unittest.mock import patch
+from unittest      import mock
+
+from users.models                 import User
+from users.tokens                 import VersionedRefreshToken
+from users.utils.token_revocation import revoke_all_sessions
+from users.utils.blacklist_index  import blacklist_index
+
+from core.utils.kakao_cache import profile_cache
+
+
+class MockedResponse:
+    status_code = 200
+    
+    def json(self):
+        return {
+            'id': 12345678910,
+            'kakao_account': {
+                'email'  : 'user@example.com',
+                'profile': {
+                    'nickname': 'user'
+                }
+            }
+        }
+
+
+@patch('core.utils.get_obj_n_check_err.kakao_client')
+class UserTokenVersionTest(APITestCase):
+    
+    maxDiff = None
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects\
+                       .create(
+                           email    = 'user@example.com',
+                           nickname = 'user',
+                           kakao_id = 12345678910
+                       )
+    
+    def setUp(self):
+        profile_cache.clear()
+        blacklist_index.reset()
+    
+    def signin(self, mocked_client):
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
+        
+        headers = {'HTTP_Authorization': 'kakao token'}
+        return self.client\
+                   .get('/api/users/kakao-signin', **headers, content_type='application/json')\
+                   .json()
+    
+    def signout(self, tokens):
+        data    = {'refresh_token': tokens['refresh']}
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {tokens["access"]}'}
+        return self.client\
+                   .post('/api/users/signout', data=json.dumps(data), content_type='application/json', **headers)
+    
+    def refresh(self, tokens):
+        data = {'refresh': tokens['refresh']}
+        return self.client\
+                   .post('/api/users/token-refresh', data=json.dumps(data), content_type='application/json')
+    
+    def test_success_signin_tokens_carry_token_version(self, mocked_client):
+        tokens = self.signin(mocked_client)
+        
+        self.user.refresh_from_db()
+        
+        self.assertEqual(VersionedRefreshToken(tokens['refresh'])[settings.TOKEN_VERSION_CLAIM], self.user.token_version)
+        self.assertEqual(AccessToken(tokens['access'])[settings.TOKEN_VERSION_CLAIM], self.user.token_version)
+    
+    def test_success_signin_revokes_previous_session_without_blacklisting(self, mocked_client):
+        first  = self.signin(mocked_client)
+        second = self.signin(mocked_client)
+        
+        self.assertEqual(self.refresh(first).status_code, 401)
+        self.assertEqual(self.refresh(second).status_code, 200)
+        self.assertFalse(BlacklistedToken.objects.exists())
+    
+    def test_success_signout_rejects_every_session(self, mocked_client):
+        tokens = self.signin(mocked_client)
+        other  = {
+            'refresh': str(VersionedRefreshToken.for_user(User.objects.get(pk=self.user.pk)))
+        }
+        
+        self.assertEqual(self.signout(tokens).status_code, 204)
+        
+        self.assertEqual(self.refresh(tokens).status_code, 401)
+        self.assertEqual(self.refresh(other).status_code, 401)
+        self.assertEqual(self.signout(tokens).status_code, 401)
+        self.assertEqual(self.signout(tokens).json()['code'], 'token_not_valid')
+    
+    def test_success_signout_blacklists_only_presented_refresh_token(self, mocked_client):
+        tokens = self.signin(mocked_client)
+        VersionedRefreshToken.for_user(User.objects.get(pk=self.user.pk))
+        
+        self.signout(tokens)
+        
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+        self.assertEqual(BlacklistedToken.objects.get().token.jti, VersionedRefreshToken(tokens['refresh'], verify=False)['jti'])
+    
+    def test_success_revoke_all_sessions_is_single_update(self, mocked_client):
+        with self.assertNumQueries(1):
+            revoke_all_sessions(self.user.id)
+        
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 1)
@@ -0,0 +1,137 @@
+from django.conf                import settings
+from django.db                  import connection
+from django.test.utils          import CaptureQueriesContext
+
+from rest_framework.test             import APITestCase, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.authentication         import VersionedJWTAuthentication
+from users.models                 import User
+from users.tokens                 import VersionedRefreshToken
+from users.utils.token_revocation import revoke_all_sessions
+from users.utils.user_cache       import AuthUser, user_cache
+from users.utils.blacklist_index  import blacklist_index
+
+
+class CachedUserAuthenticationTest(APITestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects\
+                       .create(
+                           email    = 'user@example.com',
+                           nickname = 'user',
+                           kakao_id = 12345678910
+                       )
+    
+    def setUp(self):
+        user_cache.clear()
+    
+    def authenticate(self, token_version=0):
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {self.access_token(token_version)}')
+        return VersionedJWTAuthentication().authenticate(request)[0]
+    
+    def access_token(self, token_version):
+        token = AccessToken.for_user(self.user)
+        token[settings.TOKEN_VERSION_CLAIM] = token_version
+        return str(token)
+    
+    def user_queries(self, captured):
+        return [query['sql'] for query in captured.captured_queries if User._meta.db_table in query['sql']]
+    
+    def test_success_user_is_loaded_once_without_password(self):
+        with CaptureQueriesContext(connection) as captured:
+            first  = self.authenticate()
+            second = self.authenticate()
+        
+        queries = self.user_queries(captured)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('password', queries[0])
+        self.assertIsInstance(first, AuthUser)
+        self.assertIs(first, second)
+        self.assertEqual((first.pk, first.is_staff, first.is_authenticated), (self.user.pk, False, True))
+    
+    def test_success_newer_token_version_reloads_user(self):
+        self.authenticate()
+        User.objects.filter(pk=self.user.pk).update(token_version=1)
+        
+        with CaptureQueriesContext(connection) as captured:
+            user = self.authenticate(token_version=1)
+        
+        self.assertEqual(len(self.user_queries(captured)), 1)
+        self.assertEqual(user.token_version, 1)
+    
+    def test_fail_revoked_token_is_rejected_immediately(self):
+        self.authenticate()
+        
+        revoke_all_sessions(self.user.pk)
+        
+        response = self.client.post('/api/users/signout', HTTP_AUTHORIZATION=f'Bearer {self.access_token(0)}')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'token_not_valid')
+    
+    def test_fail_deactivated_user_is_rejected_after_save(self):
+        self.authenticate()
+        
+        self.user.is_active = False
+        self.user.save()
+        
+        response = self.client.post('/api/users/signout', HTTP_AUTHORIZATION=f'Bearer {self.access_token(0)}')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'user_inactive')
+    
+    def test_fail_deleted_user_is_rejected(self):
+        token = self.access_token(0)
+        self.authenticate()
+        
+        User.objects.get(pk=self.user.pk).delete()
+        
+        response = self.client.post('/api/users/signout', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'user_not_found')
+
+    
+    def refresh(self, token):
+        return self.client.post('/api/users/token-refresh', {'refresh': str(token)}, format='json')
+    
+    def test_success_token_refresh_reads_token_state_from_primary_once(self):
+        token = VersionedRefreshToken.for_user(self.user)
+        blacklist_index.prime()
+        self.refresh(token)
+        
+        with CaptureQueriesContext(connection) as captured:
+            response = self.refresh(token)
+        
+        queries = self.user_queries(captured)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('token_version', queries[0])
+        self.assertIn('is_active', queries[0])
+        self.assertNotIn('password', queries[0])
+    
+    def test_fail_token_refresh_after_revoke_in_another_worker_is_rejected_immediately(self):
+        token = VersionedRefreshToken.for_user(self.user)
+        self.authenticate()
+        self.refresh(token)
+        
+        # 다른 워커의 로그아웃: DB의 토큰 세대만 바뀌고 이 워커의 캐시(user_cache)는 그대로
+        User.objects.filter(pk=self.user.pk).update(token_version=1)
+        
+        self.assertEqual(user_cache.get(self.user.pk).token_version, 0)
+        self.assertEqual(self.refresh(token).status_code, 401)
+    
+    def test_fail_token_refresh_of_deactivated_user_is_rejected(self):
+        token = VersionedRefreshToken.for_user(self.user)
+        self.refresh(token)
+        
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        
+        self.assertEqual(self.refresh(token).status_code, 401)
+    
+    def test_fail_token_refresh_after_revoke_is_rejected_immediately(self):
+        token = VersionedRefreshToken.for_user(self.user)
+        self.refresh(token)
+        
+        revoke_all_sessions(self.user.pk)
+        
+        self.assertEqual(self.refresh(token).status_code, 401)
@@ -0,0 +1,100 @@
+import json
+
+from rest_framework.test             import APITestCase
+from rest_framework_simplejwt.tokens import OutstandingToken, BlacklistedToken, RefreshToken
+
+from unittest.mock import patch
+from unittest      import mock
+
+from core.db.write_behind         import WriteBehindQueue
+from core.utils.kakao_cache       import profile_cache
+from users.models                 import User
+from users.utils.token_revocation import revoke_token
+
+
+class MockedResponse:
+    status_code = 200
+    
+    def json(self):
+        return {
+            'id': 12345678910,
+            'kakao_account': {
+                'email'  : 'user@example.com',
+                'profile': {
+                    'nickname': 'user'
+                }
+            }
+        }
+
+
+@patch('core.utils.get_obj_n_check_err.kakao_client')
+class WriteBehindSignInTest(APITestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        User.objects\
+            .create(
+                email    = 'user@example.com',
+                nickname = 'user',
+                kakao_id = 12345678910
+            )
+    
+    def setUp(self):
+        profile_cache.clear()
+        
+        self.queue = WriteBehindQueue({'ENABLED': True, 'FLUSH_INTERVAL': 60})
+        self.addCleanup(self.queue.close)
+        for target in ('users.utils.token_minting', 'users.views.signout', 'users.utils.token_revocation'):
+            patcher = patch(f'{target}.write_behind', self.queue)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def signin(self, mocked_client):
+        mocked_client.get = mock.MagicMock(return_value = MockedResponse())
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get('/api/users/kakao-signin', HTTP_Authorization='kakao token')
+        
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+    
+    def signout(self, tokens):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client\
+                       .post(
+                           '/api/users/signout',
+                           data               = json.dumps({'refresh_token': tokens['refresh']}),
+                           content_type       = 'application/json',
+                           HTTP_AUTHORIZATION = f"Bearer {tokens['access']}",
+                       )
+    
+    def test_token_record_is_written_by_flush(self, mocked_client):
+        self.signin(mocked_client)
+        
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertEqual(self.queue.pending, 1)
+        
+        self.queue.flush()
+        
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+    
+    def test_immediate_signout_blacklists_queued_token(self, mocked_client):
+        tokens   = self.signin(mocked_client)
+        response = self.signout(tokens)
+        
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.queue.pending, 2)
+        
+        self.queue.flush()
+        
+        self.assertTrue(BlacklistedToken.objects.filter(token__token=tokens['refresh']).exists())
+        
+        response = self.client.post('/api/users/token-refresh', {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 401)
+    
+    def test_revoking_flushes_queued_tokens_first(self, mocked_client):
+        tokens = self.signin(mocked_client)
+        jti    = RefreshToken(tokens['refresh'], verify=False)['jti']
+        
+        self.assertEqual(revoke_token(jti), 1)
+        self.assertEqual(self.queue.pending, 0)
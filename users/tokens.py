@@ -0,0 +1,75 @@
+from django.conf              import settings
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings   import api_settings
+from rest_framework_simplejwt.tokens     import RefreshToken, OutstandingToken
+from rest_framework_simplejwt.utils      import datetime_from_epoch
+
+from core.db                     import routers
+from core.db.routers             import read_your_writes
+from core.db.write_behind        import write_behind
+from core.utils                  import metrics
+from users.models                import User
+from users.utils.blacklist_index import blacklist_index
+
+
+class IndexedRefreshToken(RefreshToken):
+    """
+    detail:
+      - 블랙리스트 확인을 DB 대신 블랙리스트 조회 인덱스(blacklist_index)로 처리하는 RefreshToken
+    """
+    
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        
+        if blacklist_index.is_blacklisted(jti):
+            raise TokenError(_('Token is blacklisted'))
+
+
+class VersionedRefreshToken(IndexedRefreshToken):
+    """
+    detail:
+      - 유저의 토큰 세대(User.token_version)를 클레임(TOKEN_VERSION_CLAIM)으로 포함하는 RefreshToken
+        > 발급된 access 토큰에도 같은 클레임이 복사 됨
+      - 발급 기록(OutstandingToken)은 쓰기 대기열(write_behind)로 저장
+        > 토큰의 유효성은 서명과 토큰 세대로 판단하므로 기록이 DB에 늦게 반영되어도 인증/갱신에 영향 없음
+      - 토큰 갱신 시 유저의 현재 토큰 세대와 다르거나 비활성화된 유저이면 거부
+        > 클레임이 없는(세대 도입 이전에 발급된) 토큰은 0세대로 취급
+        > 토큰 세대와 활성 여부는 primary DB에서 PK로 조회(쿼리 1회)
+          * 워커별 캐시(user_cache)나 replica는 다른 워커의 로그아웃이 늦게 반영되므로 사용하지 않음
+          * 갱신은 access 토큰 인증보다 드물고, 새 토큰을 발급하므로 로그아웃이 즉시 반영되어야 함
+        > 로그인/로그아웃 직후의 유저이면 블랙리스트를 primary DB에서 읽음(read_your_writes)
+    """
+    
+    @classmethod
+    def for_user(cls, user):
+        token = cls()
+        token[api_settings.USER_ID_CLAIM]  = getattr(user, api_settings.USER_ID_FIELD)
+        token[settings.TOKEN_VERSION_CLAIM] = user.token_version
+        
+        write_behind.save(
+            OutstandingToken(
+                user       = user,
+                jti        = token[api_settings.JTI_CLAIM],
+                token      = str(token),
+                created_at = token.current_time,
+                expires_at = datetime_from_epoch(token['exp']),
+            )
+        )
+        metrics.count_tokens('minted')
+        return token
+    
+    def verify(self, *args, **kwargs):
+        read_your_writes.activate(self.payload.get(api_settings.USER_ID_CLAIM))
+        super().verify(*args, **kwargs)
+        
+        token_version = self.payload.get(settings.TOKEN_VERSION_CLAIM, 0)
+        state         = User.objects\
+                            .using(routers.config()['PRIMARY'])\
+                            .filter(pk=self.payload.get(api_settings.USER_ID_CLAIM))\
+                            .values_list('token_version', 'is_active')\
+                            .first()
+        
+        if state != (token_version, True):
+            raise TokenError(_('Token is invalid or expired'))
\ No newline at end of file
@@ -1,16 +1,22 @@
+from django.conf import settings
 from django.urls import path
 
-from users.views.social_signin import KakaoSignInView
-from users.views.signout       import UserSignOutView
+from users.views.social_signin       import KakaoSignInView
+from users.views.social_signin_async import kakao_signin_async_view
+from users.views.signout             import UserSignOutView
+from users.views.token_refresh       import UserTokenRefreshView
 
-from rest_framework_simplejwt.views import TokenRefreshView
 
+"""
+ASGI 배포(config/asgi.py)에서는 비동기 로그인 뷰 사용
+"""
+signin_view = kakao_signin_async_view if settings.ASYNC_SIGNIN else KakaoSignInView.as_view()
 
 urlpatterns = [
-    path('/kakao-signin', KakaoSignInView.as_view()),
+    path('/kakao-signin', signin_view),
     path('/signout', UserSignOutView.as_view()),
 ]
 
 urlpatterns += [
-    path('/token-refresh', TokenRefreshView.as_view()),
+    path('/token-refresh', UserTokenRefreshView.as_view()),
 ]
\ No newline at end of file
@@ -0,0 +1,239 @@
+import sys, math, time, hashlib, threading
+
+from typing import Dict, Iterable, Optional
+
+from django.conf       import settings
+from django.core.cache import caches
+from django.utils      import timezone
+
+from rest_framework_simplejwt.tokens import BlacklistedToken
+
+from core.db import routers
+
+
+DEFAULTS = {
+    'REFRESH_INTERVAL': 5,
+    'REBUILD_INTERVAL': 3600,
+    'OVERLAP'         : 1000,
+    'MAX_MEMORY'      : 8 * 1024 * 1024,
+    'SHARED_EPOCH'    : True,
+    'CACHE_ALIAS'     : 'default',
+    'EPOCH_KEY'       : 'blacklist-index:epoch',
+}
+
+"""
+jti(uuid4 hex 32자) 문자열 하나와 set 슬롯이 차지하는 대략적인 메모리(byte)
+"""
+ENTRY_SIZE = sys.getsizeof('0' * 32) + 16
+
+
+class BloomFilter:
+    """
+    detail:
+      - 블랙리스트 jti가 메모리 상한(MAX_MEMORY)을 넘을 때 사용하는 Bloom filter
+      - 없는 jti는 항상 없다고 판단(false negative 없음), 있다고 판단한 경우에만 DB로 확인
+    """
+
+    def __init__(self, size_bytes: int, capacity: int):
+        self.bits   = bytearray(max(1, size_bytes))
+        self.nbits  = len(self.bits) * 8
+        self.hashes = min(16, max(1, round(self.nbits / max(1, capacity) * math.log(2))))
+
+    def _positions(self, value: str) -> Iterable[int]:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1     = int.from_bytes(digest[:8], 'little')
+        h2     = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.nbits for i in range(self.hashes))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class BlacklistIndex:
+    """
+    detail:
+      - 토큰 갱신(TokenRefreshView) 시 블랙리스트 조회를 DB 대신 메모리에서 처리
+      - 만료되지 않은 블랙리스트 토큰의 jti를 set(또는 메모리 상한 초과 시 Bloom filter)으로 보관
+        > set: 포함 여부가 정확하므로 DB 조회 없음
+        > Bloom filter: 포함된 것으로 판단한 경우(probable hit)에만 DB 조회
+      - 갱신 방식
+        > REFRESH_INTERVAL마다 마지막으로 읽은 BlacklistedToken id(high-water mark) 이후 행만 추가로 읽음
+        > 커밋 순서가 id 순서와 다를 수 있으므로 OVERLAP 만큼 이전 id부터 다시 읽음
+        > REBUILD_INTERVAL마다 전체를 다시 읽어 만료된 토큰을 제거
+      - 인덱스는 primary에서 읽음(DATABASE_ROUTING PRIMARY)
+        > 복제 지연 중인 replica에서 읽고 새 epoch로 표시하면, 방금 추가된 블랙리스트 행을 다음 갱신까지 놓치게 됨
+      - 로그인/로그아웃에서 토큰을 블랙리스트 처리하면 mark_stale()로 즉시 갱신 대상이 됨
+        > SHARED_EPOCH: 공유 캐시(CACHES)의 epoch 값으로 다른 워커에도 갱신 필요를 알림
+          * 워커별 캐시(LocMemCache)로는 다른 워커에 알릴 수 없으므로 공유 캐시가 필요(core.checks)
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config = {**DEFAULTS, **(config or {})}
+        self._lock  = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def from_settings(cls) -> 'BlacklistIndex':
+        return cls(getattr(settings, 'TOKEN_BLACKLIST_INDEX', None))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries    = None
+            self._count      = 0
+            self._high_water = 0
+            self._refreshed  = 0.0
+            self._rebuilt    = 0.0
+            self._stale      = True
+            self._epoch      = None
+            self.stats       = dict.fromkeys(
+                ('lookups', 'negatives', 'positives', 'db_checks', 'false_positives', 'refreshes', 'rebuilds'),
+                0,
+            )
+
+    @property
+    def cache(self):
+        return caches[self.config['CACHE_ALIAS']]
+
+    @property
+    def is_bloom(self) -> bool:
+        return isinstance(self._entries, BloomFilter)
+
+    def _shared_epoch(self):
+        if not self.config['SHARED_EPOCH']:
+            return None
+        return self.cache.get(self.config['EPOCH_KEY'])
+
+    def mark_stale(self) -> None:
+        """
+        토큰을 블랙리스트에 추가한 직후 호출(DB 조회 없음)
+        """
+        self._stale = True
+        if self.config['SHARED_EPOCH']:
+            key = self.config['EPOCH_KEY']
+            if not self.cache.add(key, 1, timeout=None):
+                try:
+                    self.cache.incr(key)
+                except ValueError:
+                    self.cache.set(key, 1, timeout=None)
+
+    def _rows(self, after: int):
+        return BlacklistedToken.objects\
+                               .using(routers.config()['PRIMARY'])\
+                               .filter(id__gt=after, token__expires_at__gt=timezone.now())\
+                               .order_by('id')\
+                               .values_list('id', 'token__jti')\
+                               .iterator()
+
+    def _build(self, jtis: list):
+        if len(jtis) * ENTRY_SIZE <= self.config['MAX_MEMORY']:
+            return set(jtis)
+        bloom = BloomFilter(self.config['MAX_MEMORY'], len(jtis) * 2)
+        for jti in jtis:
+            bloom.add(jti)
+        return bloom
+
+    def _add(self, jtis: list) -> None:
+        self._count += len(jtis)
+        if not self.is_bloom and self._count * ENTRY_SIZE > self.config['MAX_MEMORY']:
+            self._entries = self._build(list(self._entries) + jtis)
+            return
+        for jti in jtis:
+            self._entries.add(jti)
+
+    def rebuild(self) -> None:
+        rows, high_water = [], 0
+        for row_id, jti in self._rows(0):
+            rows.append(jti)
+            high_water = row_id
+
+        self._entries    = self._build(rows)
+        self._count      = len(rows)
+        self._high_water = high_water
+        self._rebuilt    = self._refreshed = time.monotonic()
+        self.stats['rebuilds'] += 1
+
+    def refresh(self) -> None:
+        """
+        high-water mark 이후(OVERLAP 포함)에 추가된 블랙리스트 토큰만 읽어 반영
+        """
+        rows, high_water = [], self._high_water
+        for row_id, jti in self._rows(max(0, self._high_water - self.config['OVERLAP'])):
+            rows.append(jti)
+            high_water = max(high_water, row_id)
+
+        self._add(rows if self.is_bloom else [jti for jti in rows if jti not in self._entries])
+        self._high_water = high_water
+        self._refreshed  = time.monotonic()
+        self.stats['refreshes'] += 1
+
+    def _due(self, epoch):
+        """
+        지금 필요한 갱신(rebuild/refresh), 필요 없으면 None
+        """
+        now = time.monotonic()
+        if self._entries is None or now - self._rebuilt >= self.config['REBUILD_INTERVAL']:
+            return self.rebuild
+        if self._stale or epoch != self._epoch or now - self._refreshed >= self.config['REFRESH_INTERVAL']:
+            return self.refresh
+        return None
+
+    def _ensure_fresh(self) -> None:
+        """
+        detail:
+          - 락을 얻은 뒤 갱신 필요 여부를 다시 확인, 락을 기다리는 동안 다른 스레드가 갱신했다면 다시 읽지 않음
+          - 갱신 중에 들어온 mark_stale()을 놓치지 않도록 갱신 전에 stale 표시를 해제
+        """
+        epoch = self._shared_epoch()
+        if self._due(epoch) is None:
+            return
+
+        with self._lock:
+            update = self._due(epoch)
+            if update is None:
+                return
+
+            self._stale, self._epoch = False, epoch
+            try:
+                update()
+            except Exception:
+                self._stale = True
+                raise
+
+    def prime(self) -> None:
+        """
+        워커 시작 시 호출, 첫 토큰 갱신 요청 전에 인덱스를 미리 생성
+        """
+        self._ensure_fresh()
+
+    def is_blacklisted(self, jti: str) -> bool:
+        self._ensure_fresh()
+        self.stats['lookups'] += 1
+
+        if jti not in self._entries:
+            self.stats['negatives'] += 1
+            return False
+
+        self.stats['positives'] += 1
+        if not self.is_bloom:
+            return True
+
+        self.stats['db_checks'] += 1
+        if BlacklistedToken.objects.using(routers.config()['PRIMARY']).filter(token__jti=jti).exists():
+            return True
+        self.stats['false_positives'] += 1
+        return False
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            **self.stats,
+            'entries'   : self._count,
+            'mode'      : 'bloom' if self.is_bloom else 'set',
+            'high_water': self._high_water,
+        }
+
+
+blacklist_index = BlacklistIndex.from_settings()
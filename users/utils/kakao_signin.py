@@ -0,0 +1,104 @@
+import copy
+
+from typing import Tuple, Any
+
+from django.db import transaction
+
+from core.db.routers                import read_your_writes
+from core.utils.get_obj_n_check_err import GetKakaoAccount
+from core.utils.kakao_cache         import hash_token
+from core.utils.singleflight        import SingleFlight
+from users.models                   import User
+from users.utils.token_minting      import token_minter
+from users.utils.token_revocation   import revoke_all_sessions
+
+
+"""
+같은 워커에서 동시에 들어온 같은 로그인 요청의 조회 작업을 한 번만 처리
+  - token_flight  : 같은 카카오 액세스 토큰(중복 요청) -> 카카오 API 호출 공유
+  - account_flight: 같은 카카오 계정(여러 기기) -> 유저 조회/생성 공유
+  - 토큰은 요청마다 발급(jti가 요청마다 다르므로 한 기기의 로그아웃이 다른 요청의 토큰에 영향을 주지 않음)
+"""
+token_flight   = SingleFlight()
+account_flight = SingleFlight()
+
+
+def parse_kakao_account(kakao: dict) -> Tuple[Any, str]:
+    """
+    카카오 유저정보에서 로그인에 필요한 값(kakao_id, email, nickname)을 추출
+    """
+    try:
+        kakao_id = kakao['id']
+        email    = kakao['kakao_account']['email']
+        nickname = kakao['kakao_account']['profile']['nickname']
+    except:
+        return None, '카카오 계정의 유저정보를 가져올 수 없습니다.'
+    
+    return (kakao_id, email, nickname), None
+
+
+def mint_session(user: User) -> dict:
+    """
+    detail:
+      - 기존 세션 로그아웃(토큰 세대 변경) 후 신규 토큰 발급(token_minter)
+      - 여러 워커에서 같은 유저가 동시에 로그인해도 순서대로 처리
+        > 트랜잭션 안에서 token_version UPDATE가 유저 행을 잠그므로, 다른 요청은 커밋될 때까지 대기
+        > 잠그는 행이 하나뿐이라 교착상태가 생기지 않음
+        > 각 요청은 자신이 올린 세대로 토큰을 발급하므로, 마지막 로그인의 토큰만 유효
+    """
+    with transaction.atomic():
+        revoke_all_sessions(user.id)
+        user.refresh_from_db(fields=['token_version'])
+        return token_minter.mint(user)
+
+
+def upsert_user(kakao_id: int, email: str, nickname: str) -> Tuple[User, bool]:
+    return User.objects\
+               .get_or_create(
+                   kakao_id = kakao_id,
+                   defaults = {'email': email, 'nickname': nickname}
+               )
+
+
+def sign_in_kakao_user(kakao_id: int, email: str, nickname: str) -> Tuple[dict, bool]:
+    """
+    detail:
+      - 유저 조회/생성, 기존 세션 로그아웃(토큰 세대 변경), 신규 토큰 발급
+      - 동기(KakaoSignInView)/비동기(kakao_signin_async_view) 로그인이 공통으로 사용
+        > 비동기 뷰에서는 sync_to_async로 감싸 한 번의 스레드 전환으로 ORM 작업을 처리
+      - 같은 카카오 계정의 동시 로그인은 유저 조회/생성만 한 번 처리(account_flight), 토큰은 요청마다 발급
+        > 공유된 유저 인스턴스는 요청마다 복사해서 사용(mint_session이 token_version을 다시 읽음)
+      - 이후 잠시 동안 유저의 요청은 primary DB에서 읽음(read_your_writes)
+    """
+    (user, is_created), _ = account_flight.do(kakao_id, lambda: upsert_user(kakao_id, email, nickname))
+    user = copy.copy(user)
+    
+    data = token_minter.mint(user) if is_created else mint_session(user)
+    
+    read_your_writes.pin(user.id)
+    return data, is_created
+
+
+def fetch_kakao_account(kakao_token: str) -> Tuple[Any, str]:
+    """
+    카카오 액세스 토큰으로 로그인에 필요한 카카오 계정 정보 조회 -> (kakao_id, email, nickname), 에러 메시지
+    """
+    kakao, err = GetKakaoAccount.get_kakao_user_account_n_check_err(kakao_token)
+    if err:
+        return None, err
+    
+    return parse_kakao_account(kakao)
+
+
+def coalesced_sign_in(kakao_token: str) -> Tuple[dict, int]:
+    """
+    detail:
+      - 카카오 액세스 토큰으로 로그인 -> (응답 데이터, 상태코드)
+      - 같은 카카오 액세스 토큰으로 동시에 들어온 로그인(중복 요청)은 카카오 API 호출만 한 번 처리(token_flight)
+    """
+    (account, err), _ = token_flight.do(hash_token(kakao_token), lambda: fetch_kakao_account(kakao_token))
+    if err:
+        return {'detail': err}, 401
+    
+    data, is_created = sign_in_kakao_user(*account)
+    return data, 201 if is_created else 200
@@ -0,0 +1,102 @@
+import json
+
+from typing import Dict, Tuple
+from uuid   import uuid4
+
+from django.conf import settings
+
+from jwt.algorithms import get_default_algorithms
+from jwt.utils      import base64url_encode
+
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state    import token_backend
+from rest_framework_simplejwt.tokens   import AccessToken, OutstandingToken, RefreshToken
+from rest_framework_simplejwt.utils    import aware_utcnow, datetime_from_epoch, datetime_to_epoch
+
+from core.db.write_behind import write_behind
+from core.utils           import metrics
+
+
+class TokenPairMinter:
+    """
+    detail:
+      - 로그인 시 refresh/access 토큰 쌍을 한 번에 발급
+        > VersionedRefreshToken.for_user() + access_token과 같은 클레임, 같은 형식(PyJWT와 같은 헤더/JSON)의 토큰
+        > Token 객체, PyJWT의 인자 검증/알고리즘 조회/키 변환을 거치지 않음
+      - 서명 키(알고리즘별로 변환한 키)와 JWT 헤더 세그먼트는 생성 시 한 번만 준비
+      - refresh 토큰은 발급 기록(OutstandingToken)을 쓰기 대기열(write_behind)로 저장
+    """
+
+    def __init__(self, backend):
+        self.algorithm = get_default_algorithms()[backend.algorithm]
+        self.key       = self.algorithm.prepare_key(backend.signing_key)
+        self.encoder   = backend.json_encoder
+        self.extra     = {
+            claim: value
+            for claim, value in (('aud', backend.audience), ('iss', backend.issuer))
+            if value is not None
+        }
+        self.header = base64url_encode(
+            json.dumps({'typ': 'JWT', 'alg': backend.algorithm}, separators=(',', ':'), sort_keys=True).encode()
+        )
+
+    @classmethod
+    def from_settings(cls) -> 'TokenPairMinter':
+        """
+        SIMPLE_JWT 설정(ALGORITHM, SIGNING_KEY, AUDIENCE, ISSUER)으로 생성된 TokenBackend 사용
+        """
+        return cls(token_backend)
+
+    def encode(self, payload: dict) -> str:
+        """
+        TokenBackend.encode(payload)와 같은 토큰
+        """
+        if self.extra:
+            payload = {**payload, **self.extra}
+        segments = self.header + b'.' + base64url_encode(json.dumps(payload, separators=(',', ':'), cls=self.encoder).encode())
+        return (segments + b'.' + base64url_encode(self.algorithm.sign(segments, self.key))).decode()
+
+    def claims(self, user, now) -> Tuple[dict, dict]:
+        """
+        (refresh, access) 토큰 페이로드, 두 토큰의 iat와 만료시각 기준(now)은 같음
+        """
+        iat    = datetime_to_epoch(now)
+        shared = {
+            api_settings.USER_ID_CLAIM  : getattr(user, api_settings.USER_ID_FIELD),
+            settings.TOKEN_VERSION_CLAIM: user.token_version,
+        }
+        refresh = {
+            api_settings.TOKEN_TYPE_CLAIM: RefreshToken.token_type,
+            'exp'                        : datetime_to_epoch(now + RefreshToken.lifetime),
+            'iat'                        : iat,
+            api_settings.JTI_CLAIM       : uuid4().hex,
+            **shared,
+        }
+        access = {
+            api_settings.TOKEN_TYPE_CLAIM: AccessToken.token_type,
+            'exp'                        : datetime_to_epoch(now + AccessToken.lifetime),
+            'iat'                        : iat,
+            api_settings.JTI_CLAIM       : uuid4().hex,
+            **shared,
+        }
+        return refresh, access
+
+    def mint(self, user) -> Dict[str, str]:
+        now             = aware_utcnow()
+        refresh, access = self.claims(user, now)
+        data            = {'refresh': self.encode(refresh), 'access': self.encode(access)}
+
+        write_behind.save(
+            OutstandingToken(
+                user       = user,
+                jti        = refresh[api_settings.JTI_CLAIM],
+                token      = data['refresh'],
+                created_at = now,
+                expires_at = datetime_from_epoch(refresh['exp']),
+            )
+        )
+        metrics.count_tokens('minted')
+        return data
+
+
+token_minter = TokenPairMinter.from_settings()
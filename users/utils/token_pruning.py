@@ -0,0 +1,137 @@
+import json, time, logging
+
+from pathlib import Path
+from typing  import Dict, Optional
+
+from django.conf       import settings
+from django.core.cache import cache
+from django.utils      import timezone
+
+from rest_framework_simplejwt.tokens import OutstandingToken, BlacklistedToken
+
+from core.utils import metrics
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'BATCH_SIZE'     : 1000,
+    'SLEEP'          : 0.1,
+    'CHECKPOINT_FILE': None,
+    'LOCK_TIMEOUT'   : 3600,
+}
+
+
+class TokenPruner:
+    """
+    detail:
+      - 만료된 OutstandingToken(및 연결된 BlacklistedToken)을 pk 순서대로 BATCH_SIZE개씩 삭제
+        > 한 번의 큰 DELETE로 인한 긴 락/복제 지연을 피하기 위해 배치 사이에 SLEEP 초 대기
+      - 배치마다 마지막 pk를 checkpoint 파일에 기록, 중단된 경우 이어서 진행
+        > 끝까지 진행하면 checkpoint 파일 삭제
+      - dry_run: 삭제 대상 개수만 집계
+    """
+    
+    def __init__(self, batch_size: int, sleep: float, checkpoint_file: Optional[str] = None, dry_run: bool = False):
+        self.batch_size      = batch_size
+        self.sleep           = sleep
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
+        self.dry_run         = dry_run
+    
+    @classmethod
+    def from_settings(cls, **options) -> 'TokenPruner':
+        config = {**DEFAULTS, **getattr(settings, 'TOKEN_PRUNING', {})}
+        return cls(
+            batch_size      = options.get('batch_size') or config['BATCH_SIZE'],
+            sleep           = config['SLEEP'] if options.get('sleep') is None else options['sleep'],
+            checkpoint_file = options.get('checkpoint_file') or config['CHECKPOINT_FILE'],
+            dry_run         = options.get('dry_run', False),
+        )
+    
+    def load_checkpoint(self) -> int:
+        if self.checkpoint_file and self.checkpoint_file.exists():
+            return json.loads(self.checkpoint_file.read_text())['last_pk']
+        return 0
+    
+    def save_checkpoint(self, last_pk: int) -> None:
+        if self.checkpoint_file and not self.dry_run:
+            self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+            self.checkpoint_file.write_text(json.dumps({'last_pk': last_pk}))
+    
+    def clear_checkpoint(self) -> None:
+        if self.checkpoint_file and not self.dry_run and self.checkpoint_file.exists():
+            self.checkpoint_file.unlink()
+    
+    def batches(self, now):
+        last_pk = self.load_checkpoint()
+        while True:
+            ids = list(
+                OutstandingToken.objects\
+                                .filter(pk__gt=last_pk, expires_at__lte=now)\
+                                .order_by('pk')\
+                                .values_list('pk', flat=True)[:self.batch_size]
+            )
+            if not ids:
+                return
+            yield ids
+            last_pk = ids[-1]
+    
+    def delete(self, ids: list) -> Dict[str, int]:
+        if self.dry_run:
+            return {
+                'outstanding': len(ids),
+                'blacklisted': BlacklistedToken.objects.filter(token_id__in=ids).count(),
+            }
+        
+        _, deleted = OutstandingToken.objects\
+                                     .filter(pk__in=ids)\
+                                     .delete()
+        outstanding = deleted.get(OutstandingToken._meta.label, 0)
+        metrics.count_tokens('pruned', outstanding)
+        return {
+            'outstanding': outstanding,
+            'blacklisted': deleted.get(BlacklistedToken._meta.label, 0),
+        }
+    
+    def run(self, progress=None) -> Dict[str, object]:
+        now     = timezone.now()
+        started = time.perf_counter()
+        report  = {'batches': 0, 'outstanding': 0, 'blacklisted': 0, 'dry_run': self.dry_run}
+        
+        for ids in self.batches(now):
+            deleted = self.delete(ids)
+            self.save_checkpoint(ids[-1])
+            report['batches']     += 1
+            report['outstanding'] += deleted['outstanding']
+            report['blacklisted'] += deleted['blacklisted']
+            if progress:
+                progress(report)
+            if self.sleep:
+                time.sleep(self.sleep)
+        
+        self.clear_checkpoint()
+        
+        report['seconds']         = round(time.perf_counter() - started, 3)
+        report['rows']            = report['outstanding'] + report['blacklisted']
+        report['rows_per_second'] = round(report['rows'] / report['seconds'], 1) if report['seconds'] else 0.0
+        return report
+
+
+def prune_expired_tokens(**options) -> Optional[Dict[str, object]]:
+    """
+    detail:
+      - 스케줄러(cron, celery beat 등)에서 호출하는 진입점
+      - 여러 워커/서버에서 동시에 실행되지 않도록 캐시 락을 사용, 이미 실행 중이면 None 반환
+        > 서버 간 중복 실행을 막으려면 공유 캐시(CACHES)를 설정해야 함
+    """
+    lock_key     = 'token-pruning:lock'
+    lock_timeout = {**DEFAULTS, **getattr(settings, 'TOKEN_PRUNING', {})}['LOCK_TIMEOUT']
+    
+    if not cache.add(lock_key, 1, lock_timeout):
+        return None
+    try:
+        report = TokenPruner.from_settings(**options).run()
+        logger.info('pruned expired tokens: %s', report)
+        return report
+    finally:
+        cache.delete(lock_key)
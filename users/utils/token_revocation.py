@@ -0,0 +1,91 @@
+from django.db        import connections, router
+from django.db.models import F
+from django.utils     import timezone
+
+from rest_framework_simplejwt.tokens import OutstandingToken, BlacklistedToken
+
+from core.db.write_behind        import write_behind
+from core.utils                  import metrics
+from users.models                import User
+from users.utils.blacklist_index import blacklist_index
+from users.utils.user_cache      import user_cache
+
+
+def blacklist_outstanding_tokens(field: str, value: object) -> int:
+    """
+    detail:
+      - OutstandingToken.<field> = value(list이면 IN) 인 토큰 중 만료되지 않았고 아직 블랙리스트에 없는 토큰을 블랙리스트 처리
+      - 토큰 개수와 관계없이 쿼리 1회(INSERT ... SELECT)로 처리
+        > OutstandingToken LEFT JOIN BlacklistedToken(anti-join)으로 대상 토큰 선택
+        > 동시 요청으로 이미 추가된 토큰은 충돌을 무시(INSERT IGNORE / ON CONFLICT DO NOTHING)
+      - 이미 만료된 토큰은 처리하지 않음
+      - 이 워커의 쓰기 대기열(write_behind)에 있는 OutstandingToken을 먼저 DB에 반영
+      - 블랙리스트 조회 인덱스(blacklist_index)에 갱신 필요를 알림
+      - 반환값: 블랙리스트에 추가된 토큰 개수
+    """
+    write_behind.flush()
+    
+    values     = list(value) if isinstance(value, (list, tuple, set)) else [value]
+    connection = connections[router.db_for_write(BlacklistedToken)]
+    ops        = connection.ops
+    qn         = ops.quote_name
+    
+    outstanding = OutstandingToken._meta
+    blacklisted = BlacklistedToken._meta
+    token_id    = qn(blacklisted.get_field('token').column)
+    
+    sql = (
+        f'{ops.insert_statement(ignore_conflicts=True)} {qn(blacklisted.db_table)} '
+        f'({token_id}, {qn(blacklisted.get_field("blacklisted_at").column)}) '
+        f'SELECT o.{qn(outstanding.pk.column)}, %s '
+        f'FROM {qn(outstanding.db_table)} o '
+        f'LEFT OUTER JOIN {qn(blacklisted.db_table)} b ON b.{token_id} = o.{qn(outstanding.pk.column)} '
+        f'WHERE o.{qn(outstanding.get_field(field).column)} IN ({", ".join(["%s"] * len(values))}) '
+        f'AND o.{qn(outstanding.get_field("expires_at").column)} > %s '
+        f'AND b.{qn(blacklisted.pk.column)} IS NULL '
+        f'{ops.ignore_conflicts_suffix_sql(ignore_conflicts=True)}'
+    )
+    now = ops.adapt_datetimefield_value(timezone.now())
+    
+    with connection.cursor() as cursor:
+        cursor.execute(sql.strip(), [now, *values, now])
+        revoked = cursor.rowcount
+    
+    if revoked:
+        blacklist_index.mark_stale()
+        metrics.count_tokens('blacklisted', revoked)
+    return revoked
+
+
+def revoke_user_tokens(user_id: int) -> int:
+    """
+    유저의 모든 토큰을 블랙리스트 처리
+    """
+    return blacklist_outstanding_tokens('user', user_id)
+
+
+def revoke_token(jti: str) -> int:
+    """
+    토큰 하나(jti)를 블랙리스트 처리
+    """
+    return blacklist_outstanding_tokens('jti', jti)
+
+
+def revoke_tokens(jtis: list) -> int:
+    """
+    여러 토큰(jti 목록)을 쿼리 1회로 블랙리스트 처리, 쓰기 대기열(write_behind.defer)에서 모아 호출
+    """
+    return blacklist_outstanding_tokens('jti', jtis)
+
+
+def revoke_all_sessions(user_id: int) -> None:
+    """
+    detail:
+      - 유저의 토큰 세대(token_version)를 1 올려 발급된 모든 토큰을 무효화(UPDATE 1회)
+      - 블랙리스트 테이블에 행이 추가되지 않음
+      - update()는 post_save를 보내지 않으므로 인증 유저 캐시를 직접 무효화
+    """
+    User.objects\
+        .filter(pk=user_id)\
+        .update(token_version=F('token_version') + 1)
+    user_cache.invalidate(user_id)
\ No newline at end of file
@@ -0,0 +1,106 @@
+from typing import Dict, Optional
+
+from django.conf import settings
+
+from rest_framework_simplejwt.settings import api_settings
+
+from core.utils.kakao_cache import LocalProfileCache, MISSING
+from users.models           import User
+
+
+DEFAULTS = {
+    'ENABLED'    : True,
+    'TTL'        : 5,
+    'MAX_ENTRIES': 10000,
+}
+
+
+class AuthUser:
+    """
+    detail:
+      - JWT 인증(users.authentication)에서 request.user로 사용하는 유저 정보
+        > 인증/권한 확인에 필요한 필드만 포함(비밀번호 해시 등 제외)
+        > 모델 인스턴스가 아니므로 save() 등 ORM 기능은 없음, 필요하면 User.objects.get(pk=user.id)
+    """
+
+    __slots__ = ('id', 'is_active', 'is_admin', 'token_version')
+
+    FIELDS = __slots__
+
+    is_authenticated = True
+    is_anonymous     = False
+
+    def __init__(self, id: int, is_active: bool, is_admin: bool, token_version: int):
+        self.id            = id
+        self.is_active     = is_active
+        self.is_admin      = is_admin
+        self.token_version = token_version
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    @property
+    def is_staff(self) -> bool:
+        return self.is_admin
+
+    def __eq__(self, other):
+        return getattr(other, 'pk', None) == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f'<AuthUser {self.id}>'
+
+
+class UserCache:
+    """
+    detail:
+      - 유저 id -> AuthUser 워커(프로세스) 내부 TTL/LRU 캐시
+      - 캐시에 없으면 AuthUser.FIELDS 컬럼만 조회
+      - 같은 워커에서는 유저 변경 즉시 무효화(post_save/post_delete, revoke_all_sessions)
+        > 다른 워커의 캐시는 TTL 후 반영
+        > 요청한 토큰 세대가 캐시된 세대보다 높으면(다른 워커에서 로그인) 다시 조회
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config  = {**DEFAULTS, **(config or {})}
+        self.backend = LocalProfileCache(self.config) if self.config['ENABLED'] else None
+
+    @classmethod
+    def from_settings(cls) -> 'UserCache':
+        return cls(getattr(settings, 'AUTH_USER_CACHE', None))
+
+    def load(self, user_id) -> Optional[AuthUser]:
+        row = User.objects\
+                  .filter(**{api_settings.USER_ID_FIELD: user_id})\
+                  .values_list(*AuthUser.FIELDS)\
+                  .first()
+        return AuthUser(*row) if row else None
+
+    def get(self, user_id, min_version: int = 0) -> Optional[AuthUser]:
+        if self.backend is None:
+            return self.load(user_id)
+
+        user = self.backend.get(user_id)
+        if user is MISSING or user.token_version < min_version:
+            user = self.load(user_id)
+            if user is not None:
+                self.backend.set(user_id, user, self.config['TTL'])
+        return user
+
+    def invalidate(self, user_id) -> None:
+        if self.backend is not None:
+            self.backend.delete(user_id)
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+            self.backend.stats.reset()
+
+    def snapshot(self) -> Dict[str, int]:
+        return self.backend.stats.snapshot() if self.backend is not None else {}
+
+
+user_cache = UserCache.from_settings()
@@ -1,15 +1,22 @@
-from rest_framework.views            import APIView
-from rest_framework.permissions      import IsAuthenticated
-from rest_framework.response         import Response
-from rest_framework_simplejwt.tokens import OutstandingToken, BlacklistedToken, RefreshToken
+from rest_framework.views       import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response    import Response
+
+from rest_framework_simplejwt.tokens import BlacklistedToken
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg       import openapi
 
+from core.db.routers              import read_your_writes
+from core.db.write_behind         import write_behind
+from users.tokens                 import VersionedRefreshToken
+from users.utils.token_revocation import revoke_all_sessions, revoke_tokens
+
 
 class UserSignOutView(APIView):
     
     permission_classes = [IsAuthenticated]
+    query_budget       = 6
     
     post_params = openapi.Schema(
         type       = openapi.TYPE_OBJECT,
@@ -24,15 +31,19 @@ class UserSignOutView(APIView):
         user = request.user
         
         try:
-            refresh = RefreshToken(request.data['refresh_token'])
+            refresh = VersionedRefreshToken(request.data['refresh_token'])
         except:
             return Response({'detail': '유효하지 않거나 만료된 토큰입니다.'}, status=400)
         
         if not user.id == refresh['user_id']:
             return Response({'detail': '유저의 토큰정보가 유효하지 않습니다.'}, status=400)
         
-        for token in OutstandingToken.objects.filter(user_id=refresh['user_id']):
-            BlacklistedToken.objects\
-                            .get_or_create(token=token)
-            
+        """
+        모든 세션 로그아웃(토큰 세대 변경) 후 전달받은 refresh 토큰은 블랙리스트 처리
+        토큰 세대 변경으로 이미 모든 토큰이 거부되므로 블랙리스트 처리는 쓰기 대기열(write_behind)로 처리
+        """
+        revoke_all_sessions(user.id)
+        write_behind.defer(revoke_tokens, refresh['jti'], BlacklistedToken)
+        read_your_writes.pin(user.id)
+        
         return Response(status=204)
\ No newline at end of file
@@ -0,0 +1,54 @@
+from django.http import HttpResponse, HttpResponseNotAllowed
+
+from asgiref.sync import sync_to_async
+
+from core.renderers                 import FastJSONRenderer
+from core.utils.circuit_breaker     import CircuitOpen
+from core.utils.get_obj_n_check_err import GetKakaoAccount
+from users.utils.kakao_signin       import parse_kakao_account, sign_in_kakao_user
+
+
+renderer = FastJSONRenderer()
+
+
+def render(data: dict, status: int) -> HttpResponse:
+    """
+    KakaoSignInView(DRF Response)와 응답 바이트까지 동일하도록 같은 렌더러(FastJSONRenderer)로 렌더링
+    """
+    return HttpResponse(renderer.render(data), content_type='application/json', status=status)
+
+
+async def kakao_signin_async_view(request):
+    """
+    detail:
+      - ASGI 배포 시 사용하는 비동기 카카오 로그인 뷰
+        > Django 4.0은 클래스 기반 비동기 뷰를 지원하지 않으므로 함수형 뷰로 작성
+      - 카카오 API 응답을 기다리는 동안 워커(이벤트 루프)를 점유하지 않음
+      - 응답 형식(refresh/access)과 상태코드(200/201)는 KakaoSignInView와 동일
+        > 카카오 API 차단(CircuitOpen) 시 DRF 예외 처리와 같은 503 + Retry-After 응답
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    
+    kakao_token = request.headers.get('Authorization')
+    if not kakao_token:
+        return render({'detail': '유효하지 않거나 만료된 토큰입니다.'}, status=400)
+    
+    try:
+        kakao, err = await GetKakaoAccount.aget_kakao_user_account_n_check_err(kakao_token)
+    except CircuitOpen as e:
+        response = render({'detail': e.detail}, status=e.status_code)
+        response['Retry-After'] = str(e.wait)
+        return response
+    if err:
+        return render({'detail': err}, status=401)
+    
+    account, err = parse_kakao_account(kakao)
+    if err:
+        return render({'detail': err}, status=401)
+    
+    data, is_created = await sync_to_async(sign_in_kakao_user)(*account)
+    return render(data, status=201 if is_created else 200)
+
+
+kakao_signin_async_view.query_budget = 8
\ No newline at end of file
@@ -0,0 +1,14 @@
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from users.serializers import UserTokenRefreshSerializer
+
+
+class UserTokenRefreshView(TokenRefreshView):
+    """
+    detail:
+      - 블랙리스트 확인 시 블랙리스트 조회 인덱스를 사용하는 토큰 갱신 뷰
+      - 유저의 현재 토큰 세대(User.token_version)와 다른 토큰은 갱신 거부
+    """
+    
+    serializer_class = UserTokenRefreshSerializer
+    query_budget     = 3
\ No newline at end of file